@@ -1,29 +1,50 @@
+import atexit
 import os
 import random
 import sys
 import time
 from pathlib import Path
 
-from flask import Flask, Response, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, request, send_from_directory
 
 # Ensure repo root is on sys.path when running directly.
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.core.profiler import TickProfiler
 from game.simulations.world_state.server_contracts import (
-    CommandReplayCache,
+    command_cache_from_env,
+    parse_batch_payload,
     parse_command_payload,
+    parse_profile_capacity,
+    run_command_batch,
     serialize_command_result,
+    server_metrics,
+)
+from game.simulations.world_state.sessions import (
+    DEFAULT_SESSION_ID,
+    SESSION_COOKIE,
+    InvalidSessionId,
+    SessionPool,
+    coerce_seed,
+    resolve_session_id,
+)
+from game.simulations.world_state.snapshot_service import (
+    etag_matches,
+    snapshot_etag,
+    snapshot_service,
 )
 from game.simulations.world_state.terminal.processor import process_command
+from game.simulations.world_state.world_store import WorldStore
 
 APP_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 app = Flask(__name__, static_folder=None)
-state = GameState()
-command_cache = CommandReplayCache()
+sessions = SessionPool(store=WorldStore.from_env())
+# Store live sessions on shutdown so a restart picks them back up.
+atexit.register(sessions.close)
+command_cache = command_cache_from_env()
 
 BOOT_LINES = [
     "[ SYSTEM POWER: UNSTABLE ]",
@@ -69,6 +90,26 @@ def _stream_boot(delay):
     yield "event: done\ndata: complete\n\n"
 
 
+def _session_id(payload=None) -> str:
+    g.session_id = resolve_session_id(payload or {}, request.args, request.cookies)
+    return g.session_id
+
+
+@app.after_request
+def remember_session(response):
+    """Pin the resolved session id in a cookie so follow-up requests reuse it."""
+
+    session_id = g.get("session_id")
+    if session_id is not None and session_id != request.cookies.get(SESSION_COOKIE, DEFAULT_SESSION_ID):
+        response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="Lax")
+    return response
+
+
+@app.errorhandler(InvalidSessionId)
+def invalid_session(error):
+    return jsonify({"ok": False, "error": str(error)}), 400
+
+
 @app.route("/")
 def index():
     return send_from_directory(APP_ROOT, "index.html")
@@ -90,39 +131,112 @@ def command():
     """Execute a command from canonical request JSON."""
 
     payload = request.get_json(silent=True) or {}
-    global state
     raw, command_id = parse_command_payload(payload)
-    cached = command_cache.get(command_id)
-    if cached is not None:
-        return jsonify(cached)
-
-    seed = payload.get("seed")
-    if seed is not None and state.time == 0:
-        try:
-            state = GameState(seed=int(seed))
-        except (TypeError, ValueError):
-            pass
-
-    result = process_command(state, raw)
-    response = serialize_command_result(result)
-    command_cache.put(command_id, response)
+    session_id = _session_id(payload)
+    # Look up, run and record under the session lock, so concurrent retries
+    # of one command_id run it once.
+    with sessions.session(session_id, seed=coerce_seed(payload.get("seed"))) as state:
+        response = command_cache.get(session_id, command_id)
+        if response is None:
+            response = serialize_command_result(process_command(state, raw))
+            command_cache.put(session_id, command_id, response)
     return jsonify(response)
 
 
+@app.route("/commands", methods=["POST"])
+def commands():
+    """Execute an ordered batch of commands under one session lock."""
+
+    payload = request.get_json(silent=True) or {}
+    try:
+        batch, validate = parse_batch_payload(payload)
+    except ValueError as error:
+        return jsonify({"ok": False, "error": str(error)}), 400
+
+    session_id = _session_id(payload)
+    with sessions.session(session_id, seed=coerce_seed(payload.get("seed"))) as state:
+        results = run_command_batch(state, batch, command_cache, session_id=session_id, validate=validate)
+        revision = state.revision
+    return jsonify(
+        {
+            "ok": all(result["ok"] for result in results),
+            "revision": revision,
+            "results": results,
+        }
+    )
+
+
 @app.get("/snapshot")
 def snapshot():
     """Return a read-only world-state snapshot for UI projection."""
 
-    return jsonify(state.snapshot())
+    with sessions.session(_session_id()) as state:
+        cached = snapshot_service(state).current(state)
+    if etag_matches(request.headers.get("If-None-Match"), cached.etag):
+        return Response(status=304, headers={"ETag": cached.etag})
+    return Response(
+        cached.body,
+        mimetype="application/json",
+        headers={"ETag": cached.etag, "X-State-Revision": str(cached.revision)},
+    )
+
+
+@app.get("/snapshot/delta")
+def snapshot_delta():
+    """Return snapshot ops since ``?since=<revision>`` (full snapshot if unknown)."""
+
+    try:
+        since = int(request.args.get("since", ""))
+    except ValueError:
+        return jsonify({"ok": False, "error": "since=<revision> REQUIRED"}), 400
+    with sessions.session(_session_id()) as state:
+        etag = snapshot_etag(state)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status=304, headers={"ETag": etag})
+        delta = snapshot_service(state).delta(state, since)
+    response = jsonify(delta)
+    response.headers["ETag"] = etag
+    return response
+
+
+@app.get("/metrics")
+def metrics():
+    """Return replay-cache and session-pool counters."""
+
+    return jsonify(server_metrics(command_cache, sessions))
+
+
+@app.route("/profile", methods=["GET", "POST"])
+def profile():
+    """Return per-phase tick timings in dev mode; POST {"enabled": bool} toggles profiling."""
+
+    payload = request.get_json(silent=True) or {}
+    with sessions.session(_session_id(payload)) as state:
+        if not state.dev_mode:
+            return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
+        if request.method == "POST":
+            if payload.get("enabled", True):
+                if state.profiler is None or payload.get("reset"):
+                    try:
+                        capacity = parse_profile_capacity(payload)
+                    except ValueError as error:
+                        return jsonify({"ok": False, "error": str(error)}), 400
+                    state.profiler = TickProfiler(capacity)
+            else:
+                state.profiler = None
+        if state.profiler is None:
+            return jsonify({"ok": False, "error": "PROFILER DISABLED"}), 409
+        return jsonify({"ok": True, "profile": state.profiler.summary()})
 
 
 @app.get("/procgen_report")
 def procgen_report():
     """Return deterministic procgen instrumentation report in dev mode."""
 
-    if not state.dev_mode:
-        return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
-    return jsonify({"ok": True, "procgen_report": state.procgen_report()})
+    with sessions.session(_session_id()) as state:
+        if not state.dev_mode:
+            return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
+        return jsonify({"ok": True, "procgen_report": state.procgen_report()})
 
 
 if __name__ == "__main__":
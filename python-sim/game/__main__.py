@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 
 from game.simulations.world_state.core.simulation import sandbox_world
+from game.simulations.world_state.core.sweep import percentile_table, run_sweep
 from game.simulations.world_state.terminal.repl import run_repl
 
 
@@ -44,12 +45,17 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Run the world-state terminal REPL.",
     )
+    mode_group.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Run a headless Monte Carlo sweep across seeds.",
+    )
 
     parser.add_argument(
         "--ticks",
         type=int,
         default=300,
-        help="Number of ticks to run in sim mode.",
+        help="Number of ticks to run in sim mode (tick horizon in sweep mode).",
     )
     parser.add_argument(
         "--tick-delay",
@@ -57,6 +63,34 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=0.05,
         help="Delay between ticks in sim mode (seconds).",
     )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=100,
+        help="Number of seeds to run in sweep mode.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for sweep mode (default: CPU count).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("sweep_results.jsonl"),
+        help="JSONL file receiving per-run sweep summaries.",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Fast-forward sim mode without pacing sleeps or narrative stdout.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-phase tick timing table after sim mode.",
+    )
     parser.add_argument(
         "--dev",
         action="store_true",
@@ -66,7 +100,7 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         "--seed",
         type=int,
         default=None,
-        help="Deterministic RNG seed for world-state sessions.",
+        help="Deterministic RNG seed for world-state sessions (first seed in sweep mode).",
     )
 
     return parser.parse_args(argv)
@@ -79,13 +113,30 @@ def main(argv: list[str] | None = None) -> int:
         run_repl(seed=args.seed, dev_mode=args.dev)
         return 0
 
+    if args.sweep:
+        seed_start = args.seed if args.seed is not None else 0
+        summaries = run_sweep(
+            range(seed_start, seed_start + max(0, args.runs)),
+            max_ticks=args.ticks,
+            workers=args.workers,
+            output=args.output,
+        )
+        for line in percentile_table(summaries):
+            print(line)
+        return 0
+
     if args.sim:
-        sandbox_world(
+        state = sandbox_world(
             ticks=args.ticks,
             tick_delay=args.tick_delay,
             seed=args.seed,
             dev_mode=args.dev,
+            headless=args.headless,
+            profile=args.profile,
         )
+        if state.profiler is not None:
+            for line in state.profiler.summary_lines():
+                print(line)
         return 0
 
     _run_ui()
@@ -1,18 +1,24 @@
 """Procedural generation utilities."""
 
 from .engine import (
+    CompiledSymbol,
     GrammarBank,
     GrammarEngine,
+    TemplateToken,
     VariantMemory,
+    compile_template,
     load_grammar_bank,
     mix_seed64,
     stable_hash64,
 )
 
 __all__ = [
+    "CompiledSymbol",
     "GrammarBank",
     "GrammarEngine",
+    "TemplateToken",
     "VariantMemory",
+    "compile_template",
     "load_grammar_bank",
     "mix_seed64",
     "stable_hash64",
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import hashlib
+from itertools import accumulate
 import json
 from pathlib import Path
 import random
 import re
-from typing import Any
+from typing import Any, Union
 
 
 TOKEN_RE = re.compile(r"#([^#]+)#")
+SEED_CACHE_SIZE = 4096
 
 
 def stable_hash64(text: str) -> int:
@@ -25,6 +29,11 @@ def mix_seed64(*parts: Any) -> int:
     return stable_hash64(joined)
 
 
+@lru_cache(maxsize=SEED_CACHE_SIZE, typed=True)
+def _render_seed(seed: Any, symbol: str, salt: str) -> int:
+    return mix_seed64(seed, symbol, salt)
+
+
 def _apply_modifier(text: str, modifier: str) -> str:
     mod = modifier.strip().lower()
     if not mod:
@@ -80,11 +89,75 @@ class VariantMemory:
             return False
         return candidate_text in history
 
+    def recent(self, key: str) -> deque[str] | tuple[()]:
+        """Return the recent texts for ``key`` (at most ``max_recent``)."""
+        return self._recent.get(key) or ()
+
+
+@dataclass(frozen=True)
+class TemplateToken:
+    """A ``#symbol.modifier#`` reference inside a variant template."""
+
+    symbol: str
+    modifiers: tuple[str, ...] = ()
+
+
+Segment = Union[str, TemplateToken]
+
+
+def compile_template(text: str) -> tuple[Segment, ...]:
+    """Split ``text`` into literal strings and ``TemplateToken`` references.
+
+    Blank tokens such as ``# #`` expand to nothing, as they always have, so
+    they are dropped along with empty literals.
+    """
+    segments: list[Segment] = []
+    position = 0
+    for match in TOKEN_RE.finditer(text):
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+        position = match.end()
+        token = match.group(1).strip()
+        if token:
+            base, *modifiers = token.split(".")
+            segments.append(TemplateToken(symbol=base, modifiers=tuple(modifiers)))
+    if position < len(text):
+        segments.append(text[position:])
+    return tuple(segments)
+
+
+@dataclass(frozen=True)
+class CompiledSymbol:
+    """Variants of one symbol with pre-tokenized templates and weight table.
+
+    ``cumulative`` is None when a weight is negative, because the running
+    total is then not sorted and selection falls back to a linear walk.
+    """
+
+    variants: tuple[Variant, ...]
+    templates: tuple[tuple[Segment, ...], ...]
+    cumulative: tuple[int, ...] | None
+
+    @staticmethod
+    def build(variants: list[Variant]) -> "CompiledSymbol":
+        weights = [variant.weight for variant in variants]
+        cumulative = tuple(accumulate(weights)) if min(weights, default=0) >= 0 else None
+        return CompiledSymbol(
+            variants=tuple(variants),
+            templates=tuple(compile_template(variant.text) for variant in variants),
+            cumulative=cumulative,
+        )
+
 
 @dataclass(frozen=True)
 class GrammarBank:
     version: int
     symbols: dict[str, list[Variant]]
+    compiled: dict[str, CompiledSymbol] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        compiled = {key: CompiledSymbol.build(values) for key, values in self.symbols.items() if values}
+        object.__setattr__(self, "compiled", compiled)
 
     def variants_for(self, symbol: str) -> list[Variant]:
         return self.symbols.get(symbol, [])
@@ -105,36 +178,57 @@ def load_grammar_bank(path: Path) -> GrammarBank:
 
 
 class GrammarEngine:
-    """Deterministic grammar expander with weighted variant selection."""
+    """Deterministic grammar expander with weighted variant selection.
+
+    Expansion walks the bank's pre-tokenized templates and picks variants from
+    cumulative weight tables. Text only goes through ``TOKEN_RE`` again when a
+    substituted value itself contains ``#``.
+    """
 
     def __init__(self, bank: GrammarBank, *, max_depth: int = 12):
         self.bank = bank
         self.max_depth = max(1, int(max_depth))
 
     @staticmethod
-    def _weighted_choice(variants: list[Variant], rng: random.Random) -> Variant:
-        total = sum(variant.weight for variant in variants)
-        pick = rng.randint(1, max(1, total))
+    def _weighted_index(weights: list[int], rng: random.Random) -> int:
+        pick = rng.randint(1, max(1, sum(weights)))
         running = 0
-        for variant in variants:
-            running += variant.weight
+        for index, weight in enumerate(weights):
+            running += weight
             if pick <= running:
-                return variant
-        return variants[-1]
+                return index
+        return len(weights) - 1
 
-    def _choose_variant(
+    def _choose_index(
         self,
         symbol: str,
-        variants: list[Variant],
-        rng: random.Random,
+        compiled: CompiledSymbol,
         memory: VariantMemory | None,
-    ) -> Variant | None:
-        if not variants:
-            return None
-        if len(variants) == 1 or memory is None:
-            return self._weighted_choice(variants, rng)
-        non_recent = [value for value in variants if not memory.is_recent(symbol, value.text)]
-        return self._weighted_choice(non_recent or variants, rng)
+        seed: int,
+        salt: str,
+    ) -> int:
+        # Each render draws from a fresh RNG exactly once, so a single
+        # candidate needs no RNG at all. Seeding one costs far more than the
+        # rest of the choice.
+        variants = compiled.variants
+        if len(variants) == 1:
+            return 0
+        if memory is not None:
+            recent = memory.recent(symbol)
+            if recent:
+                allowed = [index for index, value in enumerate(variants) if value.text not in recent]
+                if len(allowed) == 1:
+                    return allowed[0]
+                if allowed and len(allowed) < len(variants):
+                    weights = [variants[index].weight for index in allowed]
+                    rng = random.Random(_render_seed(seed, symbol, salt))
+                    return allowed[self._weighted_index(weights, rng)]
+        rng = random.Random(_render_seed(seed, symbol, salt))
+        cumulative = compiled.cumulative
+        if cumulative is None:
+            return self._weighted_index([variant.weight for variant in variants], rng)
+        pick = rng.randint(1, max(1, cumulative[-1]))
+        return min(bisect_left(cumulative, pick), len(variants) - 1)
 
     def render(
         self,
@@ -145,19 +239,47 @@ class GrammarEngine:
         salt: str = "",
         memory: VariantMemory | None = None,
     ) -> str:
-        rng = random.Random(mix_seed64(seed, symbol, salt))
-        variant = self._choose_variant(symbol, self.bank.variants_for(symbol), rng, memory)
-        if variant is None:
+        return self._render(symbol, dict(context or {}), seed, salt, memory)
+
+    def _render(
+        self,
+        symbol: str,
+        context: dict[str, str],
+        seed: int,
+        salt: str,
+        memory: VariantMemory | None,
+    ) -> str:
+        compiled = self.bank.compiled.get(symbol)
+        if compiled is None:
             return ""
+        index = self._choose_index(symbol, compiled, memory, seed, salt)
         if memory is not None:
-            memory.record(symbol, variant.text)
+            memory.record(symbol, compiled.variants[index].text)
+        parts: list[str] = []
+        for segment in compiled.templates[index]:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            base = segment.symbol
+            if base in context:
+                output = context[base]
+            else:
+                output = self._render(base, context, seed, f"{salt}|{base}|d0", memory)
+            for modifier in segment.modifiers:
+                output = _apply_modifier(output, modifier)
+            parts.append(output)
+        expanded = "".join(parts)
+        if "#" not in expanded:
+            return expanded
+        # Substituted text (a context value, or output cut off at max_depth)
+        # still holds tokens, so finish with the textual re-expansion.
         return self._expand_text(
-            variant.text,
-            context=dict(context or {}),
+            expanded,
+            context=context,
             seed=seed,
             salt=salt,
             memory=memory,
-            depth=0,
+            depth=1,
         )
 
     def _expand_text(
@@ -1,8 +1,34 @@
 from .autopilot import run_autopilot
 from .morale import should_retreat
+from .events import FleeEvent, RosterEvent
+from .narration import current_sink, narrate
 
 
-def resolve_assault(sectors, assault_instance=None, max_ticks=10, on_tick=None):
+def defense_settings(sector_name, assault_instance=None):
+    """Return ``(doctrine, bias)`` for autopilot in ``sector_name``."""
+    if assault_instance is None:
+        return "BALANCED", 1.0
+    doctrine = getattr(assault_instance, "defense_doctrine", "BALANCED")
+    allocation = getattr(assault_instance, "defense_allocation", None) or {}
+    if sector_name == "COMMAND":
+        group = "COMMAND"
+    elif sector_name in {"POWER", "FABRICATION"}:
+        group = "POWER"
+    elif sector_name == "COMMS":
+        group = "SENSORS"
+    else:
+        group = "PERIMETER"
+    return doctrine, float(allocation.get(group, 1.0))
+
+
+def resolve_assault(sectors, assault_instance=None, max_ticks=10, on_tick=None, narrate_roster=True):
+    """Run the tactical assault over ``sectors`` and return its summary.
+
+    ``narrate_roster=False`` skips the per-tick roster listing, the only
+    narration that grows with roster size. For very large rosters callers
+    can opt into ``columns.resolve_assault_columnar`` instead.
+    """
+
     duration = max_ticks
     if assault_instance is not None:
         duration = getattr(assault_instance, "duration_ticks", max_ticks)
@@ -18,33 +44,21 @@ def resolve_assault(sectors, assault_instance=None, max_ticks=10, on_tick=None):
     sector_lookup = {sector.name: sector for sector in sectors}
 
     for tick in range(duration):
-        print(f"\n--- TICK {tick} ---")
+        narrate(f"\n--- TICK {tick} ---")
 
         if assault_instance is not None:
             spawned = assault_instance.spawn_at_tick(tick, sector_lookup)
             summary["spawned"] += spawned
 
-        for sector in sectors:
-            print(f"Sector: {sector.name}")
-            for e in sector.enemies:
-                status = "ALIVE" if e.alive else "DEAD"
-                print(f" - {e.name}: HP={e.hp}, Morale={e.morale} [{status}]")
+        sink = current_sink()
+        if narrate_roster and sink.enabled:
+            for sector in sectors:
+                narrate(f"Sector: {sector.name}")
+                for e in sector.enemies:
+                    sink.emit(RosterEvent(e.name, e.hp, e.morale, e.alive))
 
         for sector in sectors:
-            doctrine = "BALANCED"
-            bias = 1.0
-            if assault_instance is not None:
-                doctrine = getattr(assault_instance, "defense_doctrine", doctrine)
-                allocation = getattr(assault_instance, "defense_allocation", None) or {}
-                if sector.name == "COMMAND":
-                    group = "COMMAND"
-                elif sector.name in {"POWER", "FABRICATION"}:
-                    group = "POWER"
-                elif sector.name == "COMMS":
-                    group = "SENSORS"
-                else:
-                    group = "PERIMETER"
-                bias = float(allocation.get(group, 1.0))
+            doctrine, bias = defense_settings(sector.name, assault_instance)
             run_autopilot(sector, doctrine=doctrine, defense_bias=bias)
 
         for sector in sectors:
@@ -55,7 +69,8 @@ def resolve_assault(sectors, assault_instance=None, max_ticks=10, on_tick=None):
                     continue
                 if should_retreat(e):
                     summary["retreated"] += 1
-                    print(f"{e.name} flees from {sector.name}")
+                    if sink.enabled:
+                        sink.emit(FleeEvent(e.name, sector.name))
                     sector.enemies.remove(e)
 
         if on_tick is not None:
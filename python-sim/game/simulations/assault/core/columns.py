@@ -0,0 +1,338 @@
+"""Struct-of-arrays tactical engine.
+
+``resolve_assault_columnar`` runs the same rules as ``resolve_assault`` and
+returns the same summary, but keeps each sector's roster as parallel columns
+(names, hp, morale, alive flags) instead of reading ``Enemy`` attributes:
+
+* the first live target is a cursor, not a scan from the front;
+* ``has_hostiles`` is a live counter;
+* the end-of-tick kill/retreat sweep only visits entries that were hit or
+  spawned since the last sweep (everything else is alive with morale above
+  the retreat line), and removals from the front advance a head offset
+  instead of calling ``list.remove``.
+
+hp and morale stay Python numbers in plain lists rather than ``array('d')``
+so narration text and arithmetic match the object engine exactly. The source
+``Enemy`` objects ride along in their own column and get the final values
+written back, so callers keep the objects they passed in.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from .assault import defense_settings
+from .autopilot import output_multiplier
+from .entities import Enemy
+from .events import DamageEvent, FleeEvent, KillEvent, RosterEvent, ShotEvent
+from .narration import current_sink, narrate
+
+RETREAT_MORALE = 10
+
+
+class EnemyView:
+    """Live handle on one roster entry, shaped like ``Enemy``.
+
+    Reads and writes go straight to the columns. A view is valid until the
+    next ``sweep``, which may compact the roster and move entries.
+    """
+
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns: "EnemyColumns", index: int):
+        self.columns = columns
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.columns.names[self.index]
+
+    @property
+    def type(self):
+        return self.columns.enemies[self.index].type
+
+    @property
+    def sector(self):
+        return self.columns.enemies[self.index].sector
+
+    @property
+    def hp(self) -> float:
+        return self.columns.hp[self.index]
+
+    @hp.setter
+    def hp(self, value: float) -> None:
+        self.columns.hp[self.index] = value
+        self.columns.touch(self.index)
+
+    @property
+    def morale(self) -> float:
+        return self.columns.morale[self.index]
+
+    @morale.setter
+    def morale(self, value: float) -> None:
+        self.columns.morale[self.index] = value
+        self.columns.touch(self.index)
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.columns.alive[self.index])
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        self.columns.set_alive(self.index, value)
+
+    def take_damage(self, dmg: float) -> None:
+        self.columns.take_damage(self.index, dmg)
+
+
+class EnemyColumns:
+    """Roster of one sector stored column-wise, in spawn order.
+
+    Live entries are ``[head, len(names))``; ``append`` accepts ``Enemy``
+    objects so ``AssaultInstance.spawn_at_tick`` can fill it directly.
+    Iterating yields ``EnemyView`` handles, so writes made through them (for
+    example from an ``on_tick`` callback) land in the columns.
+    """
+
+    def __init__(self, sector_name: str):
+        self.sector_name = sector_name
+        self.enemies: list[Enemy] = []
+        self.names: list[str] = []
+        self.hp: list[float] = []
+        self.morale: list[float] = []
+        self.alive = bytearray()
+        self.head = 0
+        self.alive_count = 0
+        self.cursor = 0  # no live entry before this index
+        self.hit_end = 0  # entries in [head, hit_end) were shot this tick
+        self.swept_end = 0  # entries past this were added since the last sweep
+
+    def __len__(self) -> int:
+        return len(self.names) - self.head
+
+    def __iter__(self):
+        return (EnemyView(self, index) for index in range(self.head, len(self.names)))
+
+    def append(self, enemy: Enemy) -> None:
+        self.enemies.append(enemy)
+        self.names.append(enemy.name)
+        self.hp.append(enemy.hp)
+        self.morale.append(enemy.morale)
+        self.alive.append(1 if enemy.alive else 0)
+        if enemy.alive:
+            self.alive_count += 1
+
+    def extend(self, enemies) -> None:
+        enemies = list(enemies)
+        self.enemies.extend(enemies)
+        self.names.extend([enemy.name for enemy in enemies])
+        self.hp.extend([enemy.hp for enemy in enemies])
+        self.morale.extend([enemy.morale for enemy in enemies])
+        flags = bytes(1 if enemy.alive else 0 for enemy in enemies)
+        self.alive.extend(flags)
+        self.alive_count += sum(flags)
+
+    def touch(self, index: int) -> None:
+        """Make the next sweep re-check ``index`` after an outside write."""
+
+        self.hit_end = max(self.hit_end, index + 1)
+
+    def set_alive(self, index: int, value: bool) -> None:
+        flag = 1 if value else 0
+        if self.alive[index] != flag:
+            self.alive[index] = flag
+            self.alive_count += 1 if flag else -1
+            if flag:
+                self.cursor = min(self.cursor, index)
+        self.touch(index)
+
+    def first_alive(self) -> int | None:
+        alive = self.alive
+        index = max(self.cursor, self.head)
+        end = len(alive)
+        while index < end and not alive[index]:
+            index += 1
+        self.cursor = index
+        return index if index < end else None
+
+    def take_damage(self, index: int, dmg: float) -> None:
+        self.hp[index] -= dmg
+        self.morale[index] -= dmg * 0.5
+        sink = current_sink()
+        if sink.enabled:
+            sink.emit(DamageEvent(self.names[index], dmg, self.hp[index], self.morale[index]))
+        if self.hp[index] <= 0:
+            self.alive[index] = 0
+            self.alive_count -= 1
+            if sink.enabled:
+                sink.emit(KillEvent(self.names[index]))
+        self.hit_end = max(self.hit_end, index + 1)
+
+    def sweep(self, summary: dict) -> None:
+        """Drop dead and retreating entries, counting them into ``summary``.
+
+        Dropped entries write their final values into their ``Enemy``; a
+        retreating enemy stays ``alive``, as in the object engine.
+        """
+
+        names, alive, morale, hp, enemies = self.names, self.alive, self.morale, self.hp, self.enemies
+        end = len(names)
+        hit_end = max(self.hit_end, self.head)
+        removed: list[int] = []
+        sink = current_sink()
+        for index in chain(range(self.head, hit_end), range(max(hit_end, self.swept_end), end)):
+            if not alive[index]:
+                summary["killed"] += 1
+                fled = False
+            elif morale[index] <= RETREAT_MORALE:
+                summary["retreated"] += 1
+                if sink.enabled:
+                    sink.emit(FleeEvent(names[index], self.sector_name))
+                alive[index] = 0
+                self.alive_count -= 1
+                fled = True
+            else:
+                continue
+            removed.append(index)
+            enemy = enemies[index]
+            enemy.hp = hp[index]
+            enemy.morale = morale[index]
+            enemy.alive = fled
+        if removed and removed[-1] - removed[0] == len(removed) - 1 and removed[0] == self.head:
+            self.head += len(removed)
+            if self.head * 2 > end:
+                self._keep(range(self.head, end))
+        elif removed:
+            drop = set(removed)
+            self._keep([index for index in range(self.head, end) if index not in drop])
+        self.cursor = self.hit_end = self.head
+        self.swept_end = len(self.names)
+
+    def _keep(self, indices) -> None:
+        indices = list(indices)
+        self.enemies = [self.enemies[index] for index in indices]
+        self.names = [self.names[index] for index in indices]
+        self.hp = [self.hp[index] for index in indices]
+        self.morale = [self.morale[index] for index in indices]
+        self.alive = bytearray(self.alive[index] for index in indices)
+        self.head = 0
+
+    def to_enemies(self, sector=None) -> list[Enemy]:
+        """Write the columns back into the live ``Enemy`` objects and return them."""
+
+        head = self.head
+        enemies = self.enemies[head:]
+        for enemy, hp, morale, alive in zip(enemies, self.hp[head:], self.morale[head:], self.alive[head:]):
+            enemy.hp = hp
+            enemy.morale = morale
+            enemy.alive = bool(alive)
+            if sector is not None:
+                enemy.sector = sector
+        return enemies
+
+
+class ColumnarSector:
+    """``Sector`` stand-in whose ``enemies`` is an ``EnemyColumns``."""
+
+    def __init__(self, sector):
+        self.source = sector
+        self.name = sector.name
+        self.type = sector.type
+        self.defenses = sector.defenses
+        self.enemies = EnemyColumns(sector.name)
+        self.enemies.extend(sector.enemies)
+
+    def has_hostiles(self) -> bool:
+        return self.enemies.alive_count > 0
+
+
+def _fire(turret, columns: EnemyColumns, output_mult: float) -> None:
+    # Turret.activate with effective_output scaled for this volley.
+    effective_output = turret.effective_output * output_mult
+    if effective_output <= 0.0:
+        return
+    if turret.cooldown > 0.0:
+        turret.cooldown = max(0.0, turret.cooldown - 1.0)
+        return
+    if effective_output < 0.2:
+        turret.cooldown = turret.base_fire_interval
+        return
+    target = columns.first_alive()
+    if target is None:
+        return
+    shot_damage = turret.damage * effective_output
+    sink = current_sink()
+    if sink.enabled:
+        sink.emit(ShotEvent(columns.names[target], shot_damage))
+    columns.take_damage(target, shot_damage)
+    turret.cooldown = turret.base_fire_interval / effective_output
+
+
+def _run_autopilot(sector: ColumnarSector, doctrine: str, defense_bias: float) -> None:
+    if not sector.has_hostiles():
+        return
+    output_mult = output_multiplier(doctrine, defense_bias)
+    for defense in sector.defenses:
+        _fire(defense, sector.enemies, output_mult)
+
+
+def resolve_assault_columnar(sectors, assault_instance=None, max_ticks=10, on_tick=None, narrate_roster=True):
+    """Opt-in alternative to ``resolve_assault`` over column-wise rosters.
+
+    Same summary, narration and final ``Enemy`` values as ``resolve_assault``,
+    but only worth it for rosters in the thousands (see
+    tools/bench_tactical_columns.py). ``sectors`` are ordinary ``Sector``
+    objects whose ``enemies`` lists are only brought up to date on return, so
+    ``on_tick`` receives the ``ColumnarSector`` views instead; their rosters
+    iterate as writable ``EnemyView`` handles. ``narrate_roster=False`` skips
+    the per-tick roster listing, the only narration that grows with roster
+    size.
+    """
+
+    duration = max_ticks
+    if assault_instance is not None:
+        duration = getattr(assault_instance, "duration_ticks", max_ticks)
+
+    summary = {
+        "duration": duration,
+        "spawned": 0,
+        "killed": 0,
+        "retreated": 0,
+        "remaining": 0,
+    }
+
+    columnar = [ColumnarSector(sector) for sector in sectors]
+    sector_lookup = {sector.name: sector for sector in columnar}
+
+    for tick in range(duration):
+        narrate(f"\n--- TICK {tick} ---")
+
+        if assault_instance is not None:
+            spawned = assault_instance.spawn_at_tick(tick, sector_lookup)
+            summary["spawned"] += spawned
+
+        sink = current_sink()
+        if narrate_roster and sink.enabled:
+            for sector in columnar:
+                narrate(f"Sector: {sector.name}")
+                columns = sector.enemies
+                head = columns.head
+                for name, hp, morale, alive in zip(
+                    columns.names[head:], columns.hp[head:], columns.morale[head:], columns.alive[head:]
+                ):
+                    sink.emit(RosterEvent(name, hp, morale, bool(alive)))
+
+        for sector in columnar:
+            doctrine, bias = defense_settings(sector.name, assault_instance)
+            _run_autopilot(sector, doctrine, bias)
+
+        for sector in columnar:
+            sector.enemies.sweep(summary)
+
+        if on_tick is not None:
+            on_tick(columnar, tick)
+
+    for sector in columnar:
+        sector.source.enemies[:] = sector.enemies.to_enemies(sector.source)
+    summary["remaining"] = sum(len(sector.enemies) for sector in columnar)
+    return summary
@@ -1,3 +1,7 @@
+from .events import ShotEvent
+from .narration import current_sink
+
+
 class Turret:
     def __init__(self, damage, effective_output=1.0):
         self.damage = damage
@@ -18,7 +22,9 @@ class Turret:
         shot_damage = self.damage * self.effective_output
         for e in enemies:
             if e.alive:
-                print(f"Turret fires at {e.name} for {shot_damage:.2f} damage")
+                sink = current_sink()
+                if sink.enabled:
+                    sink.emit(ShotEvent(e.name, shot_damage))
                 e.take_damage(shot_damage)
                 self.cooldown = self.base_fire_interval / self.effective_output
                 break  # first-come-first-served
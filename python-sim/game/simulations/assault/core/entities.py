@@ -1,3 +1,7 @@
+from .events import DamageEvent, KillEvent
+from .narration import current_sink
+
+
 class Enemy:
     def __init__(self, name, enemy_type, hp, morale, sector):
         self.name = name
@@ -10,7 +14,10 @@ class Enemy:
     def take_damage(self, dmg):
         self.hp -= dmg
         self.morale -= dmg * 0.5
-        print(f"{self.name} takes {dmg} damage (HP={self.hp}, Morale={self.morale})")
+        sink = current_sink()
+        if sink.enabled:
+            sink.emit(DamageEvent(self.name, dmg, self.hp, self.morale))
         if self.hp <= 0:
             self.alive = False
-            print(f"{self.name} is killed")
+            if sink.enabled:
+                sink.emit(KillEvent(self.name))
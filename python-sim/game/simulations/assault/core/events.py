@@ -0,0 +1,184 @@
+"""Typed tactical combat events and the sinks that receive them.
+
+Entities emit events (plain named tuples) rather than text. Nothing is
+formatted until a sink asks for ``event.text()``, and disabled sinks
+(``NullSink``) are checked before an event is even built, so headless
+assaults pay nothing for narration.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+import json
+from pathlib import Path
+from typing import IO, NamedTuple, Protocol
+
+
+COMBAT_LOG_CAPACITY = 256
+COMBAT_KINDS = frozenset({"shot", "damage", "kill", "flee"})
+
+
+class ShotEvent(NamedTuple):
+    target: str
+    damage: float
+    kind: str = "shot"
+
+    def text(self) -> str:
+        return f"Turret fires at {self.target} for {self.damage:.2f} damage"
+
+
+class DamageEvent(NamedTuple):
+    target: str
+    damage: float
+    hp: float
+    morale: float
+    kind: str = "damage"
+
+    def text(self) -> str:
+        return f"{self.target} takes {self.damage} damage (HP={self.hp}, Morale={self.morale})"
+
+
+class KillEvent(NamedTuple):
+    target: str
+    kind: str = "kill"
+
+    def text(self) -> str:
+        return f"{self.target} is killed"
+
+
+class FleeEvent(NamedTuple):
+    target: str
+    sector: str
+    kind: str = "flee"
+
+    def text(self) -> str:
+        return f"{self.target} flees from {self.sector}"
+
+
+class RosterEvent(NamedTuple):
+    """One line of the per-tick roster listing."""
+
+    name: str
+    hp: float
+    morale: float
+    alive: bool
+    kind: str = "roster"
+
+    def text(self) -> str:
+        status = "ALIVE" if self.alive else "DEAD"
+        return f" - {self.name}: HP={self.hp}, Morale={self.morale} [{status}]"
+
+
+class TextEvent(NamedTuple):
+    """Free-form narration such as tick and sector headers."""
+
+    message: str
+    kind: str = "text"
+
+    def text(self) -> str:
+        return self.message
+
+
+class CombatEvent(Protocol):
+    kind: str
+
+    def text(self) -> str: ...
+
+    def _asdict(self) -> dict: ...
+
+
+class CombatSink(Protocol):
+    enabled: bool
+
+    def emit(self, event: CombatEvent) -> None: ...
+
+
+class NullSink:
+    """Discards everything; emitters skip building events for it."""
+
+    enabled = False
+
+    def emit(self, event: CombatEvent) -> None:
+        return None
+
+
+class ConsoleSink:
+    """Prints each event's text, the tactical layer's standalone default."""
+
+    enabled = True
+
+    def emit(self, event: CombatEvent) -> None:
+        print(event.text())
+
+
+class WriterSink:
+    """Passes each event's text to a ``writer(str)`` callable."""
+
+    enabled = True
+
+    def __init__(self, writer: Callable[[str], None]):
+        self.writer = writer
+
+    def emit(self, event: CombatEvent) -> None:
+        self.writer(event.text())
+
+
+class TeeSink:
+    """Forwards each event to every sink in ``sinks``."""
+
+    enabled = True
+
+    def __init__(self, *sinks: CombatSink):
+        self.sinks = sinks
+
+    def emit(self, event: CombatEvent) -> None:
+        for sink in self.sinks:
+            sink.emit(event)
+
+
+class RingSink:
+    """Keeps the most recent events unformatted, optionally by ``kind``."""
+
+    enabled = True
+
+    def __init__(self, capacity: int = COMBAT_LOG_CAPACITY, kinds: Iterable[str] | None = None):
+        self.events: deque[CombatEvent] = deque(maxlen=max(1, int(capacity)))
+        self.kinds = frozenset(kinds) if kinds is not None else None
+
+    def emit(self, event: CombatEvent) -> None:
+        if self.kinds is None or event.kind in self.kinds:
+            self.events.append(event)
+
+    def drain(self) -> list[CombatEvent]:
+        drained = list(self.events)
+        self.events.clear()
+        return drained
+
+    def lines(self) -> list[str]:
+        return [event.text() for event in self.events]
+
+
+class JsonlSink:
+    """Appends one JSON object per event to a stream or file."""
+
+    enabled = True
+
+    def __init__(self, target: str | Path | IO[str]):
+        if isinstance(target, (str, Path)):
+            self._stream = Path(target).open("a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+
+    def emit(self, event: CombatEvent) -> None:
+        self._stream.write(json.dumps(event._asdict(), separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        if self._owned:
+            self._stream.close()
+
+
+NULL_SINK = NullSink()
+CONSOLE_SINK = ConsoleSink()
@@ -0,0 +1,48 @@
+"""Narrative output hook for the tactical layer.
+
+Tactical entities report shots, damage, kills and retreats as typed events
+(see ``events``) to the sink installed for the current context. By default
+that is ``CONSOLE_SINK``, which prints the legacy text lines; world-state
+callers install a ``NullSink``, a ring buffer or a writer for the duration of
+a resolve step.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+
+from .events import CONSOLE_SINK, CombatSink, TextEvent, WriterSink
+
+NarrationWriter = Callable[[str], None]
+
+_sink: ContextVar[CombatSink | None] = ContextVar("tactical_narration", default=None)
+
+
+def current_sink() -> CombatSink:
+    sink = _sink.get()
+    return CONSOLE_SINK if sink is None else sink
+
+
+def narrate(text: str) -> None:
+    sink = current_sink()
+    if sink.enabled:
+        sink.emit(TextEvent(text))
+
+
+@contextmanager
+def use_sink(sink: CombatSink | None) -> Iterator[None]:
+    """Route tactical events to ``sink`` (``None`` restores the console)."""
+
+    token = _sink.set(sink)
+    try:
+        yield
+    finally:
+        _sink.reset(token)
+
+
+def redirect_narration(writer: NarrationWriter | None) -> AbstractContextManager[None]:
+    """Route tactical narration text to ``writer`` (``None`` restores stdout)."""
+
+    return use_sink(None if writer is None else WriterSink(writer))
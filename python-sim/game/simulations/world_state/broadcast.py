@@ -0,0 +1,250 @@
+"""In-process tick broadcaster fanning one session's ticks out to many viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+import json
+import queue
+import threading
+from typing import Any
+
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.sessions import SessionPool
+
+
+BROADCAST_QUEUE_SIZE = 256
+BROADCAST_HISTORY_LIMIT = 2000
+BROADCAST_SNAPSHOT_INTERVAL = 25
+SSE_HEARTBEAT_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class TickMessage:
+    """One broadcast tick: narrative lines plus a structured delta.
+
+    ``sse`` is rendered once at publish time and shared by every subscriber.
+    Plain ``data:`` lines keep the legacy line-oriented viewer working; the
+    ``tick`` event carries the JSON delta for structured clients.
+    """
+
+    tick: int
+    lines: tuple[str, ...]
+    delta: dict[str, Any]
+    sse: str
+
+
+def _render_sse(lines: tuple[str, ...], delta: dict[str, Any]) -> str:
+    parts = [f"data: {line}\n\n" for line in lines]
+    parts.append(f"event: tick\ndata: {json.dumps(delta, separators=(',', ':'))}\n\n")
+    return "".join(parts)
+
+
+class Subscriber:
+    """Bounded per-viewer queue; a full queue marks the viewer as dropped."""
+
+    def __init__(self, maxsize: int = BROADCAST_QUEUE_SIZE):
+        self.queue: queue.Queue[TickMessage] = queue.Queue(maxsize=max(1, int(maxsize)))
+        self.dropped = False
+        self.reason = ""
+
+    def drop(self, reason: str) -> None:
+        self.reason = reason
+        self.dropped = True
+
+    def offer(self, message: TickMessage) -> bool:
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self.drop("viewer fell behind")
+            return False
+        return True
+
+    def get(self, timeout: float | None = None) -> TickMessage | None:
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def messages(self, timeout: float = SSE_HEARTBEAT_SECONDS) -> AsyncIterator[TickMessage | None]:
+        """Async view of the queue for asyncio transports; yields None on idle timeouts."""
+
+        while not self.dropped:
+            yield await asyncio.to_thread(self.get, timeout)
+
+
+class TickBroadcaster:
+    """Steps one pooled session once per tick and publishes to all subscribers.
+
+    The run thread only lives while there are subscribers; if a step raises,
+    every subscriber is dropped and the next ``subscribe`` starts a fresh
+    thread. Publishing never blocks: a subscriber whose queue is full is
+    dropped instead of slowing the simulation or the other viewers.
+
+    Tick deltas only carry sectors that changed, so each new subscriber is
+    first sent a baseline message with every sector's current row. Steps
+    publish while holding the session lock, so no tick falls between a
+    subscriber's baseline and its first delta.
+    """
+
+    def __init__(
+        self,
+        pool: SessionPool,
+        session_id: str,
+        *,
+        tick_delay: float = 0.2,
+        queue_size: int = BROADCAST_QUEUE_SIZE,
+        history_limit: int = BROADCAST_HISTORY_LIMIT,
+    ):
+        self.pool = pool
+        self.session_id = session_id
+        self.tick_delay = float(tick_delay)
+        self.queue_size = int(queue_size)
+        self.history: deque[str] = deque(maxlen=max(1, int(history_limit)))
+        self.dropped = 0
+        self._subscribers: list[Subscriber] = []
+        self._lock = threading.Lock()
+        self._paused = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._sectors: dict[str, tuple] = {}
+
+    @property
+    def paused(self) -> bool:
+        return self._paused.is_set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.queue_size)
+        with self.pool.session(self.session_id) as state:
+            subscriber.offer(self._baseline(state))
+            with self._lock:
+                self._subscribers.append(subscriber)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tick-broadcaster", daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+        self._wake.set()
+
+    def pause(self) -> None:
+        self._paused.set()
+
+    def resume(self) -> None:
+        self._paused.clear()
+        self._wake.set()
+
+    def publish(self, message: TickMessage) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if not subscriber.offer(message):
+                self.unsubscribe(subscriber)
+                self.dropped += 1
+
+    def step(self) -> TickMessage:
+        """Advance the session one tick, publish the delta and return it."""
+
+        with self.pool.session(self.session_id) as state:
+            before = state.time
+            # Narrate into a child clock and keep its lines, so records that
+            # belong to /command calls stay on the session clock.
+            with state.clock.capture(state) as capture:
+                # Subscribers see the tactical narration a console run would
+                # print; the session clock's own setting is left alone.
+                capture.record_tactical = True
+                step_world(state)
+                records = capture.drain()
+            message = self._message(state, records, advanced=state.time != before)
+            self.history.extend(message.lines)
+            self.publish(message)
+        return message
+
+    @staticmethod
+    def _sector_row(sector) -> tuple:
+        return (round(sector.damage, 4), round(sector.power, 4), sector.status_label())
+
+    @staticmethod
+    def _delta(state, sectors: dict[str, tuple], *, events, assault_lines, structure_loss_lines) -> dict[str, Any]:
+        return {
+            "tick": state.time,
+            "events": events,
+            "assault_lines": assault_lines,
+            "structure_loss_lines": structure_loss_lines,
+            "sectors": {
+                name: {"damage": row[0], "power": row[1], "status": row[2]} for name, row in sectors.items()
+            },
+            "threat": state.threat_bucket(),
+            "failed": bool(state.is_failed),
+        }
+
+    def _baseline(self, state) -> TickMessage:
+        """Message carrying every sector's current row, for a new subscriber."""
+
+        sectors = {name: self._sector_row(sector) for name, sector in state.sectors.items()}
+        delta = self._delta(state, sectors, events=[], assault_lines=[], structure_loss_lines=[])
+        return TickMessage(tick=state.time, lines=(), delta=delta, sse=_render_sse((), delta))
+
+    def _message(self, state, records, *, advanced: bool) -> TickMessage:
+        lines = [record.text for record in records]
+        if advanced and state.time % BROADCAST_SNAPSHOT_INTERVAL == 0:
+            lines.extend(["[Snapshot]", *str(state).splitlines(), ""])
+
+        sectors = {}
+        for name, sector in state.sectors.items():
+            row = self._sector_row(sector)
+            if self._sectors.get(name) != row:
+                self._sectors[name] = sectors[name] = row
+        delta = self._delta(
+            state,
+            sectors,
+            events=[
+                {
+                    "key": event.event_key,
+                    "name": event.event_name,
+                    "sector": event.sector,
+                    "detected": event.detected,
+                }
+                for event in state.tick_events
+            ],
+            assault_lines=list(state.last_assault_lines),
+            structure_loss_lines=list(state.last_structure_loss_lines),
+        )
+        line_tuple = tuple(lines)
+        return TickMessage(tick=state.time, lines=line_tuple, delta=delta, sse=_render_sse(line_tuple, delta))
+
+    def _run(self) -> None:
+        dropped: list[Subscriber] = []
+        try:
+            while True:
+                with self._lock:
+                    if not self._subscribers:
+                        self._thread = None
+                        return
+                if not self.paused:
+                    self.step()
+                self._wake.wait(self.tick_delay)
+                self._wake.clear()
+        finally:
+            with self._lock:
+                # Still registered means step() raised: release the slot and
+                # end every stream so viewers are not left on heartbeats.
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    dropped, self._subscribers = self._subscribers, []
+            for subscriber in dropped:
+                subscriber.drop("simulation stopped")
@@ -0,0 +1,181 @@
+"""Incrementally maintained sector/structure aggregates for GameState."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .bitgrid import positions_mask
+
+
+_MISSING = object()
+
+
+class SectorIndexedDict(dict):
+    """``id -> record`` mapping that keeps a per-sector index in sync.
+
+    Records expose a ``sector`` attribute. Every mutation path (item
+    assignment, deletion, ``pop``, ``update`` ...) updates the index, so
+    callers that assign into the mapping directly stay consistent with
+    callers that go through ``GameState`` helpers.
+    """
+
+    def __init__(self, items: Any = ()):
+        super().__init__()
+        self._by_sector: dict[str, dict[str, Any]] = {}
+        self.update(items)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def _index(self, key: str, value: Any) -> None:
+        self._by_sector.setdefault(value.sector, {})[key] = value
+
+    def _unindex(self, key: str, value: Any) -> None:
+        bucket = self._by_sector.get(value.sector)
+        if bucket is not None:
+            bucket.pop(key, None)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        previous = dict.get(self, key)
+        if previous is not None:
+            self._unindex(key, previous)
+        dict.__setitem__(self, key, value)
+        self._index(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        value = dict.__getitem__(self, key)
+        dict.__delitem__(self, key)
+        self._unindex(key, value)
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        if key in self:
+            value = dict.pop(self, key)
+            self._unindex(key, value)
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = dict.popitem(self)
+        self._unindex(key, value)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        items = other.items() if hasattr(other, "items") else other
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key, value in list(dict.items(self)):
+            self._unindex(key, value)
+        dict.clear(self)
+
+    def in_sector(self, sector: str) -> list[Any]:
+        """Return records in ``sector`` in insertion order."""
+
+        return list(self._by_sector.get(sector, {}).values())
+
+
+class StructureInstanceIndex(SectorIndexedDict):
+    """Spatial instance registry with per-sector WALL occupancy."""
+
+    def __init__(self, items: Any = ()):
+        self._walls: dict[str, set[tuple[int, int]]] = {}
+        super().__init__(items)
+
+    def _index(self, key: str, value: Any) -> None:
+        super()._index(key, value)
+        if value.type == "WALL":
+            self._walls.setdefault(value.sector, set()).add(value.position)
+
+    def _unindex(self, key: str, value: Any) -> None:
+        super()._unindex(key, value)
+        if value.type == "WALL":
+            walls = self._walls.get(value.sector)
+            if walls is not None:
+                walls.discard(value.position)
+
+    def wall_count(self, sector: str) -> int:
+        return len(self._walls.get(sector, ()))
+
+
+class SectorTotals:
+    """Cached cross-sector damage/power sums invalidated by sector setters."""
+
+    __slots__ = ("_sectors", "_damage", "_power", "revision")
+
+    def __init__(self, sectors: dict[str, Any]):
+        self._sectors = sectors
+        self._damage: float | None = None
+        self._power: float | None = None
+        # Bumped on every damage/power write; lets callers cache sector views.
+        self.revision = 0
+        for sector in sectors.values():
+            sector._totals = self
+
+    def invalidate_damage(self) -> None:
+        self._damage = None
+        self.revision += 1
+
+    def invalidate_power(self) -> None:
+        self._power = None
+        self.revision += 1
+
+    @property
+    def damage(self) -> float:
+        if self._damage is None:
+            self._damage = sum(sector.damage for sector in self._sectors.values())
+        return self._damage
+
+    @property
+    def power(self) -> float:
+        if self._power is None:
+            self._power = sum(sector.power for sector in self._sectors.values())
+        return self._power
+
+
+def _ids(records: list[Any]) -> set[int]:
+    return {id(record) for record in records}
+
+
+def verify_aggregates(state) -> None:
+    """Recompute every maintained aggregate from scratch and compare.
+
+    Raises AssertionError on the first mismatch. Intended for tests and debug
+    runs; the tick loop reads the maintained values directly.
+    """
+
+    structures = state.structures
+    for sector_name in state.sectors:
+        expected = [s for s in structures.values() if s.sector == sector_name]
+        if _ids(structures.in_sector(sector_name)) != _ids(expected):
+            raise AssertionError(f"Structure index mismatch for {sector_name}")
+
+    instances = state.structure_instances
+    sector_names = set(state.sectors) | {i.sector for i in instances.values()}
+    for sector_name in sector_names:
+        expected_instances = [i for i in instances.values() if i.sector == sector_name]
+        if _ids(instances.in_sector(sector_name)) != _ids(expected_instances):
+            raise AssertionError(f"Structure instance index mismatch for {sector_name}")
+        walls = {i.position for i in expected_instances if i.type == "WALL"}
+        if instances._walls.get(sector_name, set()) != walls:
+            raise AssertionError(f"Wall occupancy mismatch for {sector_name}")
+        grid = state.sector_grids.get(sector_name)
+        if grid is not None and grid.type_bits_for("WALL") != positions_mask(walls, grid.stride):
+            raise AssertionError(f"Grid wall bitboard mismatch for {sector_name}")
+
+    totals = state.sector_totals
+    damage = sum(sector.damage for sector in state.sectors.values())
+    power = sum(sector.power for sector in state.sectors.values())
+    if totals.damage != damage:
+        raise AssertionError(f"Damage total mismatch: {totals.damage} != {damage}")
+    if totals.power != power:
+        raise AssertionError(f"Power total mismatch: {totals.power} != {power}")
@@ -0,0 +1,337 @@
+"""Closed-form assault outcome previews for planning screens and AI directors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from game.procgen.engine import mix_seed64
+from game.simulations.assault.core.autopilot import output_multiplier
+
+from ..assault_outcome import AssaultOutcome
+from .assault_instance import AssaultInstance
+from .clock import SimulationClock
+from .config import ASSAULT_TACTICAL_TICKS_MAX, ASSAULT_TACTICAL_TICKS_MIN
+from .defense import allocation_group_for_sector, doctrine_threat_multiplier
+from .simulation import step_world
+from .state import GameState
+from .tactical_bridge import TACTICAL_TURRET_DAMAGE, sector_turret_output
+
+ESTIMATE_MAX_SAMPLES = 16
+# Ticks a sampled future may run before its assault must have resolved.
+ESTIMATE_SAMPLE_TICK_LIMIT = 120
+
+# Mirrors the tactical layer: morale.should_retreat and Enemy.take_damage.
+_RETREAT_MORALE = 10
+_MORALE_PER_DAMAGE = 0.5
+_LOW_AMMO_FACTOR = 0.6
+
+
+@dataclass(frozen=True)
+class AssaultEstimate:
+    """Expected outcome of one assault.
+
+    Counts are expectations over the tactical duration, which is only known
+    once the assault starts. ``error`` is the largest count deviation seen
+    between the analytic projection and the full resolver over ``samples``
+    forked futures, or ``None`` when no samples were run.
+    """
+
+    targets: tuple[str, ...]
+    duration: float
+    spawned: float
+    killed: float
+    retreated: float
+    remaining: float
+    breach_chance: float
+    penetration: str
+    samples: int = 0
+    error: float | None = None
+
+    def status_line(self) -> str:
+        return (
+            f"PROJECTED: {'/'.join(self.targets)} KILL~{self.killed:.0f} "
+            f"ROUT~{self.retreated:.0f} BREACH~{self.remaining:.0f} "
+            f"({self.penetration.upper()})"
+        )
+
+
+class _Lane:
+    """One tactical sector as turret rows and runs of identical enemies."""
+
+    __slots__ = ("name", "bias", "turrets", "runs")
+
+    def __init__(self, name: str, bias: float, turrets: list[list[float]], runs: list[list[float]]):
+        self.name = name
+        self.bias = bias
+        self.turrets = turrets  # [damage, effective_output, cooldown]
+        self.runs = runs  # [count, hp, morale], in targeting order
+
+    def fire(self, turret: list[float], mult: float) -> int:
+        output = turret[1] * mult
+        if output <= 0.0:
+            return 0
+        if turret[2] > 0.0:
+            turret[2] = max(0.0, turret[2] - 1.0)
+            return 0
+        if output < 0.2:
+            turret[2] = 2.0
+            return 0
+        runs = self.runs
+        if not runs:
+            return 0
+        head = runs[0]
+        if head[0] > 1:
+            head[0] -= 1
+            head = [1, head[1], head[2]]
+            runs.insert(0, head)
+        shot = turret[0] * output
+        head[1] -= shot
+        head[2] -= shot * _MORALE_PER_DAMAGE
+        turret[2] = 2.0 / output
+        if head[1] <= 0:
+            runs.pop(0)
+            return 1
+        return 0
+
+    def sweep(self) -> int:
+        fled = 0
+        kept = []
+        for run in self.runs:
+            if run[2] <= _RETREAT_MORALE:
+                fled += run[0]
+            else:
+                kept.append(run)
+        self.runs = kept
+        return fled
+
+
+def _project(
+    lanes: list[_Lane],
+    arrivals: dict[int, list[tuple[str, int, float, float]]],
+    *,
+    doctrine: str,
+    ammo: int,
+    start: int,
+    end: int,
+    totals: tuple[int, int, int],
+) -> dict[int, tuple[int, int, int, int]]:
+    """Cumulative (spawned, killed, retreated, remaining) after each tick."""
+
+    by_name = {lane.name: lane for lane in lanes}
+    spawned, killed, retreated = totals
+    last_arrival = max(arrivals, default=-1)
+    rows = {}
+    for tick in range(start, end):
+        if tick > last_arrival and not any(lane.runs for lane in lanes):
+            # Nothing left to shoot or spawn: the tally is final.
+            quiet = (spawned, killed, retreated, 0)
+            rows.update((later + 1, quiet) for later in range(tick, end))
+            break
+        for sector_name, count, hp, morale in arrivals.get(tick, ()):
+            lane = by_name.get(sector_name)
+            if lane is not None and count > 0:
+                lane.runs.append([count, hp, morale])
+                spawned += count
+        ammo_factor = 1.0 if ammo > 0 else _LOW_AMMO_FACTOR
+        for lane in lanes:
+            if not lane.runs:
+                continue
+            mult = output_multiplier(doctrine, lane.bias * ammo_factor)
+            for turret in lane.turrets:
+                killed += lane.fire(turret, mult)
+        for lane in lanes:
+            if lane.runs:
+                retreated += lane.sweep()
+        if ammo > 0:
+            ammo -= 1
+        remaining = sum(run[0] for lane in lanes for run in lane.runs)
+        rows[tick + 1] = (spawned, killed, retreated, remaining)
+    return rows
+
+
+def _active_lanes(assault, allocation: dict[str, float]) -> list[_Lane]:
+    lanes = []
+    for sector in assault._tactical_sectors:
+        runs: list[list[float]] = []
+        for enemy in sector.enemies:
+            if not enemy.alive:
+                continue
+            if runs and runs[-1][1] == enemy.hp and runs[-1][2] == enemy.morale:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, enemy.hp, enemy.morale])
+        turrets = [[turret.damage, turret.effective_output, turret.cooldown] for turret in sector.defenses]
+        bias = float(allocation.get(allocation_group_for_sector(sector.name), 1.0))
+        lanes.append(_Lane(sector.name, bias, turrets, runs))
+    return lanes
+
+
+def _fresh_lanes(state: GameState, names: list[str], allocation: dict[str, float]) -> list[_Lane]:
+    lanes = []
+    for name in names:
+        output = max(0.0, min(1.0, sector_turret_output(state, name)))
+        bias = float(allocation.get(allocation_group_for_sector(name), 1.0))
+        lanes.append(_Lane(name, bias, [[TACTICAL_TURRET_DAMAGE, output, 0.0]], []))
+    return lanes
+
+
+def _arrivals(assault: AssaultInstance, start: int) -> dict[int, list[tuple[str, int, float, float]]]:
+    arrivals: dict[int, list[tuple[str, int, float, float]]] = {}
+    for phase in assault.entry_phases:
+        if phase["tick"] < start:
+            continue
+        group = phase["group"]
+        arrivals.setdefault(phase["tick"], []).append(
+            (phase["sector"], int(group["count"]), group["hp"], group["morale"])
+        )
+    return arrivals
+
+
+def _pending_assault(state: GameState):
+    if state.current_assault is not None:
+        return state.current_assault
+    approaches = [a for a in state.assaults if a.state == "APPROACHING"]
+    if not approaches:
+        return None
+    return min(approaches, key=lambda approach: approach.eta_ticks())
+
+
+def _projection(state: GameState, assault):
+    """Return (targets, threat_budget, durations, rows) for ``assault``."""
+
+    if isinstance(assault, AssaultInstance):
+        start = assault.ticks_elapsed
+        allocation = getattr(assault, "defense_allocation", state.defense_allocation)
+        doctrine = getattr(assault, "defense_doctrine", state.defense_doctrine)
+        summary = getattr(assault, "_summary", None) or {}
+        totals = (summary.get("spawned", 0), summary.get("killed", 0), summary.get("retreated", 0))
+        if getattr(assault, "_tactical_sectors", None):
+            lanes = _active_lanes(assault, allocation)
+        else:
+            lanes = _fresh_lanes(state, [sector.name for sector in assault.target_sectors], allocation)
+        instance = assault
+        durations = [max(start + 1, int(assault.duration_ticks))]
+    else:
+        # An approach has no instance yet; build the one _start_assault would.
+        target = state.sectors.get(assault.target)
+        if target is None:
+            return None
+        start = 0
+        allocation = state.defense_allocation
+        doctrine = state.defense_doctrine
+        totals = (0, 0, 0)
+        instance = AssaultInstance(
+            faction_profile=state.faction_profile,
+            target_sectors=[target],
+            threat_budget=100,
+            start_time=state.time,
+            readiness=state.compute_readiness(),
+            threat_scale=doctrine_threat_multiplier(doctrine),
+        )
+        lanes = _fresh_lanes(state, [target.name], allocation)
+        durations = list(range(ASSAULT_TACTICAL_TICKS_MIN, ASSAULT_TACTICAL_TICKS_MAX + 1))
+
+    rows = _project(
+        lanes,
+        _arrivals(instance, start),
+        doctrine=doctrine,
+        ammo=int(state.turret_ammo_stock),
+        start=start,
+        end=max(durations),
+        totals=totals,
+    )
+    targets = tuple(sector.name for sector in instance.target_sectors)
+    return targets, instance.threat_budget, durations, rows
+
+
+def _sample_future(state: GameState, index: int, targets: tuple[str, ...]):
+    """Run one forked future until the previewed assault resolves."""
+
+    future = state.fork()
+    future.sim_rng.seed(mix_seed64(state.seed, "assault_estimate", state.time, index))
+    clock = SimulationClock(headless=True, sink_limit=1)
+    tracked = future.current_assault
+    for _ in range(ESTIMATE_SAMPLE_TICK_LIMIT):
+        if future.is_failed:
+            break
+        step_world(future, clock=clock)
+        current = future.current_assault
+        if tracked is None and current is not None:
+            if tuple(sector.name for sector in current.target_sectors) == targets:
+                tracked = current
+        if tracked is not None and tracked.resolved:
+            summary = tracked._summary
+            return tracked.duration_ticks, (
+                summary["spawned"],
+                summary["killed"],
+                summary["retreated"],
+                summary["remaining"],
+            )
+    return None
+
+
+def estimate_assault_outcome(state: GameState, assault=None, *, samples: int = 0) -> AssaultEstimate | None:
+    """Preview the outcome of ``assault`` without touching ``state``.
+
+    ``assault`` may be the running ``AssaultInstance`` or an approaching
+    ``AssaultApproach``; by default the current assault, else the nearest
+    approach. The analytic pass replays turret cooldowns against runs of
+    identical enemies, so it is exact for a running assault whose ammo and
+    allocation stay put, and averages the uniform tactical duration for an
+    approach. ``samples`` forks the state and steps the full world to measure
+    how far the projection drifts from the real resolver.
+    """
+
+    if assault is None:
+        assault = _pending_assault(state)
+        if assault is None:
+            return None
+    projection = _projection(state, assault)
+    if projection is None:
+        return None
+    targets, threat_budget, durations, rows = projection
+
+    weight = 1.0 / len(durations)
+    expected = [0.0, 0.0, 0.0, 0.0]
+    breach = 0.0
+    for duration in durations:
+        row = rows[duration]
+        for slot, value in enumerate(row):
+            expected[slot] += value * weight
+        if row[3] > 0:
+            breach += weight
+    spawned, killed, retreated, remaining = expected
+    penetration = AssaultOutcome(
+        threat_budget=threat_budget,
+        duration=sum(durations) * weight,
+        spawned=spawned,
+        killed=killed,
+        retreated=retreated,
+        remaining=round(remaining),
+    ).penetration
+
+    samples = max(0, min(ESTIMATE_MAX_SAMPLES, int(samples)))
+    error = None
+    if samples:
+        error = 0.0
+        last = max(rows)
+        for index in range(samples):
+            sampled = _sample_future(state, index, targets)
+            if sampled is None:
+                continue
+            duration, actual = sampled
+            row = rows[min(max(duration, min(rows)), last)]
+            error = max(error, float(max(abs(a - b) for a, b in zip(row[1:], actual[1:]))))
+
+    return AssaultEstimate(
+        targets=targets,
+        duration=sum(durations) * weight,
+        spawned=round(spawned, 3),
+        killed=round(killed, 3),
+        retreated=round(retreated, 3),
+        remaining=round(remaining, 3),
+        breach_chance=round(breach, 3),
+        penetration=penetration,
+        samples=samples,
+        error=error,
+    )
@@ -1,6 +1,24 @@
-"""Structured assault introspection ledger."""
+"""Structured assault introspection ledger.
 
-from dataclasses import dataclass, field
+Rows live in a fixed-capacity columnar ring: one typed array per numeric
+field and small code tables for sector and structure ids, so appends are
+O(1) and never shift older rows. Every row gets a monotonic sequence
+number; ``window(start)`` views the rows appended since ``start`` without
+copying, even after older rows have been overwritten.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from typing import IO, Any
+
+from .config import ASSAULT_LEDGER_CAPACITY
+
+COLUMNS_MAGIC = b"CUSTODIAN-LEDGER/1\n"
 
 
 @dataclass
@@ -15,14 +33,407 @@ class AssaultTickRecord:
     note: str | None = None
 
 
-@dataclass
+class _Codes:
+    """Interned string table; code -1 stands for ``None``."""
+
+    __slots__ = ("values", "index")
+
+    def __init__(self, values: list[str] | None = None):
+        self.values = list(values or ())
+        self.index = {value: code for code, value in enumerate(self.values)}
+
+    def code(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def value(self, code: int) -> str | None:
+        return None if code < 0 else self.values[code]
+
+
 class AssaultLedger:
-    active: bool = False
-    ticks: list[AssaultTickRecord] = field(default_factory=list)
+    """Bounded columnar ring of ``AssaultTickRecord`` rows."""
+
+    def __init__(
+        self,
+        active: bool = False,
+        ticks: list[AssaultTickRecord] | None = None,
+        *,
+        capacity: int = ASSAULT_LEDGER_CAPACITY,
+    ):
+        self.active = active
+        self.capacity = max(1, int(capacity))
+        self.sequence = 0
+        self._sectors = _Codes()
+        self._buildings = _Codes()
+        self._tick = array("q")
+        self._sector = array("i")
+        self._weight = array("d")
+        self._strength = array("d")
+        self._mitigation = array("d")
+        self._building = array("i")
+        self._failure = bytearray()
+        self._note: list[str | None] = []
+        for record in ticks or ():
+            self.append(record)
+
+    # -------------------------
+    # Writes
+    # -------------------------
+
+    def append(self, record: AssaultTickRecord) -> None:
+        sector = self._sectors.code(record.targeted_sector)
+        building = self._buildings.code(record.building_destroyed)
+        failure = 1 if record.failure_triggered else 0
+        if len(self._tick) < self.capacity:
+            self._tick.append(record.tick)
+            self._sector.append(sector)
+            self._weight.append(record.target_weight)
+            self._strength.append(record.assault_strength)
+            self._mitigation.append(record.defense_mitigation)
+            self._building.append(building)
+            self._failure.append(failure)
+            self._note.append(record.note)
+        else:
+            slot = self.sequence % self.capacity
+            self._tick[slot] = record.tick
+            self._sector[slot] = sector
+            self._weight[slot] = record.target_weight
+            self._strength[slot] = record.assault_strength
+            self._mitigation[slot] = record.defense_mitigation
+            self._building[slot] = building
+            self._failure[slot] = failure
+            self._note[slot] = record.note
+        self.sequence += 1
+
+    def copy(self) -> "AssaultLedger":
+        clone = AssaultLedger.__new__(AssaultLedger)
+        clone.active = self.active
+        clone.capacity = self.capacity
+        clone.sequence = self.sequence
+        clone._sectors = _Codes(self._sectors.values)
+        clone._buildings = _Codes(self._buildings.values)
+        clone._tick = array("q", self._tick)
+        clone._sector = array("i", self._sector)
+        clone._weight = array("d", self._weight)
+        clone._strength = array("d", self._strength)
+        clone._mitigation = array("d", self._mitigation)
+        clone._building = array("i", self._building)
+        clone._failure = bytearray(self._failure)
+        clone._note = list(self._note)
+        return clone
+
+    # -------------------------
+    # Reads
+    # -------------------------
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence number of the oldest row still held."""
+
+        return self.sequence - len(self._tick)
+
+    @property
+    def ticks(self) -> "LedgerView":
+        """Every retained row, oldest first."""
+
+        return LedgerView(self, self.first_sequence, self.sequence)
+
+    def window(self, start: int, stop: int | None = None) -> "LedgerView":
+        """Rows with sequence numbers in ``[start, stop)`` that are still held."""
+
+        stop = self.sequence if stop is None else min(int(stop), self.sequence)
+        start = max(int(start), self.first_sequence)
+        return LedgerView(self, start, max(start, stop))
+
+    def __len__(self) -> int:
+        return len(self._tick)
+
+    def __iter__(self) -> Iterator[AssaultTickRecord]:
+        return iter(self.ticks)
+
+    def _slot(self, sequence: int) -> int:
+        if len(self._tick) < self.capacity:
+            return sequence
+        return sequence % self.capacity
+
+    def _record(self, sequence: int) -> AssaultTickRecord:
+        slot = self._slot(sequence)
+        return AssaultTickRecord(
+            tick=self._tick[slot],
+            targeted_sector=self._sectors.values[self._sector[slot]],
+            target_weight=self._weight[slot],
+            assault_strength=self._strength[slot],
+            defense_mitigation=self._mitigation[slot],
+            building_destroyed=self._buildings.value(self._building[slot]),
+            failure_triggered=bool(self._failure[slot]),
+            note=self._note[slot],
+        )
+
+    def _columns(self) -> tuple:
+        return (
+            self._tick,
+            self._sector,
+            self._weight,
+            self._strength,
+            self._mitigation,
+            self._building,
+            self._failure,
+            self._note,
+        )
+
+    # -------------------------
+    # Export
+    # -------------------------
+
+    def write_ndjson(self, target: str | Path | IO[str]) -> int:
+        """Write retained rows as one JSON object per line; returns the row count."""
+
+        return self.ticks.write_ndjson(target)
+
+    def write_columns(self, path: str | Path) -> int:
+        """Write retained rows to a columnar file; returns the row count."""
+
+        return self.ticks.write_columns(path)
+
+    @classmethod
+    def read_columns(cls, path: str | Path, *, capacity: int = ASSAULT_LEDGER_CAPACITY) -> "AssaultLedger":
+        """Load a file written by ``write_columns`` into a fresh ledger."""
+
+        raw = Path(path).read_bytes()
+        if not raw.startswith(COLUMNS_MAGIC):
+            raise ValueError(f"{path} is not an assault ledger column file")
+        header_end = raw.index(b"\n", len(COLUMNS_MAGIC))
+        header = json.loads(raw[len(COLUMNS_MAGIC):header_end])
+        body = memoryview(raw)[header_end + 1:]
+        rows = int(header["rows"])
+        columns: dict[str, Any] = {}
+        for name, spec in header["columns"].items():
+            chunk = body[spec["offset"]:spec["offset"] + spec["length"]]
+            if spec["type"] == "json":
+                columns[name] = json.loads(bytes(chunk))
+                continue
+            values = array(spec["type"])
+            values.frombytes(chunk)
+            columns[name] = values
+        sectors = header["dictionaries"]["targeted_sector"]
+        buildings = header["dictionaries"]["building_destroyed"]
+        ledger = cls(active=rows > 0, capacity=capacity)
+        for index in range(rows):
+            building = columns["building_destroyed"][index]
+            ledger.append(
+                AssaultTickRecord(
+                    tick=columns["tick"][index],
+                    targeted_sector=sectors[columns["targeted_sector"][index]],
+                    target_weight=columns["target_weight"][index],
+                    assault_strength=columns["assault_strength"][index],
+                    defense_mitigation=columns["defense_mitigation"][index],
+                    building_destroyed=None if building < 0 else buildings[building],
+                    failure_triggered=bool(columns["failure_triggered"][index]),
+                    note=columns["note"][index],
+                )
+            )
+        return ledger
+
+    # -------------------------
+    # Pickling
+    # -------------------------
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "capacity": self.capacity,
+            "sequence": self.sequence,
+            "sectors": self._sectors.values,
+            "buildings": self._buildings.values,
+            "columns": self._columns(),
+        }
+
+    def __setstate__(self, payload: dict[str, Any]) -> None:
+        if "columns" not in payload:
+            # Pre-columnar pickles held a plain list of records.
+            self.__init__(active=payload.get("active", False), ticks=payload.get("ticks"))
+            return
+        self.active = payload["active"]
+        self.capacity = payload["capacity"]
+        self.sequence = payload["sequence"]
+        self._sectors = _Codes(payload["sectors"])
+        self._buildings = _Codes(payload["buildings"])
+        (
+            self._tick,
+            self._sector,
+            self._weight,
+            self._strength,
+            self._mitigation,
+            self._building,
+            self._failure,
+            self._note,
+        ) = payload["columns"]
+
+
+class LedgerView:
+    """Read-only window over a ledger by sequence number.
+
+    Views copy nothing; they index the ledger's columns on demand, so a view
+    taken before later appends wrap past its rows reads overwritten data.
+    Take views, query them, and let them go.
+    """
+
+    __slots__ = ("ledger", "start", "stop")
+
+    def __init__(self, ledger: AssaultLedger, start: int, stop: int):
+        self.ledger = ledger
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __bool__(self) -> bool:
+        return self.stop > self.start
+
+    def __iter__(self) -> Iterator[AssaultTickRecord]:
+        record = self.ledger._record
+        for sequence in range(self.start, self.stop):
+            yield record(sequence)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                return [self[index] for index in range(start, stop, step)]
+            return LedgerView(self.ledger, self.start + start, self.start + max(start, stop))
+        index = int(item)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ledger view index out of range")
+        return self.ledger._record(self.start + index)
+
+    def _slots(self) -> Iterator[int]:
+        slot = self.ledger._slot
+        for sequence in range(self.start, self.stop):
+            yield slot(sequence)
+
+    def column(self, name: str) -> list:
+        """Values of one field, oldest first."""
+
+        ledger = self.ledger
+        if name == "targeted_sector":
+            values = ledger._sectors.values
+            return [values[ledger._sector[slot]] for slot in self._slots()]
+        if name == "building_destroyed":
+            return [ledger._buildings.value(ledger._building[slot]) for slot in self._slots()]
+        if name == "failure_triggered":
+            return [bool(ledger._failure[slot]) for slot in self._slots()]
+        source = {
+            "tick": ledger._tick,
+            "target_weight": ledger._weight,
+            "assault_strength": ledger._strength,
+            "defense_mitigation": ledger._mitigation,
+            "note": ledger._note,
+        }.get(name)
+        if source is None:
+            raise KeyError(name)
+        return [source[slot] for slot in self._slots()]
+
+    # -------------------------
+    # Aggregates
+    # -------------------------
+
+    def damage_by_sector(self) -> dict[str, float]:
+        """Assault strength left after mitigation, summed per targeted sector."""
+
+        ledger = self.ledger
+        sectors = ledger._sectors.values
+        totals: dict[str, float] = {}
+        for slot in self._slots():
+            name = sectors[ledger._sector[slot]]
+            landed = ledger._strength[slot] * (1.0 - ledger._mitigation[slot])
+            totals[name] = totals.get(name, 0.0) + landed
+        return totals
+
+    def mitigation_distribution(self, bins: int = 10) -> list[int]:
+        """Row counts of ``defense_mitigation`` in equal bins over [0, 1]."""
+
+        bins = max(1, int(bins))
+        counts = [0] * bins
+        mitigation = self.ledger._mitigation
+        for slot in self._slots():
+            value = min(1.0, max(0.0, mitigation[slot]))
+            counts[min(bins - 1, int(value * bins))] += 1
+        return counts
+
+    def destroyed(self) -> list[str]:
+        """Structures destroyed in this window, first loss first."""
+
+        ledger = self.ledger
+        seen: list[str] = []
+        for slot in self._slots():
+            code = ledger._building[slot]
+            if code >= 0:
+                name = ledger._buildings.values[code]
+                if name not in seen:
+                    seen.append(name)
+        return seen
+
+    # -------------------------
+    # Export
+    # -------------------------
+
+    def write_ndjson(self, target: str | Path | IO[str]) -> int:
+        if isinstance(target, (str, Path)):
+            with Path(target).open("w", encoding="utf-8") as stream:
+                return self.write_ndjson(stream)
+        for record in self:
+            target.write(json.dumps(record.__dict__, separators=(",", ":")) + "\n")
+        return len(self)
+
+    def write_columns(self, path: str | Path) -> int:
+        """Write one contiguous chunk per field behind a JSON header.
+
+        Numeric fields are raw typed arrays, sector and structure ids are
+        dictionary-encoded and notes are a JSON list.
+        """
+
+        ledger = self.ledger
+        slots = list(self._slots())
+        chunks: list[tuple[str, str, bytes]] = [
+            ("tick", "q", array("q", (ledger._tick[slot] for slot in slots)).tobytes()),
+            ("targeted_sector", "i", array("i", (ledger._sector[slot] for slot in slots)).tobytes()),
+            ("target_weight", "d", array("d", (ledger._weight[slot] for slot in slots)).tobytes()),
+            ("assault_strength", "d", array("d", (ledger._strength[slot] for slot in slots)).tobytes()),
+            ("defense_mitigation", "d", array("d", (ledger._mitigation[slot] for slot in slots)).tobytes()),
+            ("building_destroyed", "i", array("i", (ledger._building[slot] for slot in slots)).tobytes()),
+            ("failure_triggered", "B", bytes(ledger._failure[slot] for slot in slots)),
+            ("note", "json", json.dumps([ledger._note[slot] for slot in slots]).encode("utf-8")),
+        ]
+        columns = {}
+        offset = 0
+        for name, kind, payload in chunks:
+            columns[name] = {"type": kind, "offset": offset, "length": len(payload)}
+            offset += len(payload)
+        header = {
+            "rows": len(slots),
+            "first_sequence": self.start,
+            "columns": columns,
+            "dictionaries": {
+                "targeted_sector": ledger._sectors.values,
+                "building_destroyed": ledger._buildings.values,
+            },
+        }
+        with Path(path).open("wb") as stream:
+            stream.write(COLUMNS_MAGIC)
+            stream.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+            for _name, _kind, payload in chunks:
+                stream.write(payload)
+        return len(slots)
 
 
 def append_record(state, record: AssaultTickRecord) -> None:
     state.assault_ledger.active = True
-    state.assault_ledger.ticks.append(record)
-    if len(state.assault_ledger.ticks) > 2000:
-        del state.assault_ledger.ticks[:-2000]
+    state.assault_ledger.append(record)
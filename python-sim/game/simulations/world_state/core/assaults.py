@@ -1,4 +1,3 @@
-import time
 from collections import deque
 from uuid import uuid4
 
@@ -7,11 +6,14 @@ from .tactical_bridge import build_tactical_sectors
 from ..assault_outcome import AssaultOutcome
 from game.simulations.assault.core.autopilot import run_autopilot
 from game.simulations.assault.core.morale import should_retreat
+from game.simulations.assault.core.narration import use_sink
 
 from .config import (
     ASSAULT_ALERTNESS_PER_TICK,
     ASSAULT_DURATION_MAX,
     ASSAULT_DURATION_MIN,
+    ASSAULT_TACTICAL_TICKS_MAX,
+    ASSAULT_TACTICAL_TICKS_MIN,
     ASSAULT_THREAT_PER_TICK,
     ASSAULT_TIMER_BASE_MAX,
     ASSAULT_TIMER_BASE_MIN,
@@ -42,6 +44,7 @@ from .effects import add_global_effect, add_sector_effect
 from .assault_ledger import AssaultTickRecord, append_record
 from .detection import detection_probability
 from .defense import (
+    allocation_group_for_sector,
     defense_bias_for_sector,
     doctrine_sector_priority_multiplier,
     doctrine_threat_multiplier,
@@ -414,7 +417,7 @@ def _start_assault(
     )
     assault.defense_doctrine = state.defense_doctrine
     assault.defense_allocation = dict(state.defense_allocation)
-    assault.duration_ticks = state.rng.randint(5, 12)
+    assault.duration_ticks = state.rng.randint(ASSAULT_TACTICAL_TICKS_MIN, ASSAULT_TACTICAL_TICKS_MAX)
     assault._tactical_sectors = build_tactical_sectors(assault, state=state)
     assault._summary = {
         "duration": assault.duration_ticks,
@@ -423,6 +426,7 @@ def _start_assault(
         "retreated": 0,
         "remaining": 0,
     }
+    assault._ledger_start = state.assault_ledger.sequence
     assault._pre_damage = {name: sector.damage for name, sector in state.sectors.items()}
     assault._pre_materials = state.materials
     assault._pre_power_load = float(getattr(state, "power_load", 1.0))
@@ -435,9 +439,9 @@ def _start_assault(
         int(approach_transit_fortification_wear),
     )
     state.current_assault = assault
-    print("\n=== MAJOR ASSAULT BEGINS ===")
-    print(assault)
-    print()
+    state.clock.narrate(state.time, "assault", "\n=== MAJOR ASSAULT BEGINS ===")
+    state.clock.narrate(state.time, "assault", str(assault))
+    state.clock.narrate(state.time, "assault", "")
 
 
 def resolve_assault(state, tick_delay=0.05):
@@ -445,7 +449,7 @@ def resolve_assault(state, tick_delay=0.05):
     if assault is None:
         return None
 
-    ledger_start = len(state.assault_ledger.ticks)
+    ledger_start = getattr(assault, "_ledger_start", state.assault_ledger.sequence)
     target_names = {sector.name for sector in assault.target_sectors}
     archive_pre_damage = state.sectors["ARCHIVE"].damage
     tactical_sectors = getattr(assault, "_tactical_sectors", None)
@@ -462,28 +466,25 @@ def resolve_assault(state, tick_delay=0.05):
     summary["spawned"] += assault.spawn_at_tick(tick, sector_lookup)
     doctrine = getattr(assault, "defense_doctrine", "BALANCED")
     allocation = getattr(assault, "defense_allocation", {})
-    for sector in tactical_sectors:
-        if sector.name == "COMMAND":
-            bias_group = "COMMAND"
-        elif sector.name in {"POWER", "FABRICATION"}:
-            bias_group = "POWER"
-        elif sector.name == "COMMS":
-            bias_group = "SENSORS"
-        else:
-            bias_group = "PERIMETER"
-        bias = float(allocation.get(bias_group, 1.0))
-        ammo_factor = 1.0 if state.turret_ammo_stock > 0 else 0.6
-        run_autopilot(sector, doctrine=doctrine, defense_bias=bias * ammo_factor)
+    with use_sink(state.clock.combat_sink(state)):
+        for sector in tactical_sectors:
+            bias = float(allocation.get(allocation_group_for_sector(sector.name), 1.0))
+            ammo_factor = 1.0 if state.turret_ammo_stock > 0 else 0.6
+            run_autopilot(sector, doctrine=doctrine, defense_bias=bias * ammo_factor)
 
     for sector in tactical_sectors:
-        for enemy in list(sector.enemies):
+        # One pass per roster: list.remove per casualty is quadratic when a
+        # large wave breaks at once.
+        kept = []
+        for enemy in sector.enemies:
             if not enemy.alive:
                 summary["killed"] += 1
-                sector.enemies.remove(enemy)
-                continue
-            if should_retreat(enemy):
+            elif should_retreat(enemy):
                 summary["retreated"] += 1
-                sector.enemies.remove(enemy)
+            else:
+                kept.append(enemy)
+        if len(kept) != len(sector.enemies):
+            sector.enemies[:] = kept
 
     _apply_assault_tick_world_effects(state, assault, tactical_sectors, tick)
     _tick_tactical_effects(state)
@@ -497,7 +498,7 @@ def resolve_assault(state, tick_delay=0.05):
 
     if assault.ticks_elapsed < assault.duration_ticks:
         state.last_assault_lines = _assault_tick_feedback_lines(state, assault, tactical_sectors)
-        time.sleep(tick_delay)
+        state.clock.pause(tick_delay)
         return None
 
     assault.resolved = True
@@ -539,8 +540,8 @@ def resolve_assault(state, tick_delay=0.05):
     if archive_pre_damage < 1.0 and archive_post_damage >= 1.0:
         state.archive_losses += 1
 
-    print(outcome)
-    print("\n=== ASSAULT REPULSED ===\n")
+    state.clock.narrate(state.time, "assault", str(outcome))
+    state.clock.narrate(state.time, "assault", "\n=== ASSAULT REPULSED ===\n")
     return outcome
 
 
@@ -620,16 +621,15 @@ def _tactical_modifier(state, sector_name: str) -> float:
 
 def _apply_assault_tick_world_effects(state, assault, sectors, tick: int) -> None:
     if state.dev_trace:
-        print(
-            {
-                "tick": getattr(assault, "ticks_elapsed", tick),
-                "active_sectors": [s.name for s in sectors if s.has_hostiles()],
-                "ambient_threat": state.ambient_threat,
-                "alertness": {
-                    sector.name: sector.alertness for sector in assault.target_sectors
-                },
-            }
-        )
+        trace = {
+            "tick": getattr(assault, "ticks_elapsed", tick),
+            "active_sectors": [s.name for s in sectors if s.has_hostiles()],
+            "ambient_threat": state.ambient_threat,
+            "alertness": {
+                sector.name: sector.alertness for sector in assault.target_sectors
+            },
+        }
+        state.clock.narrate(state.time, "trace", str(trace), trace)
 
     for sector in sectors:
         if not sector.has_hostiles():
@@ -861,10 +861,7 @@ def _generate_after_action_summary(
         pre_queue_ticks = sum(task.ticks_remaining for task in state.fabrication_queue)
     if pre_surveillance is None:
         pre_surveillance = int(state.policies.surveillance_coverage)
-    destroyed = []
-    for record in state.assault_ledger.ticks[ledger_start:]:
-        if record.building_destroyed and record.building_destroyed not in destroyed:
-            destroyed.append(record.building_destroyed)
+    destroyed = state.assault_ledger.window(ledger_start).destroyed()
     sector_losses = []
     for name, before in pre_damage.items():
         after = state.sectors[name].damage
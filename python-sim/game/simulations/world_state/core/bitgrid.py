@@ -0,0 +1,103 @@
+"""Bitboard helpers for array-backed sector grids.
+
+A grid of ``width`` x ``height`` cells maps cell ``(x, y)`` to bit
+``y * stride + x`` of a Python int, with ``stride = width + 1``. The spare
+column per row is never set, so horizontal shifts cannot wrap between rows
+and whole-grid masks can be combined with plain ``&``/``|``/``~`` and counted
+with ``int.bit_count()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .structures import perimeter_positions
+
+
+def grid_stride(width: int) -> int:
+    return int(width) + 1
+
+
+def cell_bit(x: int, y: int, stride: int) -> int:
+    return 1 << (y * stride + x)
+
+
+def positions_mask(positions: Iterable[tuple[int, int]], stride: int) -> int:
+    bits = 0
+    for x, y in positions:
+        bits |= 1 << (y * stride + x)
+    return bits
+
+
+def iter_positions(bits: int, stride: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(x, y)`` for every set bit, in row-major (y, then x) order."""
+
+    while bits:
+        low = bits & -bits
+        index = low.bit_length() - 1
+        yield index % stride, index // stride
+        bits ^= low
+
+
+def largest_component(bits: int, stride: int) -> int:
+    """Return the size of the largest 4-connected component in ``bits``.
+
+    Components are grown by whole-mask shift-and-mask steps rather than a
+    per-cell BFS, so cost scales with component diameter, not cell count.
+    """
+
+    largest = 0
+    remaining = bits
+    while remaining:
+        if remaining.bit_count() <= largest:
+            break
+        component = remaining & -remaining
+        while True:
+            grown = (
+                component
+                | (component << 1)
+                | (component >> 1)
+                | (component << stride)
+                | (component >> stride)
+            ) & remaining
+            if grown == component:
+                break
+            component = grown
+        largest = max(largest, component.bit_count())
+        remaining &= ~component
+    return largest
+
+
+@dataclass(frozen=True)
+class PerimeterMasks:
+    """Expected perimeter cells for one fortification level, as bitboards."""
+
+    expected: int
+    count: int
+    # Edge name -> (mask, cell count); only edges with expected cells.
+    edges: tuple[tuple[str, int, int], ...]
+
+
+@lru_cache(maxsize=64)
+def perimeter_masks(level: int, width: int, height: int) -> PerimeterMasks:
+    positions = perimeter_positions(level, width, height)
+    stride = grid_stride(width)
+    max_x = width - 1
+    max_y = height - 1
+    edges = []
+    for name, on_edge in (
+        ("LEFT", lambda pos: pos[0] == 0),
+        ("RIGHT", lambda pos: pos[0] == max_x),
+        ("BOTTOM", lambda pos: pos[1] == 0),
+        ("TOP", lambda pos: pos[1] == max_y),
+    ):
+        edge = [pos for pos in positions if on_edge(pos)]
+        if edge:
+            edges.append((name, positions_mask(edge, stride), len(edge)))
+    return PerimeterMasks(
+        expected=positions_mask(positions, stride),
+        count=len(positions),
+        edges=tuple(edges),
+    )
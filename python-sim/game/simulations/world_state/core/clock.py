@@ -0,0 +1,137 @@
+"""Run context controlling pacing and narrative output for world ticks."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from game.simulations.assault.core.events import COMBAT_KINDS, NULL_SINK, CombatSink, RingSink, TeeSink, WriterSink
+
+
+NARRATIVE_SINK_LIMIT = 512
+
+
+@dataclass(frozen=True)
+class NarrativeRecord:
+    """Single narrative line emitted by a simulation subsystem."""
+
+    tick: int
+    channel: str
+    text: str
+    data: Any = None
+
+
+class SimulationClock:
+    """Pacing and narrative policy threaded through ``step_world``.
+
+    Interactive clocks keep the legacy behavior: pacing sleeps run and
+    narrative lines print to stdout. Headless clocks skip every sleep and
+    collect narrative lines as ``NarrativeRecord`` entries in ``records``.
+    Tactical combat text is only formatted into ``records`` when
+    ``record_tactical`` is set (see ``combat_sink``).
+    """
+
+    def __init__(
+        self,
+        *,
+        headless: bool = False,
+        sink_limit: int = NARRATIVE_SINK_LIMIT,
+        record_tactical: bool = False,
+    ):
+        self.headless = bool(headless)
+        self.record_tactical = bool(record_tactical)
+        self.records: deque[NarrativeRecord] = deque(maxlen=max(1, int(sink_limit)))
+
+    def pause(self, seconds: float) -> None:
+        """Sleep for pacing unless the clock is headless."""
+
+        if self.headless or seconds <= 0.0:
+            return
+        time.sleep(seconds)
+
+    def narrate(self, tick: int, channel: str, text: str, data: Any = None) -> None:
+        """Emit a narrative line to stdout or the structured sink."""
+
+        if not self.headless:
+            print(text)
+            return
+        self.records.append(NarrativeRecord(tick=int(tick), channel=channel, text=text, data=data))
+
+    def tactical_writer(self, state):
+        """Return a tactical narration writer bound to this clock, or None for stdout."""
+
+        if not self.headless:
+            return None
+        return lambda text: self.narrate(state.time, "tactical", text)
+
+    def combat_sink(self, state) -> CombatSink | None:
+        """Return the tactical event sink for an assault step, or None for stdout.
+
+        Headless clocks keep unformatted combat events in ``state.combat_log``
+        while ``dev_trace`` is on and record "tactical" lines when
+        ``record_tactical`` is set; with both on, events go to both. With
+        neither, events are dropped unbuilt.
+        """
+
+        if not self.headless:
+            return None
+        sinks: list[CombatSink] = []
+        if state.dev_trace:
+            sinks.append(combat_log(state))
+        if self.record_tactical:
+            sinks.append(WriterSink(self.tactical_writer(state)))
+        if not sinks:
+            return NULL_SINK
+        return sinks[0] if len(sinks) == 1 else TeeSink(*sinks)
+
+    def drain(self, channel: str | None = None) -> list[NarrativeRecord]:
+        """Remove and return collected records, optionally for one channel."""
+
+        if channel is None:
+            drained = list(self.records)
+            self.records.clear()
+            return drained
+        drained = [record for record in self.records if record.channel == channel]
+        kept = [record for record in self.records if record.channel != channel]
+        self.records.clear()
+        self.records.extend(kept)
+        return drained
+
+    def child(self) -> "SimulationClock":
+        """Return a fresh headless clock that inherits this clock's sink policy."""
+
+        return SimulationClock(
+            headless=True,
+            sink_limit=self.records.maxlen or NARRATIVE_SINK_LIMIT,
+            record_tactical=self.headless and self.record_tactical,
+        )
+
+    @contextmanager
+    def capture(self, state) -> Iterator["SimulationClock"]:
+        """Install a headless child clock on ``state`` for the enclosed block.
+
+        Records collected by the child are forwarded to this clock on exit when
+        it is headless too, so nested captures never print to stdout.
+        """
+
+        child = self.child()
+        state.clock = child
+        try:
+            yield child
+        finally:
+            state.clock = self
+            if self.headless:
+                self.records.extend(child.records)
+
+
+def combat_log(state) -> RingSink:
+    """Return ``state``'s combat event ring buffer, creating it on first use."""
+
+    log = getattr(state, "combat_log", None)
+    if log is None:
+        log = state.combat_log = RingSink(kinds=COMBAT_KINDS)
+    return log
@@ -57,6 +57,9 @@ ASSAULT_TIMER_WEAK_DAMAGE_MULT = 5
 
 ASSAULT_DURATION_MIN = 15
 ASSAULT_DURATION_MAX = 30
+ASSAULT_TACTICAL_TICKS_MIN = 5
+ASSAULT_TACTICAL_TICKS_MAX = 12
+ASSAULT_LEDGER_CAPACITY = 2000
 ASSAULT_DAMAGE_PER_TICK = 0.2
 ASSAULT_ALERTNESS_PER_TICK = 0.3
 ASSAULT_THREAT_PER_TICK = 0.1
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from .config import (
     CHAIN_CHANCE,
     CRITICAL_SECTORS,
@@ -27,6 +29,10 @@ class AmbientEvent:
         sector_filter,
         effect,
         chains=None,
+        *,
+        tags=None,
+        min_damage=None,
+        max_power=None,
     ):
         self.key = key
         self.name = name
@@ -37,6 +43,19 @@ class AmbientEvent:
         self.sector_filter = sector_filter
         self.effect = effect
         self.chains = chains or []
+        self.tags = frozenset(tags) if tags else None
+        self.min_damage = min_damage
+        self.max_power = max_power
+
+    def matches_tags(self, sector) -> bool:
+        return not self.tags or _sector_has_any(sector, self.tags)
+
+    def matches_condition(self, sector) -> bool:
+        if self.min_damage is not None and sector.damage < self.min_damage:
+            return False
+        if self.max_power is not None and sector.power > self.max_power:
+            return False
+        return True
 
     def can_trigger(self, state, sector):
         if state.ambient_threat < self.min_threat:
@@ -223,6 +242,7 @@ def _sector_has_any(sector, tags):
 
 
 def _build_sector_filter(tags=None, min_damage=None, max_power=None):
+    # Kept for AmbientEvent.can_trigger callers; selection uses EventTable.
     def _filter(sector):
         if tags and not _sector_has_any(sector, tags):
             return False
@@ -488,6 +508,9 @@ def build_event_catalog(state):
                 sector_filter=sector_filter,
                 effect=archetype["effect"],
                 chains=chains,
+                tags=archetype.get("tags"),
+                min_damage=archetype.get("min_damage"),
+                max_power=archetype.get("max_power"),
             )
         )
 
@@ -495,6 +518,58 @@ def build_event_catalog(state):
     return events
 
 
+class EventTable:
+    """Precompiled (event, sector) pairs for one category.
+
+    Pairs keep the legacy scan order (sector-major, catalog order within a
+    sector). Tag eligibility is resolved once at compile time; damage/power
+    conditions are re-evaluated only when a sector's damage or power changes.
+    """
+
+    __slots__ = ("category", "pairs", "conditional", "_eligible", "_revision")
+
+    def __init__(self, category, pairs):
+        self.category = category
+        self.pairs = pairs
+        self.conditional = any(
+            event.min_damage is not None or event.max_power is not None
+            for event, _sector in pairs
+        )
+        self._eligible = pairs
+        self._revision = None
+
+    def eligible(self, state):
+        if not self.conditional:
+            return self.pairs
+        revision = state.sector_totals.revision
+        if self._revision != revision:
+            self._eligible = [
+                (event, sector)
+                for event, sector in self.pairs
+                if event.matches_condition(sector)
+            ]
+            self._revision = revision
+        return self._eligible
+
+
+def compile_event_tables(state):
+    """Return per-category event tables, rebuilding when the catalog changes."""
+
+    events = build_event_catalog(state)
+    compiled = state.event_tables
+    if compiled is not None and compiled[0] is events:
+        return compiled[1]
+
+    grouped = {}
+    for sector in state.sectors.values():
+        for event in events:
+            if event.matches_tags(sector):
+                grouped.setdefault(event.category, []).append((event, sector))
+    tables = {category: EventTable(category, pairs) for category, pairs in grouped.items()}
+    state.event_tables = (events, tables)
+    return tables
+
+
 def maybe_trigger_event(state):
     update_event_context(state)
     selected = select_ambient_event(state)
@@ -505,9 +580,9 @@ def maybe_trigger_event(state):
     detection_chance = detection_probability(0.7, state)
     detected = state.rng.random() < detection_chance
     if detected:
-        print(f"[Event] {event.name} in {sector.name}")
+        state.clock.narrate(state.time, "event", f"[Event] {event.name} in {sector.name}")
     else:
-        print("[Event] Unattributed signal anomaly")
+        state.clock.narrate(state.time, "event", "[Event] Unattributed signal anomaly")
     event.effect(state, sector)
     sector.last_event = event.name if detected else "Signal anomaly"
     state.event_cooldowns[(event.name, sector.name)] = state.time
@@ -526,7 +601,7 @@ def maybe_trigger_event(state):
     for chained_name in event.chains:
         if state.rng.random() < CHAIN_CHANCE:
             if detected:
-                print(f"  -> Consequence: {chained_name}")
+                state.clock.narrate(state.time, "event", f"  -> Consequence: {chained_name}")
 
 
 def update_event_context(state) -> None:
@@ -542,12 +617,13 @@ def update_event_context(state) -> None:
 def _aggregate_power_percent(state) -> float:
     if not state.sectors:
         return 0.0
-    avg_power = sum(sector.power for sector in state.sectors.values()) / len(state.sectors)
+    avg_power = state.sector_totals.power / len(state.sectors)
     return max(0.0, min(100.0, avg_power * 100.0))
 
 
 def compute_category_weights(state) -> dict[str, float]:
     weights: dict[str, float] = {}
+    low_power = _aggregate_power_percent(state) < 40.0
     for category, config in EVENT_CATEGORIES.items():
         if state.ambient_threat < config["min_threat"]:
             continue
@@ -555,7 +631,7 @@ def compute_category_weights(state) -> dict[str, float]:
 
         if state.ticks_since_assault < 5 and category in {"ENVIRONMENTAL", "QUIET"}:
             weight *= 1.4
-        if _aggregate_power_percent(state) < 40.0 and category == "INFRASTRUCTURE":
+        if low_power and category == "INFRASTRUCTURE":
             weight *= 1.5
         if state.ticks_since_hostile > 25 and category == "RECON":
             weight *= 1.5
@@ -582,7 +658,7 @@ def filter_recent_events(candidates, recent_events):
 
 def select_ambient_event(state):
     candidates = []
-    events = build_event_catalog(state)
+    tables = compile_event_tables(state)
     category_weights = compute_category_weights(state)
     if not category_weights:
         return None
@@ -600,25 +676,33 @@ def select_ambient_event(state):
     category_values = [category_weights[category] for category in categories]
     selected_category = state.rng.choices(categories, weights=category_values, k=1)[0]
 
-    for sector in state.sectors.values():
-        for event in events:
-            if event.category != selected_category:
+    table = tables.get(selected_category)
+    if table is not None:
+        cooldowns = state.event_cooldowns
+        for event, sector in table.eligible(state):
+            if state.ambient_threat < event.min_threat:
                 continue
-            if event.can_trigger(state, sector):
-                candidates.append((event, sector))
+            if state.time - cooldowns[(event.name, sector.name)] < event.cooldown:
+                continue
+            candidates.append((event, sector))
 
     candidates = filter_recent_events(candidates, state.recent_events)
     if not candidates:
         return None
 
-    weighted = []
-    for event, sector in candidates:
+    # Cumulative weights replace the old expanded list. randrange(total) draws
+    # the same _randbelow(total) value rng.choice() did on a list of that
+    # length, so the RNG stream and the selected pair are unchanged.
+    cumulative = []
+    total = 0
+    for event, _sector in candidates:
         weight = int(event.weight)
         if event.key == "power_blackout":
             weight *= blackout_event_weight_multiplier(state)
-        weighted.extend([(event, sector)] * max(1, weight))
+        total += max(1, weight)
+        cumulative.append(total)
 
-    event, sector = state.rng.choice(weighted)
+    event, sector = candidates[bisect_right(cumulative, state.rng.randrange(total))]
     state.recent_events.append(event.name)
     state.last_event_category = selected_category
     return event, sector
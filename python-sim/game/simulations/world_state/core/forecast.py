@@ -0,0 +1,131 @@
+"""What-if lookahead over forked world states."""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import statistics
+
+from game.procgen.engine import mix_seed64
+
+from .clock import SimulationClock
+from .invariants import INVARIANTS_SAMPLED, InvariantPolicy
+from .simulation import step_world
+from .state import GameState
+
+
+FORECAST_DEFAULT_TICKS = 20
+FORECAST_DEFAULT_RUNS = 8
+FORECAST_MAX_TICKS = 500
+FORECAST_MAX_RUNS = 64
+
+
+@dataclass(frozen=True)
+class ForecastOutcome:
+    """End state of one forked future."""
+
+    index: int
+    ticks: int
+    failed: bool
+    failure_reason: str | None
+    assault: bool
+    archive_losses: int
+    damage_delta: float
+    threat: str
+
+
+def _prepare_future(state: GameState, index: int) -> GameState:
+    future = state.fork()
+    # Each future gets its own simulation stream so runs diverge; the stream
+    # depends only on seed, time and index, so forecasts are reproducible.
+    future.sim_rng.seed(mix_seed64(state.seed, "forecast", state.time, index))
+    future.invariants = InvariantPolicy.from_env(default=INVARIANTS_SAMPLED)
+    return future
+
+
+def _run_future(future: GameState, index: int, ticks: int) -> ForecastOutcome:
+    clock = SimulationClock(headless=True, sink_limit=1)
+    start_time = future.time
+    start_damage = future.sector_totals.damage
+    start_losses = future.archive_losses
+    start_assaults = future.assault_count
+    assault = future.current_assault is not None or future.in_major_assault
+    for _ in range(ticks):
+        if future.is_failed:
+            break
+        step_world(future, clock=clock)
+        if future.current_assault is not None or future.in_major_assault:
+            assault = True
+
+    return ForecastOutcome(
+        index=index,
+        ticks=future.time - start_time,
+        failed=bool(future.is_failed),
+        failure_reason=future.failure_reason,
+        assault=assault or future.assault_count > start_assaults,
+        archive_losses=future.archive_losses - start_losses,
+        damage_delta=round(future.sector_totals.damage - start_damage, 4),
+        threat=future.threat_bucket(),
+    )
+
+
+def forecast(
+    state: GameState,
+    *,
+    ticks: int = FORECAST_DEFAULT_TICKS,
+    runs: int = FORECAST_DEFAULT_RUNS,
+    workers: int = 1,
+) -> list[ForecastOutcome]:
+    """Run ``runs`` forked futures of ``ticks`` each; ``state`` is untouched.
+
+    With ``workers > 1`` futures are pickled to a process pool; results are
+    identical to the serial path and returned in index order.
+    """
+
+    ticks = max(1, min(FORECAST_MAX_TICKS, int(ticks)))
+    runs = max(1, min(FORECAST_MAX_RUNS, int(runs)))
+    futures = [_prepare_future(state, index) for index in range(runs)]
+    workers = max(1, min(int(workers), runs))
+    if workers == 1:
+        return [_run_future(future, index, ticks) for index, future in enumerate(futures)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_future, futures, range(runs), [ticks] * runs))
+
+
+def forecast_lines(outcomes: list[ForecastOutcome], ticks: int) -> list[str]:
+    """Summarize forecast outcomes for terminal output."""
+
+    runs = len(outcomes)
+    if runs == 0:
+        return ["FORECAST: NO FUTURES RUN."]
+
+    def _share(count: int) -> str:
+        return f"{count}/{runs} ({count / runs * 100.0:.0f}%)"
+
+    failed = sum(1 for outcome in outcomes if outcome.failed)
+    assaults = sum(1 for outcome in outcomes if outcome.assault)
+    losses = sum(1 for outcome in outcomes if outcome.archive_losses > 0)
+    deltas = [outcome.damage_delta for outcome in outcomes]
+    threats = Counter(outcome.threat for outcome in outcomes)
+
+    lines = [
+        f"FORECAST: {runs} FUTURES x {ticks} TICKS",
+        f"- FAILURE: {_share(failed)}",
+        f"- ASSAULT: {_share(assaults)}",
+        f"- ARCHIVE LOSS: {_share(losses)}",
+        (
+            f"- DAMAGE DELTA: MIN {min(deltas):+.2f} / "
+            f"MED {statistics.median(deltas):+.2f} / MAX {max(deltas):+.2f}"
+        ),
+        "- THREAT: " + " | ".join(
+            f"{bucket} {threats[bucket]}"
+            for bucket in ("LOW", "ELEVATED", "HIGH", "CRITICAL")
+            if threats[bucket]
+        ),
+    ]
+    reasons = Counter(outcome.failure_reason for outcome in outcomes if outcome.failure_reason)
+    for reason, count in sorted(reasons.items(), key=lambda item: (-item[1], item[0])):
+        lines.append(f"- {reason}: {count}")
+    lines.append("PROJECTION ONLY. LIVE STATE UNCHANGED.")
+    return lines
@@ -2,119 +2,84 @@
 
 from __future__ import annotations
 
-from collections import deque
+from dataclasses import dataclass
 
+from game.simulations.world_state.core.bitgrid import largest_component, perimeter_masks
 from game.simulations.world_state.core.state import GameState
-from game.simulations.world_state.core.structures import generate_perimeter_positions
 
 
-def _expected_perimeter_positions(state: GameState, sector_name: str) -> set[tuple[int, int]]:
+@dataclass(frozen=True)
+class PerimeterProfile:
+    """Perimeter WALL metrics for one sector at one fortification level."""
+
+    expected: int
+    present: int
+    continuity: float
+    weakest_segment: float
+
+    @property
+    def coverage(self) -> float:
+        if not self.expected:
+            return 1.0
+        return self.present / float(self.expected)
+
+
+_OPEN_PERIMETER = PerimeterProfile(expected=0, present=0, continuity=1.0, weakest_segment=1.0)
+
+
+def perimeter_profile(state: GameState, sector_name: str) -> PerimeterProfile:
+    """Return perimeter WALL metrics from the sector grid's bitboards.
+
+    Coverage and edge segments are mask intersections; continuity is a
+    shift-and-mask component fill. Results are cached on the grid keyed by
+    fortification level and grid revision, so reads between wall placements
+    or removals are O(1) and grid size only matters on rebuild.
+    """
+
     grid = state.sector_grids.get(sector_name)
     if grid is None:
-        return set()
+        return _OPEN_PERIMETER
     level = int(state.sector_fort_levels.get(sector_name, 0))
-    return generate_perimeter_positions(level, grid.width, grid.height)
+    masks = perimeter_masks(level, grid.width, grid.height)
+    if not masks.count:
+        return _OPEN_PERIMETER
+
+    key = (level, grid.revision)
+    cached = grid.perimeter_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    walls = masks.expected & grid.type_bits_for("WALL")
+    weakest = min(
+        ((walls & mask).bit_count() / float(count) for _name, mask, count in masks.edges),
+        default=1.0,
+    )
+    profile = PerimeterProfile(
+        expected=masks.count,
+        present=walls.bit_count(),
+        continuity=largest_component(walls, grid.stride) / float(masks.count),
+        weakest_segment=weakest,
+    )
+    grid.perimeter_cache = (key, profile)
+    return profile
 
 
 def perimeter_wall_coverage(state: GameState, sector_name: str) -> float:
     """Return [0,1] ratio of expected perimeter cells occupied by WALL structures."""
 
-    expected = _expected_perimeter_positions(state, sector_name)
-    if not expected:
-        return 1.0
-
-    grid = state.sector_grids[sector_name]
-    present = 0
-    for pos in expected:
-        sid = grid.cells[pos].structure_id
-        if sid is None:
-            continue
-        instance = state.structure_instances.get(sid)
-        if instance is None:
-            continue
-        if instance.type == "WALL":
-            present += 1
-    return present / float(len(expected))
+    return perimeter_profile(state, sector_name).coverage
 
 
 def perimeter_wall_continuity(state: GameState, sector_name: str) -> float:
     """Return [0,1] size of largest connected expected WALL cluster."""
 
-    expected = _expected_perimeter_positions(state, sector_name)
-    if not expected:
-        return 1.0
-
-    grid = state.sector_grids[sector_name]
-    walls: set[tuple[int, int]] = set()
-    for pos in expected:
-        sid = grid.cells[pos].structure_id
-        if sid is None:
-            continue
-        instance = state.structure_instances.get(sid)
-        if instance is None:
-            continue
-        if instance.type == "WALL":
-            walls.add(pos)
-
-    if not walls:
-        return 0.0
-
-    visited: set[tuple[int, int]] = set()
-    largest = 0
-    for start in walls:
-        if start in visited:
-            continue
-        q: deque[tuple[int, int]] = deque([start])
-        visited.add(start)
-        size = 0
-        while q:
-            x, y = q.popleft()
-            size += 1
-            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
-                nxt = (nx, ny)
-                if nxt not in walls or nxt in visited:
-                    continue
-                visited.add(nxt)
-                q.append(nxt)
-        largest = max(largest, size)
-
-    return largest / float(len(expected))
+    return perimeter_profile(state, sector_name).continuity
 
 
 def weakest_perimeter_segment(state: GameState, sector_name: str) -> float:
     """Return [0,1] coverage of the weakest perimeter edge segment."""
 
-    expected = _expected_perimeter_positions(state, sector_name)
-    if not expected:
-        return 1.0
-
-    grid = state.sector_grids[sector_name]
-    max_x = grid.width - 1
-    max_y = grid.height - 1
-    edges = {
-        "LEFT": {pos for pos in expected if pos[0] == 0},
-        "RIGHT": {pos for pos in expected if pos[0] == max_x},
-        "BOTTOM": {pos for pos in expected if pos[1] == 0},
-        "TOP": {pos for pos in expected if pos[1] == max_y},
-    }
-
-    edge_scores: list[float] = []
-    for positions in edges.values():
-        if not positions:
-            continue
-        present = 0
-        for pos in positions:
-            sid = grid.cells[pos].structure_id
-            if sid is None:
-                continue
-            instance = state.structure_instances.get(sid)
-            if instance is not None and instance.type == "WALL":
-                present += 1
-        edge_scores.append(present / float(len(positions)))
-
-    if not edge_scores:
-        return 1.0
-    return min(edge_scores)
+    return perimeter_profile(state, sector_name).weakest_segment
 
 
 def topology_damage_multiplier(state: GameState, sector_name: str) -> float:
@@ -124,29 +89,17 @@ def topology_damage_multiplier(state: GameState, sector_name: str) -> float:
     perimeter walls increase pressure.
     """
 
-    expected = _expected_perimeter_positions(state, sector_name)
-    if not expected:
+    profile = perimeter_profile(state, sector_name)
+    if not profile.expected:
         return 1.0
-
-    grid = state.sector_grids[sector_name]
-    has_perimeter_walls = False
-    for pos in expected:
-        sid = grid.cells[pos].structure_id
-        if sid is None:
-            continue
-        instance = state.structure_instances.get(sid)
-        if instance is None:
-            continue
-        if instance.type == "WALL":
-            has_perimeter_walls = True
-            break
-    if not has_perimeter_walls:
+    if not profile.present:
         # Preserve compatibility for pre-grid-fortification saves/tests where
         # numeric fortification exists but no perimeter wall instances are present.
         return 1.0
 
-    coverage = perimeter_wall_coverage(state, sector_name)
-    continuity = perimeter_wall_continuity(state, sector_name)
-    weakest_segment = weakest_perimeter_segment(state, sector_name)
-    score = (coverage * 0.45) + (continuity * 0.35) + (weakest_segment * 0.20)
+    score = (
+        (profile.coverage * 0.45)
+        + (profile.continuity * 0.35)
+        + (profile.weakest_segment * 0.20)
+    )
     return max(0.85, min(1.15, 1.15 - (0.30 * score)))
@@ -37,8 +37,7 @@ def apply_sector_fortification_layout(state: GameState, sector_name: str, level:
         state.remove_structure_instance(sid)
 
     for x, y in sorted(desired):
-        cell = grid.cells[(x, y)]
-        existing_id = cell.structure_id
+        existing_id = grid.structure_id_at(x, y)
         if existing_id is not None:
             existing = state.structure_instances.get(existing_id)
             if (
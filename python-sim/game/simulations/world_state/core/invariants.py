@@ -1,7 +1,25 @@
-"""Centralized runtime invariants for world-state sessions."""
+"""Centralized runtime invariants for world-state sessions.
+
+Checks are split into cheap O(1) guards, structural walks over sectors,
+relays, inventory and the structure grid, and an audit that recomputes every
+maintained aggregate from scratch. ``check_invariants`` applies the state's
+``InvariantPolicy``: ``off`` runs nothing, ``sampled`` runs the guards every
+call and the structural checks once every ``sample_interval`` ticks, ``full``
+(the default) runs guards and structural checks every call, and ``audit``
+adds the aggregate audit on top. Servers, sweeps and forecasts opt down to
+``sampled``. ``validate_state_invariants`` always runs
+every check.
+"""
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import os
+import warnings
+
+from .aggregates import verify_aggregates
 from .config import (
     COMMAND_CENTER_LOCATION,
     FIELD_ACTION_IDLE,
@@ -16,7 +34,18 @@ from .structures import STRUCTURE_TYPES
 from .tasks import task_type
 
 
-def validate_state_invariants(state) -> None:
+INVARIANTS_OFF = "off"
+INVARIANTS_SAMPLED = "sampled"
+INVARIANTS_FULL = "full"
+INVARIANTS_AUDIT = "audit"
+INVARIANT_LEVELS = (INVARIANTS_OFF, INVARIANTS_SAMPLED, INVARIANTS_FULL, INVARIANTS_AUDIT)
+DEFAULT_INVARIANT_LEVEL = INVARIANTS_FULL
+INVARIANT_LEVEL_ENV = "WORLD_STATE_INVARIANTS"
+INVARIANT_SAMPLE_ENV = "WORLD_STATE_INVARIANT_SAMPLE"
+DEFAULT_INVARIANT_SAMPLE_INTERVAL = 50
+
+
+def _check_tasks(state) -> None:
     if state.active_task and len(state.active_repairs) > 0:
         raise AssertionError("Active task and repair cannot run simultaneously.")
 
@@ -40,16 +69,11 @@ def validate_state_invariants(state) -> None:
     if state.in_command_mode() and state.player_location != COMMAND_CENTER_LOCATION:
         raise AssertionError("COMMAND mode must be located at COMMAND.")
 
+
+def _check_policies(state) -> None:
     if normalize_doctrine(state.defense_doctrine) is None:
         raise AssertionError("Invalid defense_doctrine value.")
 
-    allocation_values = [float(state.defense_allocation.get(key, 0.0)) for key in ALLOCATION_KEYS]
-    if any(value <= 0.0 for value in allocation_values):
-        raise AssertionError("Defense allocation weights must be positive.")
-    allocation_mean = sum(allocation_values) / len(ALLOCATION_KEYS)
-    if abs(allocation_mean - 1.0) > 0.05:
-        raise AssertionError("Defense allocation weights must normalize to mean 1.0.")
-
     policy_values = (
         int(state.policies.repair_intensity),
         int(state.policies.defense_readiness),
@@ -58,6 +82,33 @@ def validate_state_invariants(state) -> None:
     if any(value < POLICY_LEVEL_MIN or value > POLICY_LEVEL_MAX for value in policy_values):
         raise AssertionError("Policy levels must stay in [0,4].")
 
+    if str(getattr(state, "drone_perimeter_repair_policy", "AUTO")).upper() not in {"AUTO", "OFF"}:
+        raise AssertionError("drone_perimeter_repair_policy must be AUTO or OFF.")
+
+
+def _check_stocks(state) -> None:
+    if int(state.repair_drone_stock) < 0 or int(state.turret_ammo_stock) < 0:
+        raise AssertionError("Stock values must be non-negative.")
+
+    if int(state.relay_packets_pending) < 0:
+        raise AssertionError("Relay packet count must be non-negative.")
+
+    if float(state.logistics_throughput) <= 0.0:
+        raise AssertionError("Logistics throughput must be positive.")
+    if float(state.logistics_load) < 0.0:
+        raise AssertionError("Logistics load must be non-negative.")
+    if float(state.logistics_multiplier) <= 0.0:
+        raise AssertionError("Logistics multiplier must be positive.")
+
+
+def _check_allocations(state) -> None:
+    allocation_values = [float(state.defense_allocation.get(key, 0.0)) for key in ALLOCATION_KEYS]
+    if any(value <= 0.0 for value in allocation_values):
+        raise AssertionError("Defense allocation weights must be positive.")
+    allocation_mean = sum(allocation_values) / len(ALLOCATION_KEYS)
+    if abs(allocation_mean - 1.0) > 0.05:
+        raise AssertionError("Defense allocation weights must normalize to mean 1.0.")
+
     for category in FAB_CATEGORIES:
         level = int(state.fab_allocation.get(category, -1))
         if level < POLICY_LEVEL_MIN or level > POLICY_LEVEL_MAX:
@@ -65,6 +116,8 @@ def validate_state_invariants(state) -> None:
         if float(state.ambient_fab_progress.get(category, -1.0)) < 0.0:
             raise AssertionError("Ambient fabrication progress must be non-negative.")
 
+
+def _check_fortification(state) -> None:
     for sector_name in state.sectors:
         fort_level = int(state.sector_fort_levels.get(sector_name, -1))
         if fort_level < POLICY_LEVEL_MIN or fort_level > POLICY_LEVEL_MAX:
@@ -74,15 +127,12 @@ def validate_state_invariants(state) -> None:
         if fort_level < POLICY_LEVEL_MIN or fort_level > POLICY_LEVEL_MAX:
             raise AssertionError("Transit fortification levels must stay in [0,4].")
 
+
+def _check_inventory(state) -> None:
     for key in ("SCRAP", "COMPONENTS", "ASSEMBLIES", "MODULES"):
         if int(state.inventory.get(key, -1)) < 0:
             raise AssertionError("Inventory values must be non-negative.")
 
-    if int(state.repair_drone_stock) < 0 or int(state.turret_ammo_stock) < 0:
-        raise AssertionError("Stock values must be non-negative.")
-
-    if int(state.relay_packets_pending) < 0:
-        raise AssertionError("Relay packet count must be non-negative.")
     for relay in state.relay_nodes.values():
         status = str(relay.get("status", "UNKNOWN")).upper()
         if status not in RELAY_STATUSES:
@@ -91,15 +141,8 @@ def validate_state_invariants(state) -> None:
         if stability < 0.0 or stability > 100.0:
             raise AssertionError("Relay stability must stay in [0,100].")
 
-    if float(state.logistics_throughput) <= 0.0:
-        raise AssertionError("Logistics throughput must be positive.")
-    if float(state.logistics_load) < 0.0:
-        raise AssertionError("Logistics load must be non-negative.")
-    if float(state.logistics_multiplier) <= 0.0:
-        raise AssertionError("Logistics multiplier must be positive.")
-    if str(getattr(state, "drone_perimeter_repair_policy", "AUTO")).upper() not in {"AUTO", "OFF"}:
-        raise AssertionError("drone_perimeter_repair_policy must be AUTO or OFF.")
 
+def _check_structures(state) -> None:
     max_instance_id = 0
     seen_positions: set[tuple[str, tuple[int, int]]] = set()
     for sid, instance in state.structure_instances.items():
@@ -121,10 +164,10 @@ def validate_state_invariants(state) -> None:
             raise AssertionError("Duplicate structure instance grid position detected.")
         seen_positions.add(key)
 
-        cell = grid.cells[(x, y)]
-        if cell.structure_id != sid:
+        if grid.structure_id_at(x, y) != sid:
             raise AssertionError("Grid cell id does not match structure instance.")
-        if cell.blocked != bool(STRUCTURE_TYPES[instance.type].get("blocks", False)):
+        blocked = bool(grid.blocked_flags[grid.index(x, y)])
+        if blocked != bool(STRUCTURE_TYPES[instance.type].get("blocks", False)):
             raise AssertionError("Grid blocked flag does not match structure type.")
 
         if sid.startswith("S") and sid[1:].isdigit():
@@ -133,12 +176,8 @@ def validate_state_invariants(state) -> None:
     for sector_name, grid in state.sector_grids.items():
         if sector_name not in state.sectors:
             raise AssertionError("Grid exists for unknown sector.")
-        for (x, y), cell in grid.cells.items():
-            if not grid.in_bounds(x, y):
-                raise AssertionError("Grid cell key is out of bounds.")
-            if cell.structure_id is None:
-                continue
-            instance = state.structure_instances.get(cell.structure_id)
+        for (x, y), sid in grid.occupied():
+            instance = state.structure_instances.get(sid)
             if instance is None:
                 raise AssertionError("Grid references missing structure instance.")
             if instance.sector != sector_name or instance.position != (x, y):
@@ -146,3 +185,105 @@ def validate_state_invariants(state) -> None:
 
     if int(state.next_structure_id) <= max_instance_id:
         raise AssertionError("next_structure_id must be greater than all allocated IDs.")
+
+
+GUARD_CHECKS: tuple[tuple[str, Callable], ...] = (
+    ("tasks", _check_tasks),
+    ("policies", _check_policies),
+    ("stocks", _check_stocks),
+)
+STRUCTURAL_CHECKS: tuple[tuple[str, Callable], ...] = (
+    ("allocations", _check_allocations),
+    ("fortification", _check_fortification),
+    ("inventory", _check_inventory),
+    ("structures", _check_structures),
+)
+AUDIT_CHECKS: tuple[tuple[str, Callable], ...] = (
+    ("aggregates", verify_aggregates),
+)
+
+
+@dataclass
+class InvariantPolicy:
+    """Per-state invariant level plus counters of checks run and failed."""
+
+    level: str = DEFAULT_INVARIANT_LEVEL
+    sample_interval: int = DEFAULT_INVARIANT_SAMPLE_INTERVAL
+    runs: Counter = field(default_factory=Counter)
+    failures: Counter = field(default_factory=Counter)
+    last_structural_tick: int | None = None
+
+    def __post_init__(self) -> None:
+        self.level = str(self.level).strip().lower()
+        if self.level not in INVARIANT_LEVELS:
+            raise ValueError(f"Unknown invariant level {self.level!r}.")
+        self.sample_interval = max(1, int(self.sample_interval))
+
+    @classmethod
+    def from_env(cls, default: str = DEFAULT_INVARIANT_LEVEL) -> "InvariantPolicy":
+        """Build a policy from the environment, falling back to ``default``.
+
+        Invalid environment values warn and fall back instead of raising, so a
+        typo cannot make every ``GameState()`` fail.
+        """
+
+        level = os.getenv(INVARIANT_LEVEL_ENV, default)
+        if str(level).strip().lower() not in INVARIANT_LEVELS:
+            warnings.warn(
+                f"Ignoring {INVARIANT_LEVEL_ENV}={level!r}; expected one of {', '.join(INVARIANT_LEVELS)}.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            level = default
+        interval = os.getenv(INVARIANT_SAMPLE_ENV, str(DEFAULT_INVARIANT_SAMPLE_INTERVAL))
+        try:
+            sample_interval = int(interval)
+        except ValueError:
+            warnings.warn(
+                f"Ignoring {INVARIANT_SAMPLE_ENV}={interval!r}; expected an integer.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            sample_interval = DEFAULT_INVARIANT_SAMPLE_INTERVAL
+        return cls(level=level, sample_interval=sample_interval)
+
+    def report(self) -> dict[str, dict[str, int]]:
+        """Return ``{check: {"runs": n, "failures": n}}`` for every known check."""
+
+        return {
+            name: {"runs": self.runs[name], "failures": self.failures[name]}
+            for name, _check in GUARD_CHECKS + STRUCTURAL_CHECKS + AUDIT_CHECKS
+        }
+
+
+def _run_checks(state, checks, policy: InvariantPolicy) -> None:
+    for name, check in checks:
+        policy.runs[name] += 1
+        try:
+            check(state)
+        except AssertionError:
+            policy.failures[name] += 1
+            raise
+
+
+def check_invariants(state) -> None:
+    """Run the invariant checks selected by ``state.invariants``."""
+
+    policy = state.invariants
+    if policy.level == INVARIANTS_OFF:
+        return
+    _run_checks(state, GUARD_CHECKS, policy)
+    if policy.level == INVARIANTS_SAMPLED:
+        last = policy.last_structural_tick
+        if last is not None and state.time - last < policy.sample_interval:
+            return
+    policy.last_structural_tick = state.time
+    _run_checks(state, STRUCTURAL_CHECKS, policy)
+    if policy.level == INVARIANTS_AUDIT:
+        _run_checks(state, AUDIT_CHECKS, policy)
+
+
+def validate_state_invariants(state) -> None:
+    """Run every invariant check regardless of the state's policy."""
+
+    _run_checks(state, GUARD_CHECKS + STRUCTURAL_CHECKS + AUDIT_CHECKS, state.invariants)
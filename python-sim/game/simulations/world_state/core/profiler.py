@@ -0,0 +1,143 @@
+"""Per-phase wall-time profiler for ``step_world``."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import time
+from typing import Any, Callable
+
+
+PROFILER_DEFAULT_CAPACITY = 512
+PROFILER_MAX_CAPACITY = 65536
+TICK_PHASES = (
+    "advance_time",
+    "tick_relays",
+    "compute_power_load",
+    "update_logistics",
+    "maybe_trigger_event",
+    "resolve_assault",
+    "advance_assaults",
+    "maybe_spawn_assault",
+    "tick_repairs",
+    "tick_fabrication",
+    "apply_wear",
+    "refresh_comms_fidelity",
+    "check_invariants",
+    "check_failure",
+)
+
+
+@dataclass(frozen=True)
+class TickTiming:
+    """Phase wall times (seconds) for one profiled tick."""
+
+    tick: int
+    phases: dict[str, float]
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+def _p95(samples: list[float]) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[round((len(ordered) - 1) * 0.95)]
+
+
+def run_phase(_name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Unprofiled phase runner used by ``step_world`` when no profiler is set."""
+
+    return fn(*args, **kwargs)
+
+
+class TickProfiler:
+    """Records per-phase wall time and call counts for each tick.
+
+    The last ``capacity`` ticks are kept in a ring buffer for windowed
+    statistics; lifetime call counts and total seconds are kept per phase.
+    """
+
+    def __init__(self, capacity: int = PROFILER_DEFAULT_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self.ticks: deque[TickTiming] = deque(maxlen=self.capacity)
+        self.calls: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+        self._current: dict[str, float] | None = None
+        self._tick = 0
+
+    def begin_tick(self, tick: int) -> None:
+        self._tick = int(tick)
+        self._current = {}
+
+    def end_tick(self) -> None:
+        if self._current is not None:
+            self.ticks.append(TickTiming(tick=self._tick, phases=self._current))
+        self._current = None
+
+    def phase(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn`` and charge its wall time to phase ``name``."""
+
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+            if self._current is not None:
+                self._current[name] = self._current.get(name, 0.0) + elapsed
+
+    def reset(self) -> None:
+        self.ticks.clear()
+        self.calls.clear()
+        self.seconds.clear()
+        self._current = None
+
+    def summary(self) -> dict[str, Any]:
+        """Return JSON-ready lifetime totals and windowed per-phase stats (ms)."""
+
+        window = list(self.ticks)
+        phases = {}
+        for name in TICK_PHASES:
+            if name not in self.calls:
+                continue
+            samples = [timing.phases[name] * 1000.0 for timing in window if name in timing.phases]
+            phases[name] = {
+                "calls": self.calls[name],
+                "total_ms": round(self.seconds[name] * 1000.0, 4),
+                "window_ms": round(sum(samples), 4),
+                "mean_ms": round(sum(samples) / len(samples), 4) if samples else 0.0,
+                "p95_ms": round(_p95(samples), 4),
+                "max_ms": round(max(samples), 4) if samples else 0.0,
+            }
+        totals = [timing.total * 1000.0 for timing in window]
+        return {
+            "window": len(window),
+            "capacity": self.capacity,
+            "tick_range": [window[0].tick, window[-1].tick] if window else None,
+            "tick_mean_ms": round(sum(totals) / len(totals), 4) if totals else 0.0,
+            "tick_p95_ms": round(_p95(totals), 4),
+            "tick_max_ms": round(max(totals), 4) if totals else 0.0,
+            "phases": phases,
+        }
+
+    def summary_lines(self) -> list[str]:
+        """Render the summary as a fixed-width table for terminal output."""
+
+        summary = self.summary()
+        lines = [
+            f"TICKS: {summary['window']}  MEAN {summary['tick_mean_ms']:.3f} ms  "
+            f"P95 {summary['tick_p95_ms']:.3f} ms  MAX {summary['tick_max_ms']:.3f} ms",
+            f"{'PHASE':<24}{'CALLS':>8}{'MEAN ms':>10}{'P95 ms':>10}{'MAX ms':>10}{'SHARE':>8}",
+        ]
+        window_total = sum(stats["window_ms"] for stats in summary["phases"].values())
+        for name, stats in summary["phases"].items():
+            share = (stats["window_ms"] / window_total * 100.0) if window_total else 0.0
+            lines.append(
+                f"{name:<24}{stats['calls']:>8}{stats['mean_ms']:>10.3f}"
+                f"{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}{share:>7.1f}%"
+            )
+        return lines
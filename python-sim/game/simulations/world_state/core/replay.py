@@ -0,0 +1,263 @@
+"""Deterministic replay log with keyframes and a seekable timeline."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import pickle
+from pathlib import Path
+import zlib
+
+from .clock import SimulationClock
+from .simulation import step_world
+from .state import GameState
+
+
+REPLAY_KEYFRAME_INTERVAL = 250
+REPLAY_LOG_VERSION = 2
+REPLAY_FORMAT = "custodian-replay"
+
+
+@dataclass(frozen=True)
+class ReplayCommand:
+    """One operator command: the tick it was issued at and the tick it ended at."""
+
+    tick: int
+    end_tick: int
+    raw: str
+
+
+@dataclass(frozen=True)
+class ReplayKeyframe:
+    """Exact state at ``tick``, taken after the first ``command_index`` commands."""
+
+    tick: int
+    command_index: int
+    blob: bytes
+
+
+@dataclass
+class ReplayLog:
+    """Command log plus keyframes for one run (one seed, no RESET in between)."""
+
+    seed: int
+    text_seed: int
+    keyframe_interval: int
+    commands: list[ReplayCommand] = field(default_factory=list)
+    keyframes: list[ReplayKeyframe] = field(default_factory=list)
+    last_tick: int = 0
+    version: int = REPLAY_LOG_VERSION
+
+
+def freeze_state(state: GameState) -> bytes:
+    """Return an exact, compressed copy of ``state`` (RNG streams included)."""
+
+    return zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def thaw_state(blob: bytes) -> GameState:
+    """Rebuild a state from ``freeze_state`` output with a headless clock."""
+
+    state = pickle.loads(zlib.decompress(blob))
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+class ReplayRecorder:
+    """Records operator commands and periodic keyframes for a live state.
+
+    ``process_command`` and ``step_world`` report to the recorder installed on
+    ``state.replay_recorder``. Ticks run inside a command (WAIT, DEBUG TICK)
+    belong to that command; only ticks stepped outside any command are
+    replayed as bare ``step_world`` calls. Keyframes are pickled states (RNG
+    streams included) taken on command/tick boundaries once at least
+    ``keyframe_interval`` ticks have passed, so ``seek`` re-simulates at most
+    that many ticks plus the length of one command.
+    """
+
+    def __init__(self, *, keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL):
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.log: ReplayLog | None = None
+        self._depth = 0
+        self._pending: tuple[int, str] | None = None
+
+    def attach(self, state: GameState) -> None:
+        state.replay_recorder = self
+        self._start(state)
+
+    def detach(self, state: GameState) -> None:
+        if state.replay_recorder is self:
+            state.replay_recorder = None
+
+    def _start(self, state: GameState) -> None:
+        self.log = ReplayLog(
+            seed=int(state.seed),
+            text_seed=int(state.text_seed),
+            keyframe_interval=self.keyframe_interval,
+            last_tick=int(state.time),
+        )
+        self._keyframe(state)
+
+    def _keyframe(self, state: GameState) -> None:
+        self.log.keyframes.append(
+            ReplayKeyframe(
+                tick=int(state.time),
+                command_index=len(self.log.commands),
+                blob=freeze_state(state),
+            )
+        )
+
+    def _boundary(self, state: GameState) -> None:
+        self.log.last_tick = int(state.time)
+        if state.time - self.log.keyframes[-1].tick >= self.keyframe_interval:
+            self._keyframe(state)
+
+    def begin_command(self, state: GameState, raw: str) -> None:
+        self._depth += 1
+        if self._depth == 1:
+            self._pending = (int(state.time), str(raw))
+
+    def end_command(self, state: GameState) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        tick, raw = self._pending
+        self._pending = None
+        if state.seed != self.log.seed or state.time < tick:
+            # RESET/REBOOT replaced the run; the new session starts a new log.
+            self._start(state)
+            return
+        self.log.commands.append(ReplayCommand(tick=tick, end_tick=int(state.time), raw=raw))
+        self._boundary(state)
+
+    def on_tick(self, state: GameState) -> None:
+        if not self._depth:
+            self._boundary(state)
+
+    def seek(self, tick: int) -> GameState:
+        return seek(self.log, tick)
+
+    def save(self, path: str | Path) -> None:
+        save_replay(self.log, path)
+
+
+def seek(log: ReplayLog, tick: int) -> GameState:
+    """Rebuild the recorded state at ``tick`` from the nearest earlier keyframe.
+
+    Commands are replayed whole. If ``tick`` falls inside a multi-tick command
+    the returned state sits at that command's start tick, the last boundary
+    the log can reproduce exactly.
+    """
+
+    from game.simulations.world_state.terminal.processor import process_command
+
+    tick = int(tick)
+    first = log.keyframes[0].tick
+    if tick < first or tick > log.last_tick:
+        raise ValueError(f"Tick {tick} outside recorded range {first}..{log.last_tick}.")
+
+    keyframe = log.keyframes[0]
+    for candidate in log.keyframes:
+        if candidate.tick > tick:
+            break
+        keyframe = candidate
+    state = thaw_state(keyframe.blob)
+
+    for command in log.commands[keyframe.command_index:]:
+        if command.tick > tick:
+            break
+        _step_to(state, command.tick)
+        if command.end_tick > tick:
+            return state
+        process_command(state, command.raw)
+    _step_to(state, tick)
+    return state
+
+
+def _step_to(state: GameState, tick: int) -> None:
+    while state.time < tick and not state.is_failed:
+        step_world(state)
+
+
+def _fresh_state(seed: int, text_seed: int) -> GameState:
+    state = GameState(seed=seed, text_seed=text_seed)
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+def _fingerprint(state: GameState) -> tuple:
+    return state.time, state.snapshot(), state.sim_rng.getstate(), state.text_rng.getstate()
+
+
+def encode_replay(log: ReplayLog) -> bytes:
+    """Serialize ``log`` as JSON: seed, text seed and the command list.
+
+    Keyframes stay out of the document (they are pickled states, and replay
+    files get shared), so only runs recorded from a fresh seed can be encoded.
+    """
+
+    first = log.keyframes[0]
+    if (
+        first.tick != 0
+        or first.command_index
+        or _fingerprint(thaw_state(first.blob)) != _fingerprint(_fresh_state(log.seed, log.text_seed))
+    ):
+        raise ValueError("Only replays recorded from a fresh seed can be exported.")
+    document = {
+        "format": REPLAY_FORMAT,
+        "version": REPLAY_LOG_VERSION,
+        "seed": log.seed,
+        "text_seed": log.text_seed,
+        "keyframe_interval": log.keyframe_interval,
+        "last_tick": log.last_tick,
+        "commands": [[command.tick, command.end_tick, command.raw] for command in log.commands],
+    }
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def decode_replay(data: bytes) -> ReplayLog:
+    """Rebuild a log from ``encode_replay`` output by re-running it from its seed.
+
+    Keyframes are regenerated on the way, and the rerun must reproduce every
+    recorded command boundary or the log is rejected.
+    """
+
+    from game.simulations.world_state.terminal.processor import process_command
+
+    try:
+        document = json.loads(data)
+    except ValueError as exc:
+        raise ValueError("Not a replay log.") from exc
+    if not isinstance(document, dict) or document.get("format") != REPLAY_FORMAT:
+        raise ValueError("Not a replay log.")
+    if document.get("version") != REPLAY_LOG_VERSION:
+        raise ValueError(f"Unsupported replay log version {document.get('version')}.")
+    try:
+        seed = int(document["seed"])
+        text_seed = int(document["text_seed"])
+        last_tick = int(document["last_tick"])
+        commands = [
+            ReplayCommand(tick=int(tick), end_tick=int(end_tick), raw=str(raw))
+            for tick, end_tick, raw in document["commands"]
+        ]
+        recorder = ReplayRecorder(keyframe_interval=int(document["keyframe_interval"]))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Malformed replay log.") from exc
+
+    state = _fresh_state(seed, text_seed)
+    recorder.attach(state)
+    for command in commands:
+        _step_to(state, command.tick)
+        process_command(state, command.raw)
+    _step_to(state, last_tick)
+    if recorder.log.commands != commands or recorder.log.last_tick != last_tick:
+        raise ValueError("Replay log does not reproduce from its seed.")
+    return recorder.log
+
+
+def save_replay(log: ReplayLog, path: str | Path) -> None:
+    Path(path).write_bytes(encode_replay(log))
+
+
+def load_replay(path: str | Path) -> ReplayLog:
+    return decode_replay(Path(path).read_bytes())
@@ -1,29 +1,39 @@
-import time
-
 from .assaults import advance_assaults, maybe_spawn_assault, resolve_assault
+from .clock import SimulationClock
 from .events import maybe_trigger_event
 from .fabrication import tick_fabrication
-from .invariants import validate_state_invariants
+from .invariants import check_invariants
 from .logistics import update_logistics
 from .power_load import compute_power_load
 from .power import refresh_comms_fidelity
+from .profiler import TickProfiler, run_phase
 from .repairs import tick_repairs
 from .relays import tick_relays
 from .state import GameState, advance_time, check_failure
 from .wear import apply_wear
 
 
-def step_world(state: GameState, tick_delay: float = 0.0) -> bool:
+def step_world(
+    state: GameState,
+    tick_delay: float = 0.0,
+    *,
+    clock: SimulationClock | None = None,
+) -> bool:
     """Advance the world simulation by a single tick.
 
     Args:
         state: Mutable simulation state to advance.
         tick_delay: Delay passed to assault resolution for pacing.
+        clock: Optional run context to install on ``state`` before stepping.
+            Headless clocks skip pacing sleeps and collect narrative output.
 
     Returns:
         True when this step transitions into a terminal failure state.
     """
 
+    if clock is not None:
+        state.clock = clock
+
     if state.is_failed:
         state.last_assault_lines = []
         state.last_structure_loss_lines = []
@@ -38,25 +48,35 @@ def step_world(state: GameState, tick_delay: float = 0.0) -> bool:
     state.last_assault_lines = []
     state.last_structure_loss_lines = []
     state.last_after_action_lines = []
-    advance_time(state)
-    tick_relays(state)
-    compute_power_load(state)
-    update_logistics(state)
-    maybe_trigger_event(state)
+    profiler = state.profiler
+    if profiler is not None:
+        profiler.begin_tick(state.time + 1)
+    phase = profiler.phase if profiler is not None else run_phase
+    phase("advance_time", advance_time, state)
+    phase("tick_relays", tick_relays, state)
+    phase("compute_power_load", compute_power_load, state)
+    phase("update_logistics", update_logistics, state)
+    phase("maybe_trigger_event", maybe_trigger_event, state)
 
     if state.current_assault is not None:
-        resolve_assault(state, tick_delay=tick_delay)
+        phase("resolve_assault", resolve_assault, state, tick_delay=tick_delay)
     else:
-        advance_assaults(state)
-        maybe_spawn_assault(state)
+        phase("advance_assaults", advance_assaults, state)
+        phase("maybe_spawn_assault", maybe_spawn_assault, state)
 
-    state.last_repair_lines = tick_repairs(state)
-    state.last_fabrication_lines = tick_fabrication(state)
-    apply_wear(state)
-    refresh_comms_fidelity(state, emit_event=True)
-    validate_state_invariants(state)
+    state.last_repair_lines = phase("tick_repairs", tick_repairs, state)
+    state.last_fabrication_lines = phase("tick_fabrication", tick_fabrication, state)
+    phase("apply_wear", apply_wear, state)
+    phase("refresh_comms_fidelity", refresh_comms_fidelity, state, emit_event=True)
+    phase("check_invariants", check_invariants, state)
 
-    return check_failure(state)
+    became_failed = phase("check_failure", check_failure, state)
+    state.revision += 1
+    if profiler is not None:
+        profiler.end_tick()
+    if state.replay_recorder is not None:
+        state.replay_recorder.on_tick(state)
+    return became_failed
 
 
 def sandbox_world(
@@ -64,10 +84,24 @@ def sandbox_world(
     tick_delay: float = 0.05,
     seed: int | None = None,
     dev_mode: bool = False,
+    headless: bool = False,
+    profile: bool = False,
 ):
-    """Run the autonomous world simulation loop."""
+    """Run the autonomous world simulation loop.
+
+    Headless runs skip pacing sleeps and keep narrative output off stdout.
+    With ``profile`` set, ``state.profiler`` records per-phase tick timings.
+    """
     state = GameState(seed=seed)
     state.dev_mode = dev_mode
+    if profile:
+        state.profiler = TickProfiler()
+    if headless:
+        state.clock = SimulationClock(headless=True)
+        for _ in range(ticks):
+            step_world(state, tick_delay=tick_delay)
+        return state
+
     print("World simulation started.\n")
     profile = state.faction_profile
     print(
@@ -90,7 +124,7 @@ def sandbox_world(
             print(state)
             print()
 
-        time.sleep(tick_delay)
+        state.clock.pause(tick_delay)
 
     print("\nSimulation ended.\n")
     print(state)
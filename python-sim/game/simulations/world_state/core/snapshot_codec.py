@@ -0,0 +1,362 @@
+"""Compact binary encoding for world-state snapshots and delta checkpoints.
+
+Blobs start with a fixed header (magic, codec version, kind, snapshot schema
+version, tick) followed by a tagged, msgpack-style body. Strings are interned
+per blob, so the repeated keys of structure instances, relays and sectors are
+written once. Delta blobs carry only the snapshot paths that changed since
+the previous checkpoint; decoding always routes through ``migrate_snapshot``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import struct
+from typing import Any, BinaryIO
+import zlib
+
+from .snapshot_migration import migrate_snapshot
+
+
+SNAPSHOT_MAGIC = b"CUSN"
+SNAPSHOT_CODEC_VERSION = 1
+KIND_FULL = 0
+KIND_DELTA = 1
+FLAG_ZLIB = 0x80
+CHECKPOINT_KEYFRAME_INTERVAL = 100
+
+_HEADER = struct.Struct("<4sBBHI")
+_FRAME = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_NEG = 0x04
+_FLOAT = 0x05
+_STR = 0x06
+_STR_REF = 0x07
+_LIST = 0x08
+_DICT = 0x09
+_SMALL_INT = 0x80  # 0x80-0xFF: ints 0..127 inline
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Encoder:
+    __slots__ = ("out", "strings")
+
+    def __init__(self):
+        self.out = bytearray()
+        self.strings: dict[str, int] = {}
+
+    def encode(self, value: Any) -> None:
+        out = self.out
+        kind = type(value)
+        if kind is str:
+            index = self.strings.get(value)
+            if index is not None:
+                out.append(_STR_REF)
+                _write_varint(out, index)
+                return
+            self.strings[value] = len(self.strings)
+            raw = value.encode("utf-8")
+            out.append(_STR)
+            _write_varint(out, len(raw))
+            out += raw
+        elif kind is int:
+            if 0 <= value < 0x80:
+                out.append(_SMALL_INT | value)
+            elif value >= 0:
+                out.append(_INT)
+                _write_varint(out, value)
+            else:
+                out.append(_NEG)
+                _write_varint(out, -value)
+        elif kind is float:
+            out.append(_FLOAT)
+            out += _F64.pack(value)
+        elif value is None:
+            out.append(_NONE)
+        elif kind is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            strings = self.strings
+            encode = self.encode
+            for key, item in value.items():
+                index = strings.get(key) if type(key) is str else None
+                if index is not None and index < 0x80:
+                    out.append(_STR_REF)
+                    out.append(index)
+                else:
+                    encode(key)
+                encode(item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _write_varint(out, len(value))
+            encode = self.encode
+            for item in value:
+                encode(item)
+        elif isinstance(value, int):
+            self.encode(int(value))
+        elif isinstance(value, float):
+            self.encode(float(value))
+        else:
+            # Matches the json.dumps(default=str) fallback used for fingerprints.
+            self.encode(str(value))
+
+
+class _Decoder:
+    __slots__ = ("data", "pos", "strings")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.strings: list[str] = []
+
+    def _varint(self) -> int:
+        data = self.data
+        shift = 0
+        result = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def decode(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag >= _SMALL_INT:
+            return tag & 0x7F
+        if tag == _STR_REF:
+            return self.strings[self._varint()]
+        if tag == _STR:
+            size = self._varint()
+            start = self.pos
+            self.pos += size
+            text = self.data[start:self.pos].decode("utf-8")
+            self.strings.append(text)
+            return text
+        if tag == _DICT:
+            count = self._varint()
+            decode = self.decode
+            result = {}
+            for _ in range(count):
+                key = decode()
+                result[key] = decode()
+            return result
+        if tag == _LIST:
+            return [self.decode() for _ in range(self._varint())]
+        if tag == _FLOAT:
+            start = self.pos
+            self.pos += 8
+            return _F64.unpack_from(self.data, start)[0]
+        if tag == _INT:
+            return self._varint()
+        if tag == _NEG:
+            return -self._varint()
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise ValueError(f"Unknown snapshot codec tag 0x{tag:02x} at offset {self.pos - 1}.")
+
+
+def _pack(kind: int, snapshot_version: int, tick: int, body: Any, compress: bool) -> bytes:
+    encoder = _Encoder()
+    encoder.encode(body)
+    payload = bytes(encoder.out)
+    if compress:
+        payload = zlib.compress(payload, 1)
+        kind |= FLAG_ZLIB
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_CODEC_VERSION,
+        kind,
+        int(snapshot_version),
+        max(0, int(tick)),
+    )
+    return header + payload
+
+
+def read_header(blob: bytes) -> tuple[int, int, int]:
+    """Return ``(kind, snapshot_version, tick)`` after validating the header."""
+
+    if len(blob) < _HEADER.size:
+        raise ValueError("Snapshot blob truncated.")
+    magic, codec_version, kind, snapshot_version, tick = _HEADER.unpack_from(blob)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a snapshot blob.")
+    if codec_version != SNAPSHOT_CODEC_VERSION:
+        raise ValueError(f"Unsupported snapshot codec version {codec_version}.")
+    return kind, snapshot_version, tick
+
+
+def _unpack(blob: bytes) -> tuple[int, int, int, Any]:
+    kind, snapshot_version, tick = read_header(blob)
+    payload = blob[_HEADER.size:]
+    if kind & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return kind & ~FLAG_ZLIB, snapshot_version, tick, _Decoder(payload).decode()
+
+
+def encode_snapshot(snapshot: dict, *, compress: bool = False) -> bytes:
+    """Encode a full ``GameState.snapshot()`` payload."""
+
+    return _pack(
+        KIND_FULL,
+        int(snapshot.get("snapshot_version", 1)),
+        int(snapshot.get("time", 0)),
+        snapshot,
+        compress,
+    )
+
+
+def _diff(previous: dict, current: dict, path: list[Any], ops: list[list[Any]]) -> None:
+    for key, value in current.items():
+        if key in previous:
+            old = previous[key]
+            if type(old) is type(value) and old == value:
+                continue
+            if type(old) is dict and type(value) is dict:
+                _diff(old, value, path + [key], ops)
+                continue
+        ops.append([path + [key], value])
+    for key in previous:
+        if key not in current:
+            ops.append([path + [key]])
+
+
+def snapshot_delta(previous: dict, current: dict) -> list[list[Any]]:
+    """Return ``[path, value]`` set ops and ``[path]`` delete ops."""
+
+    ops: list[list[Any]] = []
+    _diff(previous, current, [], ops)
+    return ops
+
+
+def encode_delta(previous: dict, current: dict, *, compress: bool = False) -> bytes:
+    """Encode only the snapshot paths that changed since ``previous``."""
+
+    return _pack(
+        KIND_DELTA,
+        int(current.get("snapshot_version", 1)),
+        int(current.get("time", 0)),
+        snapshot_delta(previous, current),
+        compress,
+    )
+
+
+def apply_delta_ops(base: dict, ops: list[list[Any]]) -> dict:
+    """Return ``base`` with ``ops`` applied; ``base`` itself is not modified."""
+
+    result = dict(base)
+    copied = {id(result)}
+    for op in ops:
+        path = op[0]
+        node = result
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = {}
+            if id(child) not in copied:
+                child = dict(child)
+                copied.add(id(child))
+            node[key] = child
+            node = child
+        if len(op) == 1:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = op[1]
+    return result
+
+
+def decode_snapshot(blob: bytes, base: dict | None = None) -> dict:
+    """Decode a full or delta blob into a migrated snapshot dict.
+
+    Delta blobs need ``base``: the decoded snapshot of the previous checkpoint.
+    """
+
+    kind, _snapshot_version, _tick, body = _unpack(blob)
+    if kind == KIND_FULL:
+        snapshot = body
+    elif kind == KIND_DELTA:
+        if base is None:
+            raise ValueError("Delta snapshot requires a base snapshot.")
+        snapshot = apply_delta_ops(base, body)
+    else:
+        raise ValueError(f"Unknown snapshot blob kind {kind}.")
+    return migrate_snapshot(snapshot)
+
+
+def decode_chain(blobs: Iterable[bytes]) -> dict:
+    """Replay a keyframe followed by deltas and return the final snapshot."""
+
+    snapshot: dict | None = None
+    for blob in blobs:
+        kind = read_header(blob)[0] & ~FLAG_ZLIB
+        snapshot = decode_snapshot(blob, None if kind == KIND_FULL else snapshot)
+    if snapshot is None:
+        raise ValueError("Empty snapshot chain.")
+    return snapshot
+
+
+class SnapshotCheckpointer:
+    """Autosave helper emitting a keyframe every N checkpoints, deltas between."""
+
+    def __init__(
+        self,
+        *,
+        keyframe_interval: int = CHECKPOINT_KEYFRAME_INTERVAL,
+        compress_keyframes: bool = True,
+    ):
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.compress_keyframes = bool(compress_keyframes)
+        self._previous: dict | None = None
+        self._since_keyframe = 0
+
+    def checkpoint(self, state) -> bytes:
+        snapshot = state.snapshot()
+        if self._previous is None or self._since_keyframe >= self.keyframe_interval:
+            blob = encode_snapshot(snapshot, compress=self.compress_keyframes)
+            self._since_keyframe = 1
+        else:
+            blob = encode_delta(self._previous, snapshot)
+            self._since_keyframe += 1
+        self._previous = snapshot
+        return blob
+
+    def reset(self) -> None:
+        self._previous = None
+        self._since_keyframe = 0
+
+
+def write_frame(handle: BinaryIO, blob: bytes) -> None:
+    handle.write(_FRAME.pack(len(blob)))
+    handle.write(blob)
+
+
+def iter_frames(handle: BinaryIO) -> Iterator[bytes]:
+    while True:
+        prefix = handle.read(_FRAME.size)
+        if not prefix:
+            return
+        if len(prefix) < _FRAME.size:
+            raise ValueError("Snapshot frame header truncated.")
+        (size,) = _FRAME.unpack(prefix)
+        blob = handle.read(size)
+        if len(blob) < size:
+            raise ValueError("Snapshot frame truncated.")
+        yield blob
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 
+CURRENT_SNAPSHOT_VERSION = 7
+
+
 def migrate_snapshot(snapshot: dict) -> dict:
     version = int(snapshot.get("snapshot_version", 1))
     migrated = dict(snapshot)
@@ -1,5 +1,7 @@
 from collections import defaultdict, deque
+from collections.abc import Mapping
 from typing import Any
+import copy
 import json
 import math
 import random
@@ -25,15 +27,20 @@ from .config import (
     SECTOR_DEFS,
     SECTORS,
 )
+from .bitgrid import grid_stride, iter_positions
+from .aggregates import SectorIndexedDict, SectorTotals, StructureInstanceIndex, verify_aggregates
 from .structures import (
     STRUCTURE_TYPES,
     Structure,
     StructureState,
     create_fabrication_structures,
 )
+from .clock import SimulationClock
 from .effects import apply_global_effects, apply_sector_effects
+from .events import build_event_catalog
+from .invariants import InvariantPolicy
 from .factions import build_faction_profile
-from .snapshot_migration import migrate_snapshot
+from .snapshot_migration import CURRENT_SNAPSHOT_VERSION, migrate_snapshot
 from .tasks import task_to_dict
 from .defense import DEFAULT_DEFENSE_ALLOCATION, compute_readiness, normalize_doctrine
 from .assault_ledger import AssaultLedger, AssaultTickRecord, append_record
@@ -44,6 +51,7 @@ from .topology_profiles import select_topology_profile
 
 class SectorState:
     def __init__(self, sector_id: str, name: str):
+        self._totals: SectorTotals | None = None
         self.id = sector_id
         self.name = name
         self.damage = 0.0
@@ -53,6 +61,35 @@ class SectorState:
         self.occupied = False
         self.effects = {}
 
+    @property
+    def damage(self) -> float:
+        return self._damage
+
+    @damage.setter
+    def damage(self, value: float) -> None:
+        self._damage = value
+        if self._totals is not None:
+            self._totals.invalidate_damage()
+
+    @property
+    def power(self) -> float:
+        return self._power
+
+    @power.setter
+    def power(self, value: float) -> None:
+        self._power = value
+        if self._totals is not None:
+            self._totals.invalidate_power()
+
+    def copy(self) -> "SectorState":
+        """Return a detached copy (not wired to any ``SectorTotals``)."""
+
+        clone = SectorState.__new__(SectorState)
+        clone.__dict__.update(self.__dict__)
+        clone._totals = None
+        clone.effects = {key: dict(value) for key, value in self.effects.items()}
+        return clone
+
     def status_label(self) -> str:
         """Map sector metrics to one-word status label."""
 
@@ -76,27 +113,169 @@ class SectorState:
         )
 
 
+# Per-cell structure type codes; 0 is empty. Legacy ``grid.cells[pos]``
+# writes resolve the type through ``SectorGrid.registry``; ids it does not
+# know carry UNTYPED_CODE.
+STRUCTURE_CODES = {name: index + 1 for index, name in enumerate(STRUCTURE_TYPES)}
+UNTYPED_CODE = 255
+
+
 class GridCell:
-    __slots__ = ("structure_id", "blocked")
+    """Write-through view of one cell of an array-backed ``SectorGrid``."""
+
+    __slots__ = ("_grid", "_x", "_y")
+
+    def __init__(self, grid: "SectorGrid", x: int, y: int):
+        self._grid = grid
+        self._x = x
+        self._y = y
+
+    @property
+    def structure_id(self) -> str | None:
+        return self._grid.structure_id_at(self._x, self._y)
+
+    @structure_id.setter
+    def structure_id(self, sid: str | None) -> None:
+        grid = self._grid
+        if sid is None:
+            grid.clear(self._x, self._y)
+            return
+        instance = grid.registry.get(sid) if grid.registry is not None else None
+        structure_type = instance.type if instance is not None else None
+        grid.set_structure(self._x, self._y, sid, structure_type, self.blocked)
+
+    @property
+    def blocked(self) -> bool:
+        return bool(self._grid.blocked_flags[self._grid.index(self._x, self._y)])
 
-    def __init__(self):
-        self.structure_id: str | None = None
-        self.blocked = False
+    @blocked.setter
+    def blocked(self, value: bool) -> None:
+        grid = self._grid
+        grid.blocked_flags[grid.index(self._x, self._y)] = 1 if value else 0
+
+
+class GridCells(Mapping):
+    """``(x, y) -> GridCell`` compatibility mapping over a ``SectorGrid``."""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: "SectorGrid"):
+        self._grid = grid
+
+    def __getitem__(self, pos: tuple[int, int]) -> GridCell:
+        x, y = pos
+        if not self._grid.in_bounds(x, y):
+            raise KeyError(pos)
+        return GridCell(self._grid, x, y)
+
+    def __iter__(self):
+        for x in range(self._grid.width):
+            for y in range(self._grid.height):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return self._grid.width * self._grid.height
+
+    def __contains__(self, pos: object) -> bool:
+        return (
+            isinstance(pos, tuple)
+            and len(pos) == 2
+            and self._grid.in_bounds(*pos)
+        )
 
 
 class SectorGrid:
+    """Flat array-backed occupancy grid for one sector.
+
+    Cells live in row-major arrays (structure ids, type codes, blocked flags)
+    alongside per-type bitboards (see ``bitgrid``) that perimeter and
+    topology queries combine with whole-grid mask operations.
+    """
+
     def __init__(self, width: int, height: int):
         self.width = int(width)
         self.height = int(height)
-        self.cells = {
-            (x, y): GridCell()
-            for x in range(self.width)
-            for y in range(self.height)
-        }
+        self.stride = grid_stride(self.width)
+        size = self.width * self.height
+        self.structure_ids: list[str | None] = [None] * size
+        self.type_codes = bytearray(size)
+        self.blocked_flags = bytearray(size)
+        self.type_bits: dict[int, int] = {}
+        self.occupied_bits = 0
+        # Bumped on every write; derived views cache against it.
+        self.revision = 0
+        self.perimeter_cache: tuple[Any, Any] | None = None
+        # Owning state's structure instances, bound by GameState.
+        self.registry: Mapping[str, Any] | None = None
+
+    @property
+    def cells(self) -> GridCells:
+        return GridCells(self)
 
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def structure_id_at(self, x: int, y: int) -> str | None:
+        return self.structure_ids[y * self.width + x]
+
+    def type_bits_for(self, structure_type: str) -> int:
+        return self.type_bits.get(STRUCTURE_CODES.get(structure_type, UNTYPED_CODE), 0)
+
+    def set_structure(
+        self,
+        x: int,
+        y: int,
+        sid: str,
+        structure_type: str | None,
+        blocked: bool,
+    ) -> None:
+        self.clear(x, y)
+        index = y * self.width + x
+        code = STRUCTURE_CODES.get(structure_type, UNTYPED_CODE) if structure_type else UNTYPED_CODE
+        bit = 1 << (y * self.stride + x)
+        self.structure_ids[index] = sid
+        self.type_codes[index] = code
+        self.blocked_flags[index] = 1 if blocked else 0
+        self.type_bits[code] = self.type_bits.get(code, 0) | bit
+        self.occupied_bits |= bit
+        self.revision += 1
+
+    def clear(self, x: int, y: int) -> None:
+        index = y * self.width + x
+        code = self.type_codes[index]
+        if self.structure_ids[index] is None and not code and not self.blocked_flags[index]:
+            return
+        bit = 1 << (y * self.stride + x)
+        if code:
+            self.type_bits[code] &= ~bit
+        self.structure_ids[index] = None
+        self.type_codes[index] = 0
+        self.blocked_flags[index] = 0
+        self.occupied_bits &= ~bit
+        self.revision += 1
+
+    def occupied(self) -> list[tuple[tuple[int, int], str]]:
+        """Return ``((x, y), sid)`` for occupied cells, x-major like ``cells``."""
+
+        width = self.width
+        ids = self.structure_ids
+        return [
+            (pos, ids[pos[1] * width + pos[0]])
+            for pos in sorted(iter_positions(self.occupied_bits, self.stride))
+        ]
+
+    def copy(self) -> "SectorGrid":
+        clone = SectorGrid.__new__(SectorGrid)
+        clone.__dict__.update(self.__dict__)
+        clone.structure_ids = list(self.structure_ids)
+        clone.type_codes = bytearray(self.type_codes)
+        clone.blocked_flags = bytearray(self.blocked_flags)
+        clone.type_bits = dict(self.type_bits)
+        return clone
+
 
 class StructureInstance:
     __slots__ = ("id", "type", "sector", "position", "hp", "max_hp", "subtype")
@@ -119,6 +298,12 @@ class StructureInstance:
         self.max_hp = int(max_hp)
         self.subtype = subtype
 
+    def copy(self) -> "StructureInstance":
+        clone = StructureInstance.__new__(StructureInstance)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
 
 class GameState:
     """Shared world-state container for the simulation."""
@@ -139,6 +324,7 @@ class GameState:
         self.variant_memory = VariantMemory(max_recent=3)
         self.procgen_projection_enabled = False
         self.topology_profile = select_topology_profile(self.seed)
+        self.clock = SimulationClock()
         self.tick_events: list[Any] = []
         self.time = 0
         self.ambient_threat = 0.0
@@ -233,6 +419,20 @@ class GameState:
         self.ticks_since_hostile = 0
         self.faction_profile = build_faction_profile(self.rng)
         self.event_catalog = None
+        self.event_tables = None
+        self._fingerprint_cache: tuple[Any, ...] | None = None
+        # Optional core.replay.ReplayRecorder fed by process_command/step_world.
+        self.replay_recorder = None
+        # Optional core.profiler.TickProfiler timing each step_world phase.
+        self.profiler = None
+        # Advances on every tick and command; keys cached UI snapshots.
+        self.revision = 0
+        self.snapshot_service = None
+        # Optional terminal.status_view.StatusView memoizing STATUS sections.
+        self.status_view = None
+        # Tactical combat events kept while dev_trace is on; see clock.combat_log.
+        self.combat_log = None
+        self.invariants = InvariantPolicy.from_env()
         self.global_effects = {}
 
         # Sector states
@@ -240,7 +440,8 @@ class GameState:
             sector["name"]: SectorState(sector["id"], sector["name"])
             for sector in SECTOR_DEFS
         }
-        self.structures: dict[str, Structure] = {}
+        self.sector_totals = SectorTotals(self.sectors)
+        self.structures: SectorIndexedDict = SectorIndexedDict()
         self.active_repairs: dict[str, dict] = {}
         for sector in SECTOR_DEFS:
             structure_id = f"{sector['id']}_CORE"
@@ -256,8 +457,9 @@ class GameState:
             sector_name: SectorGrid(GRID_WIDTH, GRID_HEIGHT)
             for sector_name in self.sectors
         }
-        self.structure_instances: dict[str, StructureInstance] = {}
+        self.structure_instances = StructureInstanceIndex()
         self.next_structure_id = 1
+        self._bind_grids()
 
     def threat_bucket(self) -> str:
         """Map ambient threat to a Phase 1 bucket."""
@@ -279,12 +481,117 @@ class GameState:
             return "PENDING"
         return "NONE"
 
+    def fork(self) -> "GameState":
+        """Return an independent clone for what-if lookahead.
+
+        Sectors, grids, structures, RNG streams, queues and assault objects
+        are copied structurally so stepping the fork never touches this
+        state. The build-once event catalog is shared, the fork narrates into
+        a headless child of the run clock, and append-only history (assault
+        ledger rows, tick events, operator log) shares its immutable entries.
+        Unlike ``snapshot()``/``from_snapshot()`` nothing is serialized or
+        migrated.
+        """
+
+        clone = GameState.__new__(GameState)
+        memo: dict[int, Any] = {id(self): clone}
+        if self.event_catalog is not None:
+            memo[id(self.event_catalog)] = self.event_catalog
+        clock = memo[id(self.clock)] = self.clock.child()
+
+        sectors = {}
+        for name, sector in self.sectors.items():
+            sectors[name] = memo[id(sector)] = sector.copy()
+        structures = SectorIndexedDict()
+        for sid, structure in self.structures.items():
+            structures[sid] = memo[id(structure)] = copy.copy(structure)
+        instances = StructureInstanceIndex()
+        for sid, instance in self.structure_instances.items():
+            instances[sid] = memo[id(instance)] = instance.copy()
+        sim_rng = random.Random()
+        sim_rng.setstate(self.sim_rng.getstate())
+        memo[id(self.sim_rng)] = sim_rng
+        text_rng = random.Random()
+        text_rng.setstate(self.text_rng.getstate())
+        memo[id(self.text_rng)] = text_rng
+
+        prepared = {
+            "sectors": sectors,
+            "sector_totals": SectorTotals(sectors),
+            "structures": structures,
+            "structure_instances": instances,
+            "sector_grids": {name: grid.copy() for name, grid in self.sector_grids.items()},
+            "sim_rng": sim_rng,
+            "rng": memo.get(id(self.rng), sim_rng),
+            "text_rng": text_rng,
+            "event_tables": None,
+            "assault_ledger": self.assault_ledger.copy(),
+            "tick_events": list(self.tick_events),
+            "operator_log": list(self.operator_log),
+            "event_cooldowns": defaultdict(int, self.event_cooldowns),
+            "replay_recorder": None,
+            "profiler": None,
+            "snapshot_service": None,
+            "status_view": None,
+            "combat_log": None,
+            "clock": clock,
+        }
+        for key, value in self.__dict__.items():
+            if key in prepared:
+                clone.__dict__[key] = prepared[key]
+            else:
+                clone.__dict__[key] = copy.deepcopy(value, memo)
+        clone._bind_grids()
+        return clone
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Catalog entries hold sector-filter closures; they are rebuilt from
+        # faction_profile on load, so only whether the catalog existed travels.
+        payload = dict(self.__dict__)
+        payload["event_catalog"] = self.event_catalog is not None
+        payload["event_tables"] = None
+        payload["_fingerprint_cache"] = None
+        payload["replay_recorder"] = None
+        payload["profiler"] = None
+        payload["snapshot_service"] = None
+        payload["status_view"] = None
+        payload["combat_log"] = None
+        return payload
+
+    def __setstate__(self, payload: dict[str, Any]) -> None:
+        self.__dict__.update(payload)
+        self._bind_grids()
+        built = bool(self.event_catalog)
+        self.event_catalog = None
+        if built:
+            build_event_catalog(self)
+
     @staticmethod
     def _hash_hex(payload: Any) -> str:
         text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
         return f"{stable_hash64(text):016x}"
 
     def _build_run_fingerprint(self) -> dict[str, Any]:
+        # Inputs are fixed once the catalog is built; hashing them re-serializes
+        # the whole catalog, so reuse the result while the same objects back it.
+        cached = self._fingerprint_cache
+        if (
+            cached is not None
+            and cached[0] is self.event_catalog
+            and cached[1] is self.faction_profile
+            and cached[2] == (self.seed, self.text_seed, self.topology_profile.get("profile_id"))
+        ):
+            return dict(cached[3])
+        fingerprint = self._compute_run_fingerprint()
+        self._fingerprint_cache = (
+            self.event_catalog,
+            self.faction_profile,
+            (self.seed, self.text_seed, self.topology_profile.get("profile_id")),
+            fingerprint,
+        )
+        return dict(fingerprint)
+
+    def _compute_run_fingerprint(self) -> dict[str, Any]:
         doctrine_profile_id = str(
             self.faction_profile.get("doctrine_short", "UNKNOWN")
         ).upper()
@@ -345,9 +652,7 @@ class GameState:
         for name in SECTORS:
             sector = self.sectors[name]
             sector_id = sector.id
-            sector_structures = [
-                s for s in self.structures.values() if s.sector == sector.name
-            ]
+            sector_structures = self.structures.in_sector(sector.name)
             damaged = any(
                 s.state != StructureState.OPERATIONAL for s in sector_structures
             )
@@ -363,7 +668,7 @@ class GameState:
             )
 
         return {
-            "snapshot_version": 7,
+            "snapshot_version": CURRENT_SNAPSHOT_VERSION,
             "time": self.time,
             "threat": self.threat_bucket(),
             "assault": self.assault_state(),
@@ -467,11 +772,7 @@ class GameState:
                 sector_name: {
                     "width": grid.width,
                     "height": grid.height,
-                    "cells": {
-                        f"{x},{y}": cell.structure_id
-                        for (x, y), cell in grid.cells.items()
-                        if cell.structure_id is not None
-                    },
+                    "cells": {f"{x},{y}": sid for (x, y), sid in grid.occupied()},
                 }
                 for sector_name, grid in self.sector_grids.items()
             },
@@ -519,6 +820,11 @@ class GameState:
     def compute_readiness(self) -> float:
         return compute_readiness(self)
 
+    def verify_aggregates(self) -> None:
+        """Debug check: recompute maintained aggregates and assert they match."""
+
+        verify_aggregates(self)
+
     def __str__(self):
         global_fx = ", ".join(self.global_effects.keys())
         fx_text = f" GlobalFX={global_fx}" if global_fx else ""
@@ -536,6 +842,10 @@ class GameState:
             for sector_name in self.sectors
         }
 
+    def _bind_grids(self) -> None:
+        for grid in self.sector_grids.values():
+            grid.registry = self.structure_instances
+
     def next_spatial_structure_id(self) -> str:
         sid = f"S{self.next_structure_id}"
         self.next_structure_id += 1
@@ -563,9 +873,9 @@ class GameState:
             subtype=subtype,
         )
         self.structure_instances[structure_id] = instance
-        cell = self.sector_grids[sector].cells[(x, y)]
-        cell.structure_id = structure_id
-        cell.blocked = bool(profile.get("blocks", False))
+        self.sector_grids[sector].set_structure(
+            x, y, structure_id, stype, bool(profile.get("blocks", False))
+        )
         return instance
 
     def remove_structure_instance(self, sid: str) -> bool:
@@ -578,10 +888,8 @@ class GameState:
         x, y = instance.position
         if not grid.in_bounds(x, y):
             return True
-        cell = grid.cells[(x, y)]
-        if cell.structure_id == sid:
-            cell.structure_id = None
-            cell.blocked = False
+        if grid.structure_id_at(x, y) == sid:
+            grid.clear(x, y)
         return True
 
     @classmethod
@@ -657,7 +965,7 @@ class GameState:
                     continue
                 state.sector_grids[sector_name] = SectorGrid(width, height)
 
-        state.structure_instances = {}
+        state.structure_instances = StructureInstanceIndex()
         raw_instances = migrated.get("structure_instances")
         if isinstance(raw_instances, dict):
             for sid, raw in raw_instances.items():
@@ -679,7 +987,7 @@ class GameState:
                 grid = state.sector_grids[sector]
                 if not grid.in_bounds(x, y):
                     continue
-                if grid.cells[(x, y)].structure_id is not None:
+                if grid.structure_id_at(x, y) is not None:
                     continue
                 instance = StructureInstance(
                     str(sid),
@@ -691,15 +999,16 @@ class GameState:
                 )
                 instance.hp = max(0, min(int(raw.get("hp", instance.max_hp)), instance.max_hp))
                 state.structure_instances[instance.id] = instance
-                cell = grid.cells[(x, y)]
-                cell.structure_id = instance.id
-                cell.blocked = bool(STRUCTURE_TYPES[stype].get("blocks", False))
+                grid.set_structure(
+                    x, y, instance.id, stype, bool(STRUCTURE_TYPES[stype].get("blocks", False))
+                )
 
         max_seen = 0
         for sid in state.structure_instances:
             if sid.startswith("S") and sid[1:].isdigit():
                 max_seen = max(max_seen, int(sid[1:]))
         state.next_structure_id = max(state.next_structure_id, max_seen + 1)
+        state._bind_grids()
         return state
 
 
@@ -769,9 +1078,48 @@ def reset_game_state(state: GameState) -> None:
         state: Existing state instance to reset in place.
     """
 
+    clock = state.clock
+    recorder = state.replay_recorder
+    profiler = state.profiler
+    invariants = state.invariants
+    revision = state.revision
     fresh_state = GameState()
     state.__dict__.clear()
     state.__dict__.update(fresh_state.__dict__)
+    state.clock = clock
+    state.replay_recorder = recorder
+    state.profiler = profiler
+    state.invariants = invariants
+    state.revision = revision + 1
+
+
+def restore_game_state(state: GameState, checkpoint: GameState) -> None:
+    """Roll a state back in place to an earlier ``fork()``.
+
+    Run attachments (clock, profiler, invariant policy) stay with the live
+    instance and the revision keeps counting up, so revision-keyed caches
+    never serve the abandoned timeline. An attached replay recorder starts a
+    new log from the restored state, as it does after RESET.
+
+    Args:
+        state: Live state instance to overwrite.
+        checkpoint: Fork of ``state``; it must not be used afterwards.
+    """
+
+    clock = state.clock
+    recorder = state.replay_recorder
+    profiler = state.profiler
+    invariants = state.invariants
+    revision = state.revision
+    state.__dict__.clear()
+    state.__dict__.update(checkpoint.__dict__)
+    state.clock = clock
+    state.profiler = profiler
+    state.invariants = invariants
+    state.revision = revision + 1
+    state.replay_recorder = recorder
+    if recorder is not None:
+        recorder.attach(state)
 
 
 def advance_time(state: GameState, delta: int = 1) -> None:
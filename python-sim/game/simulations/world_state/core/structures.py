@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 
 class StructureState(Enum):
@@ -65,6 +66,13 @@ STRUCTURE_TYPES = {
 }
 
 
+@lru_cache(maxsize=64)
+def perimeter_positions(level: int, width: int, height: int) -> frozenset[tuple[int, int]]:
+    """Cached, immutable form of ``generate_perimeter_positions``."""
+
+    return frozenset(generate_perimeter_positions(level, width, height))
+
+
 def generate_perimeter_positions(level: int, width: int, height: int) -> set[tuple[int, int]]:
     """Return deterministic perimeter wall coordinates for fortification levels."""
 
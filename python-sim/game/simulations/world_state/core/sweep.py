@@ -0,0 +1,166 @@
+"""Seed-sweep Monte Carlo runner for headless world-state campaigns."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import json
+import math
+import os
+from pathlib import Path
+
+from .clock import SimulationClock
+from .invariants import INVARIANTS_SAMPLED, InvariantPolicy
+from .simulation import step_world
+from .state import GameState
+
+
+SWEEP_DEFAULT_TICKS = 2000
+SWEEP_PERCENTILES = (5, 25, 50, 75, 95)
+SWEEP_METRICS = (
+    "time_to_failure",
+    "archive_losses",
+    "assault_count",
+    "peak_ambient_threat",
+)
+
+
+@dataclass(frozen=True)
+class RunSummary:
+    """Outcome of one unattended campaign."""
+
+    seed: int
+    ticks: int
+    failed: bool
+    time_to_failure: int | None
+    failure_reason: str | None
+    archive_losses: int
+    assault_count: int
+    peak_ambient_threat: float
+
+
+def run_campaign(seed: int, max_ticks: int = SWEEP_DEFAULT_TICKS) -> RunSummary:
+    """Run one headless campaign until failure or ``max_ticks``.
+
+    The result depends only on ``seed`` and ``max_ticks``, never on which
+    worker process runs it.
+    """
+
+    state = GameState(seed=int(seed))
+    state.invariants = InvariantPolicy.from_env(default=INVARIANTS_SAMPLED)
+    clock = SimulationClock(headless=True, sink_limit=1)
+    peak_threat = state.ambient_threat
+    for _ in range(max(0, int(max_ticks))):
+        step_world(state, clock=clock)
+        peak_threat = max(peak_threat, state.ambient_threat)
+        if state.is_failed:
+            break
+
+    return RunSummary(
+        seed=int(seed),
+        ticks=int(state.time),
+        failed=bool(state.is_failed),
+        time_to_failure=int(state.time) if state.is_failed else None,
+        failure_reason=state.failure_reason,
+        archive_losses=int(state.archive_losses),
+        assault_count=int(state.assault_count),
+        peak_ambient_threat=round(float(peak_threat), 4),
+    )
+
+
+def default_worker_count() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def sweep_seeds(
+    seeds: Iterable[int],
+    *,
+    max_ticks: int = SWEEP_DEFAULT_TICKS,
+    workers: int | None = None,
+) -> Iterator[RunSummary]:
+    """Yield campaign summaries in seed order, fanning runs across processes."""
+
+    seed_list = [int(seed) for seed in seeds]
+    worker_count = default_worker_count() if workers is None else max(1, int(workers))
+    worker_count = min(worker_count, max(1, len(seed_list)))
+    if worker_count == 1:
+        for seed in seed_list:
+            yield run_campaign(seed, max_ticks)
+        return
+
+    chunksize = max(1, len(seed_list) // (worker_count * 4))
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        yield from executor.map(
+            run_campaign,
+            seed_list,
+            [max_ticks] * len(seed_list),
+            chunksize=chunksize,
+        )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of ``values`` (``pct`` in [0, 100])."""
+
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * max(0.0, min(100.0, float(pct))) / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(ordered[low])
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def percentile_table(
+    summaries: list[RunSummary],
+    percentiles: tuple[int, ...] = SWEEP_PERCENTILES,
+) -> list[str]:
+    """Render aggregate percentile lines for a completed sweep."""
+
+    runs = len(summaries)
+    failed = sum(1 for summary in summaries if summary.failed)
+    lines = [f"RUNS: {runs}  FAILED: {failed} ({(failed / runs * 100.0) if runs else 0.0:.1f}%)"]
+    header = f"{'METRIC':<22}" + "".join(f"{f'P{pct}':>10}" for pct in percentiles)
+    lines.append(header)
+    for metric in SWEEP_METRICS:
+        values = [
+            float(getattr(summary, metric))
+            for summary in summaries
+            if getattr(summary, metric) is not None
+        ]
+        cells = "".join(f"{percentile(values, pct):>10.2f}" for pct in percentiles)
+        lines.append(f"{metric:<22}{cells}")
+
+    reasons = Counter(summary.failure_reason for summary in summaries if summary.failure_reason)
+    for reason, count in sorted(reasons.items(), key=lambda item: (-item[1], item[0])):
+        lines.append(f"FAILURE {reason}: {count}")
+    return lines
+
+
+def run_sweep(
+    seeds: Iterable[int],
+    *,
+    max_ticks: int = SWEEP_DEFAULT_TICKS,
+    workers: int | None = None,
+    output: Path | None = None,
+) -> list[RunSummary]:
+    """Run a sweep, streaming one JSON line per campaign to ``output``."""
+
+    summaries: list[RunSummary] = []
+    handle = None
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        handle = output.open("w", encoding="utf-8")
+    try:
+        for summary in sweep_seeds(seeds, max_ticks=max_ticks, workers=workers):
+            summaries.append(summary)
+            if handle is not None:
+                handle.write(json.dumps(asdict(summary), sort_keys=True) + "\n")
+                handle.flush()
+    finally:
+        if handle is not None:
+            handle.close()
+    return summaries
@@ -8,6 +8,8 @@ from game.simulations.world_state.core.defense import (
 )
 from game.simulations.world_state.core.power import structure_effective_output
 
+TACTICAL_TURRET_DAMAGE = 5
+
 
 def _defense_effective_output(state) -> float:
     if state is None:
@@ -18,10 +20,24 @@ def _defense_effective_output(state) -> float:
     return structure_effective_output(state, structure)
 
 
+def sector_turret_output(state, sector_name: str, output: float | None = None) -> float:
+    """Turret output for ``sector_name`` before per-tick autopilot scaling."""
+
+    if output is None:
+        output = _defense_effective_output(state)
+    doctrine = "BALANCED" if state is None else state.defense_doctrine
+    sector_output = output * doctrine_dps_multiplier(doctrine)
+    if state is not None:
+        sector_output *= max(
+            0.75,
+            min(1.25, defense_bias_for_sector(state.defense_allocation, sector_name)),
+        )
+    return sector_output
+
+
 def build_tactical_sectors(assault, state=None):
     sectors = []
     output = _defense_effective_output(state)
-    doctrine = "BALANCED" if state is None else state.defense_doctrine
     for sector_state in assault.target_sectors:
         sector_type = SectorType.PERIPHERAL
         if sector_state.name == "COMMAND":
@@ -29,13 +45,8 @@ def build_tactical_sectors(assault, state=None):
         elif sector_state.name == "ARCHIVE":
             sector_type = SectorType.GOAL
         sector = Sector(sector_state.name, sector_type)
-        sector_output = output * doctrine_dps_multiplier(doctrine)
-        if state is not None:
-            sector_output *= max(
-                0.75,
-                min(1.25, defense_bias_for_sector(state.defense_allocation, sector_state.name)),
-            )
-        sector.defenses.append(Turret(damage=5, effective_output=sector_output))
+        sector_output = sector_turret_output(state, sector_state.name, output)
+        sector.defenses.append(Turret(damage=TACTICAL_TURRET_DAMAGE, effective_output=sector_output))
         sectors.append(sector)
     return sectors
 
@@ -1,88 +1,118 @@
+import atexit
 import os
-import sys
-import signal
-import subprocess
-import time
-from collections import deque
+import threading
 
 from flask import (
     Flask,
     Response,
+    g,
     jsonify,
     render_template,
     request,
     stream_with_context,
 )
 
-from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.broadcast import SSE_HEARTBEAT_SECONDS, TickBroadcaster
+from game.simulations.world_state.core.profiler import TickProfiler
 from game.simulations.world_state.server_contracts import (
-    CommandReplayCache,
+    command_cache_from_env,
+    parse_batch_payload,
     parse_command_payload,
+    parse_profile_capacity,
+    run_command_batch,
     serialize_command_result,
+    server_metrics,
+)
+from game.simulations.world_state.sessions import (
+    DEFAULT_SESSION_ID,
+    SESSION_COOKIE,
+    InvalidSessionId,
+    SessionPool,
+    coerce_seed,
+    resolve_session_id,
+)
+from game.simulations.world_state.snapshot_service import (
+    etag_matches,
+    snapshot_etag,
+    snapshot_service,
 )
 from game.simulations.world_state.terminal.processor import process_command
+from game.simulations.world_state.world_store import WorldStore
 
 APP_ROOT = os.path.dirname(os.path.abspath(__file__))
-SIM_PATH = os.path.join(APP_ROOT, "sandbox_world.py")
 
 app = Flask(__name__)
 
-HISTORY_LIMIT = 2000
-history = deque(maxlen=HISTORY_LIMIT)
-current_process = None
-command_state = GameState()
-command_cache = CommandReplayCache()
+sessions = SessionPool(store=WorldStore.from_env())
+# Store live sessions on shutdown so a restart picks them back up.
+atexit.register(sessions.close)
+command_cache = command_cache_from_env()
+broadcasters: dict[str, TickBroadcaster] = {}
+broadcasters_lock = threading.Lock()
 
 
-def _coerce_delay(raw, default=0.2):
-    try:
-        delay = float(raw)
-    except (TypeError, ValueError):
-        return default
-    return max(0.05, min(delay, 2.0))
-
-
-def _stream_world_state(delay):
-    env = os.environ.copy()
-    env["TICK_DELAY"] = str(delay)
-    process = subprocess.Popen(
-        [sys.executable, "-u", SIM_PATH],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        cwd=APP_ROOT,
-        text=True,
-        bufsize=1,
-        env=env,
-    )
-    global current_process
-    current_process = process
-    start_time = time.time()
-    print(f"[server] stream started delay={delay:.2f}s pid={process.pid}", flush=True)
+def _session_id(payload=None) -> str:
+    g.session_id = resolve_session_id(payload or {}, request.args, request.cookies)
+    return g.session_id
+
+
+def _broadcaster(session_id):
+    with broadcasters_lock:
+        return broadcasters.get(session_id)
+
+
+def _join(session_id):
+    """Subscribe to the session's broadcaster, creating it for the first viewer."""
+
+    with broadcasters_lock:
+        broadcaster = broadcasters.get(session_id)
+        if broadcaster is None:
+            broadcaster = broadcasters[session_id] = TickBroadcaster(sessions, session_id)
+        return broadcaster, broadcaster.subscribe()
+
 
+def _leave(broadcaster, subscriber):
+    """Unsubscribe and forget the broadcaster once its last viewer is gone."""
+
+    with broadcasters_lock:
+        broadcaster.unsubscribe(subscriber)
+        if not broadcaster.subscriber_count() and broadcasters.get(broadcaster.session_id) is broadcaster:
+            del broadcasters[broadcaster.session_id]
+
+
+def _stream_world_state(session_id):
+    broadcaster, subscriber = _join(session_id)
+    print(
+        f"[server] viewer joined session={broadcaster.session_id} "
+        f"viewers={broadcaster.subscriber_count()}",
+        flush=True,
+    )
     try:
-        last_heartbeat = start_time
-        line_count = 0
-        for line in process.stdout:
-            cleaned = line.rstrip("\n")
-            history.append(cleaned)
-            yield f"data: {cleaned}\n\n"
-            line_count += 1
-            now = time.time()
-            if now - last_heartbeat >= 5:
-                print(
-                    f"[server] streaming lines={line_count} uptime={int(now - start_time)}s",
-                    flush=True,
-                )
-                last_heartbeat = now
+        while not subscriber.dropped:
+            message = subscriber.get(timeout=SSE_HEARTBEAT_SECONDS)
+            if message is None:
+                yield ": heartbeat\n\n"
+                continue
+            yield message.sse
+        yield f"event: dropped\ndata: {subscriber.reason}\n\n"
     finally:
-        if process.poll() is None:
-            process.terminate()
-            try:
-                process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                process.kill()
-        current_process = None
-        print("[server] stream closed", flush=True)
+        _leave(broadcaster, subscriber)
+        print(f"[server] viewer left session={broadcaster.session_id}", flush=True)
+
+
+@app.after_request
+def remember_session(response):
+    """Pin the resolved session id in a cookie so follow-up requests reuse it."""
+
+    session_id = g.get("session_id")
+    if session_id is not None and session_id != request.cookies.get(SESSION_COOKIE, DEFAULT_SESSION_ID):
+        response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="Lax")
+    return response
+
+
+@app.errorhandler(InvalidSessionId)
+def invalid_session(error):
+    return jsonify({"ok": False, "error": str(error)}), 400
 
 
 @app.route("/")
@@ -92,28 +122,25 @@ def index():
 
 @app.route("/history")
 def history_feed():
-    return jsonify(list(history))
+    broadcaster = _broadcaster(_session_id())
+    return jsonify(list(broadcaster.history) if broadcaster is not None else [])
 
 
 @app.route("/pause", methods=["POST"])
 def pause():
-    if current_process is None or current_process.poll() is not None:
-        return jsonify({"status": "no-process"}), 409
-    try:
-        os.kill(current_process.pid, signal.SIGSTOP)
-    except OSError:
-        return jsonify({"status": "error"}), 500
+    broadcaster = _broadcaster(_session_id(request.get_json(silent=True)))
+    if broadcaster is None or not broadcaster.running:
+        return jsonify({"status": "no-stream"}), 409
+    broadcaster.pause()
     return jsonify({"status": "paused"})
 
 
 @app.route("/resume", methods=["POST"])
 def resume():
-    if current_process is None or current_process.poll() is not None:
-        return jsonify({"status": "no-process"}), 409
-    try:
-        os.kill(current_process.pid, signal.SIGCONT)
-    except OSError:
-        return jsonify({"status": "error"}), 500
+    broadcaster = _broadcaster(_session_id(request.get_json(silent=True)))
+    if broadcaster is None or not broadcaster.running:
+        return jsonify({"status": "no-stream"}), 409
+    broadcaster.resume()
     return jsonify({"status": "resumed"})
 
 
@@ -122,48 +149,120 @@ def command():
     """Execute a terminal command from POSTed JSON payload."""
 
     payload = request.get_json(silent=True) or {}
-    global command_state
     raw, command_id = parse_command_payload(payload)
-    cached = command_cache.get(command_id)
-    if cached is not None:
-        return jsonify(cached)
-
-    seed = payload.get("seed")
-    if seed is not None and command_state.time == 0:
-        try:
-            command_state = GameState(seed=int(seed))
-        except (TypeError, ValueError):
-            pass
-
-    result = process_command(command_state, raw)
-    response = serialize_command_result(result)
-    command_cache.put(command_id, response)
+    session_id = _session_id(payload)
+    # Look up, run and record under the session lock, so concurrent retries
+    # of one command_id run it once.
+    with sessions.session(session_id, seed=coerce_seed(payload.get("seed"))) as state:
+        response = command_cache.get(session_id, command_id)
+        if response is None:
+            response = serialize_command_result(process_command(state, raw))
+            command_cache.put(session_id, command_id, response)
     return jsonify(response)
 
 
+@app.route("/commands", methods=["POST"])
+def commands():
+    """Execute an ordered batch of commands under one session lock."""
+
+    payload = request.get_json(silent=True) or {}
+    try:
+        batch, validate = parse_batch_payload(payload)
+    except ValueError as error:
+        return jsonify({"ok": False, "error": str(error)}), 400
+
+    session_id = _session_id(payload)
+    with sessions.session(session_id, seed=coerce_seed(payload.get("seed"))) as state:
+        results = run_command_batch(state, batch, command_cache, session_id=session_id, validate=validate)
+        revision = state.revision
+    return jsonify(
+        {
+            "ok": all(result["ok"] for result in results),
+            "revision": revision,
+            "results": results,
+        }
+    )
+
+
 @app.get("/snapshot")
 def snapshot():
     """Return a read-only world-state snapshot for UI projection."""
 
-    return jsonify(command_state.snapshot())
+    with sessions.session(_session_id()) as state:
+        cached = snapshot_service(state).current(state)
+    if etag_matches(request.headers.get("If-None-Match"), cached.etag):
+        return Response(status=304, headers={"ETag": cached.etag})
+    return Response(
+        cached.body,
+        mimetype="application/json",
+        headers={"ETag": cached.etag, "X-State-Revision": str(cached.revision)},
+    )
+
+
+@app.get("/snapshot/delta")
+def snapshot_delta():
+    """Return snapshot ops since ``?since=<revision>`` (full snapshot if unknown)."""
+
+    try:
+        since = int(request.args.get("since", ""))
+    except ValueError:
+        return jsonify({"ok": False, "error": "since=<revision> REQUIRED"}), 400
+    with sessions.session(_session_id()) as state:
+        etag = snapshot_etag(state)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status=304, headers={"ETag": etag})
+        delta = snapshot_service(state).delta(state, since)
+    response = jsonify(delta)
+    response.headers["ETag"] = etag
+    return response
+
+
+@app.get("/metrics")
+def metrics():
+    """Return replay-cache and session-pool counters."""
+
+    return jsonify(server_metrics(command_cache, sessions))
+
+
+@app.route("/profile", methods=["GET", "POST"])
+def profile():
+    """Return per-phase tick timings in dev mode; POST {"enabled": bool} toggles profiling."""
+
+    payload = request.get_json(silent=True) or {}
+    with sessions.session(_session_id(payload)) as state:
+        if not state.dev_mode:
+            return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
+        if request.method == "POST":
+            if payload.get("enabled", True):
+                if state.profiler is None or payload.get("reset"):
+                    try:
+                        capacity = parse_profile_capacity(payload)
+                    except ValueError as error:
+                        return jsonify({"ok": False, "error": str(error)}), 400
+                    state.profiler = TickProfiler(capacity)
+            else:
+                state.profiler = None
+        if state.profiler is None:
+            return jsonify({"ok": False, "error": "PROFILER DISABLED"}), 409
+        return jsonify({"ok": True, "profile": state.profiler.summary()})
 
 
 @app.get("/procgen_report")
 def procgen_report():
     """Return deterministic procgen instrumentation report in dev mode."""
 
-    if not command_state.dev_mode:
-        return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
-    return jsonify({"ok": True, "procgen_report": command_state.procgen_report()})
+    with sessions.session(_session_id()) as state:
+        if not state.dev_mode:
+            return jsonify({"ok": False, "error": "DEV MODE REQUIRED"}), 403
+        return jsonify({"ok": True, "procgen_report": state.procgen_report()})
 
 
 @app.route("/stream")
 def stream():
-    delay = _coerce_delay(request.args.get("delay"))
-    print(f"[server] client connected delay={delay:.2f}s", flush=True)
     return Response(
-        stream_with_context(_stream_world_state(delay)),
+        stream_with_context(_stream_world_state(_session_id())),
         mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
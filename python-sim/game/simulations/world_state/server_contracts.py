@@ -3,12 +3,30 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+import json
+import os
+from pathlib import Path
+import threading
 import time
 from typing import Any
 
+from game.simulations.world_state.core.invariants import INVARIANTS_OFF, validate_state_invariants
+from game.simulations.world_state.core.profiler import PROFILER_DEFAULT_CAPACITY, PROFILER_MAX_CAPACITY
+from game.simulations.world_state.core.state import GameState, restore_game_state
+from game.simulations.world_state.sessions import DEFAULT_SESSION_ID
+from game.simulations.world_state.terminal.processor import process_command
 from game.simulations.world_state.terminal.result import CommandResult
 
 
+COMMAND_CACHE_PATH_ENV = "WORLD_STATE_COMMAND_CACHE"
+MAX_BATCH_COMMANDS = 100
+BATCH_VALIDATE_END = "end"
+BATCH_VALIDATE_EACH = "each"
+BATCH_VALIDATE_MODES = (BATCH_VALIDATE_END, BATCH_VALIDATE_EACH)
+
+
 def parse_command_payload(payload: dict[str, Any]) -> tuple[str, str | None]:
     raw = payload.get("command", payload.get("raw", ""))
     if not isinstance(raw, str):
@@ -19,6 +37,45 @@ def parse_command_payload(payload: dict[str, Any]) -> tuple[str, str | None]:
     return raw, command_id
 
 
+def parse_batch_payload(payload: dict[str, Any]) -> tuple[list[tuple[str, str | None]], str]:
+    """Return ``([(raw, command_id), ...], validate)`` from a batch payload.
+
+    Entries may be command strings or ``/command``-style objects. Raises
+    ``ValueError`` for payloads the endpoint should reject with a 400.
+    """
+
+    entries = payload.get("commands")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("commands=[...] REQUIRED")
+    if len(entries) > MAX_BATCH_COMMANDS:
+        raise ValueError(f"BATCH LIMIT IS {MAX_BATCH_COMMANDS} COMMANDS")
+    validate = str(payload.get("validate", BATCH_VALIDATE_END)).strip().lower()
+    if validate not in BATCH_VALIDATE_MODES:
+        raise ValueError(f"validate MUST BE ONE OF {', '.join(BATCH_VALIDATE_MODES)}")
+    commands = []
+    for entry in entries:
+        if isinstance(entry, str):
+            commands.append((entry, None))
+        elif isinstance(entry, dict):
+            commands.append(parse_command_payload(entry))
+        else:
+            raise ValueError("EACH COMMAND MUST BE A STRING OR OBJECT")
+    return commands, validate
+
+
+def parse_profile_capacity(payload: dict[str, Any]) -> int:
+    """Return the ``/profile`` ring capacity; ``ValueError`` means a 400."""
+
+    raw = payload.get("capacity", PROFILER_DEFAULT_CAPACITY)
+    try:
+        capacity = int(raw)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("capacity MUST BE AN INTEGER") from None
+    if isinstance(raw, bool) or not 1 <= capacity <= PROFILER_MAX_CAPACITY:
+        raise ValueError(f"capacity MUST BE 1..{PROFILER_MAX_CAPACITY}")
+    return capacity
+
+
 def serialize_command_result(result: CommandResult) -> dict[str, Any]:
     lines = []
     if result.text:
@@ -31,37 +88,233 @@ def serialize_command_result(result: CommandResult) -> dict[str, Any]:
 
 
 class CommandReplayCache:
-    """Short-lived replay cache for command idempotency."""
+    """Short-lived replay cache for command idempotency.
 
-    def __init__(self, *, ttl_seconds: float = 60.0, max_entries: int = 100):
+    Entries are keyed by ``(session_id, command_id)``, so two sessions that
+    reuse a client-side command id never see each other's results. Every
+    entry shares one TTL, so insertion order is expiry order: ``put``
+    moves a key to the end and expiry pops stale keys off the front, which is
+    O(1) amortized per request. With ``path`` set, entries are appended to a
+    JSON-lines journal and reloaded on start, so replays survive a restart;
+    the journal is compacted to the live entries once it grows past twice
+    ``max_entries`` lines.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 100,
+        path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
-        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.path = Path(path) if path else None
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._journal_lines = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
-    def _evict(self) -> None:
-        now = time.time()
-        stale = [key for key, (ts, _) in self._entries.items() if now - ts > self.ttl_seconds]
-        for key in stale:
-            self._entries.pop(key, None)
-        while len(self._entries) > self.max_entries:
-            self._entries.popitem(last=False)
+    def _evict(self, now: float) -> None:
+        entries = self._entries
+        while entries:
+            ts = next(iter(entries.values()))[0]
+            if now - ts <= self.ttl_seconds:
+                break
+            entries.popitem(last=False)
+            self.expirations += 1
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
 
-    def get(self, command_id: str | None) -> dict[str, Any] | None:
+    def get(self, session_id: str, command_id: str | None) -> dict[str, Any] | None:
         if not command_id:
             return None
-        self._evict()
-        entry = self._entries.get(command_id)
-        if entry is None:
-            return None
-        ts, payload = entry
-        if time.time() - ts > self.ttl_seconds:
-            self._entries.pop(command_id, None)
-            return None
-        return payload
+        with self._lock:
+            self._evict(self._clock())
+            entry = self._entries.get((session_id, command_id))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
 
-    def put(self, command_id: str | None, payload: dict[str, Any]) -> None:
+    def put(self, session_id: str, command_id: str | None, payload: dict[str, Any]) -> None:
         if not command_id:
             return
-        self._entries[command_id] = (time.time(), payload)
-        self._evict()
+        key = (session_id, command_id)
+        with self._lock:
+            now = self._clock()
+            self._entries[key] = (now, payload)
+            self._entries.move_to_end(key)
+            self._evict(now)
+            if self.path is not None:
+                self._journal(key, now, payload)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "persistent": self.path is not None,
+            }
+
+    def _load(self) -> None:
+        try:
+            handle = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        loaded = []
+        with handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                    key = (str(record["session"]), str(record["id"]))
+                    loaded.append((float(record["ts"]), key, record["payload"]))
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from a crash, or a pre-session record
+                    # that cannot be attributed; everything else is intact.
+                    continue
+        loaded.sort(key=lambda item: item[0])
+        for ts, key, payload in loaded:
+            self._entries[key] = (ts, payload)
+            self._entries.move_to_end(key)
+        self._evict(self._clock())
+        self._compact()
+
+    def _journal(self, key: tuple[str, str], ts: float, payload: dict[str, Any]) -> None:
+        if self._journal_lines >= 2 * self.max_entries:
+            self._compact()
+            return
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(_journal_line(key, ts, payload))
+        self._journal_lines += 1
+
+    def _compact(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_suffix(self.path.suffix + ".tmp")
+        with partial.open("w", encoding="utf-8") as handle:
+            for key, (ts, payload) in self._entries.items():
+                handle.write(_journal_line(key, ts, payload))
+        partial.replace(self.path)
+        self._journal_lines = len(self._entries)
+
+
+def command_cache_from_env() -> CommandReplayCache:
+    """Build the servers' replay cache, persisted when the env path is set."""
+
+    return CommandReplayCache(path=os.getenv(COMMAND_CACHE_PATH_ENV) or None)
+
+
+def server_metrics(cache: CommandReplayCache, pool) -> dict[str, Any]:
+    """Return the JSON body shared by both servers' ``/metrics`` endpoints."""
+
+    metrics = {
+        "command_cache": cache.metrics(),
+        "sessions": {
+            "live": len(pool.live_sessions()),
+            "capacity": pool.capacity,
+            "evictions": pool.evictions,
+            "rehydrations": pool.rehydrations,
+        },
+    }
+    store = getattr(pool, "store", None)
+    if store is not None:
+        metrics["world_store"] = {"writes": store.writes, "batches": store.batches}
+    return metrics
+
+
+def _journal_line(key: tuple[str, str], ts: float, payload: dict[str, Any]) -> str:
+    session_id, command_id = key
+    record = {"session": session_id, "id": command_id, "ts": ts, "payload": payload}
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+@contextmanager
+def _suspended_invariants(state: GameState) -> Iterator[None]:
+    policy = state.invariants
+    level = policy.level
+    policy.level = INVARIANTS_OFF
+    try:
+        yield
+    finally:
+        policy.level = level
+
+
+def run_command_batch(
+    state: GameState,
+    commands: list[tuple[str, str | None]],
+    cache: CommandReplayCache,
+    *,
+    session_id: str = DEFAULT_SESSION_ID,
+    validate: str = BATCH_VALIDATE_END,
+) -> list[dict[str, Any]]:
+    """Run ``commands`` in order against one state and return their payloads.
+
+    The caller holds the session lock for the whole batch. Each result is the
+    ``/command`` payload plus its ``command_id``; ids ``session_id`` already
+    has in ``cache`` are answered from it without re-running. With
+    ``validate="end"`` per-command invariant checks are suspended and every
+    check runs once after the last command; ``"each"`` keeps the state's own
+    policy for every command.
+
+    The batch is atomic. If a command raises or the final validation fails,
+    the state is rolled back to a fork taken before the first command,
+    nothing is cached, and the last result carries ``error`` and
+    ``rolled_back``.
+    """
 
+    results = []
+    staged: dict[str, dict[str, Any]] = {}
+    checkpoint = state.fork()
+    suspend = validate == BATCH_VALIDATE_END
+    command_id = None
+    try:
+        with _suspended_invariants(state) if suspend else nullcontext():
+            for raw, command_id in commands:
+                response = staged.get(command_id) if command_id else None
+                if response is None:
+                    response = cache.get(session_id, command_id)
+                if response is None:
+                    response = serialize_command_result(process_command(state, raw))
+                    if command_id:
+                        staged[command_id] = response
+                results.append({"command_id": command_id, **response})
+            command_id = None
+        if suspend:
+            validate_state_invariants(state)
+    except Exception as error:
+        restore_game_state(state, checkpoint)
+        text = "BATCH ROLLED BACK."
+        results.append(
+            {
+                "command_id": command_id,
+                "ok": False,
+                "text": text,
+                "lines": [text, f"{type(error).__name__}: {error}"],
+                "error": type(error).__name__,
+                "rolled_back": True,
+            }
+        )
+        return results
+    for staged_id, response in staged.items():
+        cache.put(session_id, staged_id, response)
+    return results
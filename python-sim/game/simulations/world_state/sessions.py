@@ -0,0 +1,245 @@
+"""Session-keyed pool of live world states for the command servers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import re
+import tempfile
+import threading
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.invariants import INVARIANTS_SAMPLED, InvariantPolicy
+from game.simulations.world_state.core.replay import freeze_state, thaw_state
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.world_store import WorldStore
+
+
+DEFAULT_SESSION_ID = "default"
+SESSION_POOL_CAPACITY = 32
+SESSION_COOKIE = "custodian_session"
+SESSION_STORE_ENV = "WORLD_STATE_SESSION_DIR"
+_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class InvalidSessionId(ValueError):
+    """Raised for session ids that are not safe to use as store file names."""
+
+
+def normalize_session_id(raw) -> str:
+    """Return a filesystem-safe session id, or raise ``InvalidSessionId``."""
+
+    if raw is None or raw == "":
+        return DEFAULT_SESSION_ID
+    session_id = str(raw)
+    if not _SESSION_ID_RE.match(session_id):
+        raise InvalidSessionId("Session id must be 1-64 letters, digits, '-' or '_'.")
+    return session_id
+
+
+def resolve_session_id(payload: Mapping, query: Mapping, cookies: Mapping) -> str:
+    """Pick the session id from the JSON payload, query string, then cookie."""
+
+    for source, key in ((payload, "session_id"), (query, "session"), (cookies, SESSION_COOKIE)):
+        value = source.get(key)
+        if value:
+            return normalize_session_id(value)
+    return DEFAULT_SESSION_ID
+
+
+def coerce_seed(raw) -> int | None:
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _new_state(seed: int | None) -> GameState:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    # Live server sessions check structure on a sample, like sweeps.
+    state.invariants = InvariantPolicy.from_env(default=INVARIANTS_SAMPLED)
+    return state
+
+
+class SessionPool:
+    """Bounded LRU pool of ``GameState`` objects keyed by session id.
+
+    Least-recently-used sessions beyond ``capacity`` are frozen to
+    ``store_dir`` and thawed on their next use. Frozen states are exact
+    pickles rather than ``snapshot()`` payloads: ``from_snapshot`` recomputes
+    derived fields (power load, logistics, policies) and would quietly change
+    an evicted world. With a ``store`` attached, evicted states go to the
+    SQLite ``WorldStore`` instead, whose writes happen off the request
+    thread. Each session has its own lock, so commands for different sessions
+    run concurrently while commands for one session are serialized. A
+    session's lock is retired once its state has been stored, so the lock
+    table stays as small as the live pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = SESSION_POOL_CAPACITY,
+        store_dir: str | Path | None = None,
+        factory: Callable[[int | None], GameState] = _new_state,
+        store: WorldStore | None = None,
+    ):
+        self.capacity = max(1, int(capacity))
+        self.store = store
+        if store_dir is None and store is not None:
+            store_dir = store.path.parent
+        elif store_dir is None:
+            store_dir = os.getenv(SESSION_STORE_ENV) or tempfile.mkdtemp(prefix="custodian-sessions-")
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.factory = factory
+        self.evictions = 0
+        self.rehydrations = 0
+        self._live: OrderedDict[str, GameState] = OrderedDict()
+        self._locks: dict[str, threading.Lock] = {}
+        self._pool_lock = threading.Lock()
+
+    def _path(self, session_id: str) -> Path:
+        return self.store_dir / f"{session_id}.state"
+
+    def _lock_for(self, session_id: str) -> threading.Lock:
+        with self._pool_lock:
+            lock = self._locks.get(session_id)
+            if lock is None:
+                lock = self._locks[session_id] = threading.Lock()
+            return lock
+
+    def _hold(self, session_id: str) -> threading.Lock:
+        """Acquire ``session_id``'s current lock, retrying if eviction retired it."""
+
+        while True:
+            lock = self._lock_for(session_id)
+            lock.acquire()
+            with self._pool_lock:
+                if self._locks.get(session_id) is lock:
+                    return lock
+            lock.release()
+
+    def live_sessions(self) -> list[str]:
+        with self._pool_lock:
+            return list(self._live)
+
+    @contextmanager
+    def session(self, session_id=None, *, seed: int | None = None) -> Iterator[GameState]:
+        """Yield the session's state while holding its lock.
+
+        ``seed`` creates the session with that seed, or reseeds an existing
+        session that has not advanced past tick 0.
+        """
+
+        session_id = normalize_session_id(session_id)
+        lock = self._hold(session_id)
+        try:
+            state = self._acquire(session_id, seed)
+            try:
+                yield state
+            finally:
+                self._evict_idle()
+        finally:
+            lock.release()
+
+    def _acquire(self, session_id: str, seed: int | None) -> GameState:
+        with self._pool_lock:
+            state = self._live.get(session_id)
+            if state is not None:
+                self._live.move_to_end(session_id)
+        if state is None:
+            state = self._rehydrate(session_id)
+        if state is None or (seed is not None and state.time == 0 and state.seed != seed):
+            state = self.factory(seed)
+        with self._pool_lock:
+            self._live[session_id] = state
+            self._live.move_to_end(session_id)
+        return state
+
+    def _rehydrate(self, session_id: str) -> GameState | None:
+        if self.store is not None:
+            state = self.store.load_state(session_id)
+            if state is not None:
+                self.rehydrations += 1
+            return state
+        path = self._path(session_id)
+        try:
+            blob = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        state = thaw_state(blob)
+        self.rehydrations += 1
+        return state
+
+    def _evict_idle(self) -> None:
+        while True:
+            with self._pool_lock:
+                if len(self._live) <= self.capacity:
+                    return
+                victim = None
+                for session_id in self._live:
+                    lock = self._locks[session_id]
+                    if lock.acquire(blocking=False):
+                        victim = session_id
+                        break
+                if victim is None:
+                    return
+                state = self._live.pop(victim)
+            try:
+                self._store(victim, state)
+            finally:
+                with self._pool_lock:
+                    if victim not in self._live and self._locks.get(victim) is lock:
+                        del self._locks[victim]
+                lock.release()
+
+    def _store(self, session_id: str, state: GameState) -> None:
+        if self.store is not None:
+            self.store.save_state(session_id, state)
+            self.evictions += 1
+            return
+        path = self._path(session_id)
+        partial = path.with_suffix(".tmp")
+        partial.write_bytes(freeze_state(state))
+        partial.replace(path)
+        self.evictions += 1
+
+    def flush(self) -> None:
+        """Write every idle live session to the store and drop it from memory."""
+
+        capacity = self.capacity
+        self.capacity = 0
+        try:
+            self._evict_idle()
+        finally:
+            self.capacity = capacity
+        if self.store is not None:
+            self.store.flush()
+
+    def close(self) -> None:
+        """Write every live session to the store, waiting on busy ones, then close it.
+
+        Servers register this to run at exit so live sessions survive a restart.
+        """
+
+        for session_id in self.live_sessions():
+            lock = self._hold(session_id)
+            try:
+                with self._pool_lock:
+                    state = self._live.pop(session_id, None)
+                if state is not None:
+                    self._store(session_id, state)
+            finally:
+                with self._pool_lock:
+                    if self._locks.get(session_id) is lock:
+                        del self._locks[session_id]
+                lock.release()
+        if self.store is not None:
+            self.store.close()
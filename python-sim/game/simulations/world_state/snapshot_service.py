@@ -0,0 +1,93 @@
+"""Revision-keyed snapshot cache with ETags and deltas for UI polling."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from game.simulations.world_state.core.snapshot_codec import snapshot_delta
+from game.simulations.world_state.core.state import GameState
+
+
+SNAPSHOT_HISTORY = 16
+
+
+@dataclass(frozen=True)
+class CachedSnapshot:
+    """A snapshot serialized once for one state revision."""
+
+    revision: int
+    etag: str
+    snapshot: dict[str, Any]
+    body: bytes
+
+
+def snapshot_etag(state: GameState) -> str:
+    # The seed distinguishes runs, so a RESET never reuses an older ETag.
+    return f'"{int(state.seed):x}.{int(state.revision)}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {token.strip() for token in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+class SnapshotService:
+    """Caches serialized snapshots per revision for one state.
+
+    ``state.revision`` advances on every tick and command, so polling between
+    them reuses the cached body. The last ``history`` served revisions are kept
+    so ``delta(since)`` can diff against exactly what a client last saw.
+    """
+
+    def __init__(self, history: int = SNAPSHOT_HISTORY):
+        self.history = max(1, int(history))
+        self._entries: OrderedDict[int, CachedSnapshot] = OrderedDict()
+        self.builds = 0
+
+    def current(self, state: GameState) -> CachedSnapshot:
+        revision = int(state.revision)
+        cached = self._entries.get(revision)
+        etag = snapshot_etag(state)
+        if cached is not None and cached.etag == etag:
+            return cached
+        snapshot = state.snapshot()
+        body = json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+        # Keep the JSON-decoded form so deltas compare what clients received.
+        cached = CachedSnapshot(revision=revision, etag=etag, snapshot=json.loads(body), body=body)
+        self._entries[revision] = cached
+        self._entries.move_to_end(revision)
+        while len(self._entries) > self.history:
+            self._entries.popitem(last=False)
+        self.builds += 1
+        return cached
+
+    def delta(self, state: GameState, since: int) -> dict[str, Any]:
+        """Return ops turning revision ``since`` into the current snapshot.
+
+        Falls back to the full snapshot when ``since`` is no longer cached.
+        """
+
+        current = self.current(state)
+        base = self._entries.get(int(since))
+        if base is None or base.etag.split(".")[0] != current.etag.split(".")[0]:
+            return {"revision": current.revision, "since": int(since), "full": True, "snapshot": current.snapshot}
+        return {
+            "revision": current.revision,
+            "since": base.revision,
+            "full": False,
+            "ops": snapshot_delta(base.snapshot, current.snapshot),
+        }
+
+
+def snapshot_service(state: GameState) -> SnapshotService:
+    """Return the snapshot service attached to ``state``, creating it on demand."""
+
+    service = state.snapshot_service
+    if service is None:
+        service = state.snapshot_service = SnapshotService()
+    return service
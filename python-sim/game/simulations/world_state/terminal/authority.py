@@ -21,6 +21,7 @@ COMMAND_AUTHORITY_ONLY = {
     "SYNC",
     "POLICY",
     "BUILD",
+    "FORECAST",
 }
 
 
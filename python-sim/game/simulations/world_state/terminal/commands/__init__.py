@@ -16,6 +16,7 @@ from .policy import (
     cmd_set_fabrication,
     cmd_set_policy,
 )
+from .forecast import cmd_forecast
 from .fabrication import cmd_fab_add, cmd_fab_cancel, cmd_fab_priority, cmd_fab_queue
 from .relay import cmd_scan_relays, cmd_stabilize_relay, cmd_sync
 from .assault_ops import (
@@ -39,6 +40,7 @@ __all__ = [
     "cmd_fab_cancel",
     "cmd_fab_priority",
     "cmd_fab_queue",
+    "cmd_forecast",
     "cmd_allocate_defense",
     "cmd_config_doctrine",
     "cmd_fortify",
@@ -42,9 +42,9 @@ def cmd_build(state: GameState, structure_type: str, x_token: str, y_token: str)
     if not grid.in_bounds(x, y):
         return [f"COORDINATES OUT OF BOUNDS: ({x},{y}). GRID {grid.width}x{grid.height}."]
 
-    cell = grid.cells[(x, y)]
-    if cell.structure_id is not None:
-        return [f"CELL OCCUPIED: ({x},{y}) -> {cell.structure_id}."]
+    occupant = grid.structure_id_at(x, y)
+    if occupant is not None:
+        return [f"CELL OCCUPIED: ({x},{y}) -> {occupant}."]
 
     cost = int(profile["cost"])
     if state.materials < cost:
@@ -0,0 +1,24 @@
+"""FORECAST command handler."""
+
+from game.simulations.world_state.core.forecast import (
+    FORECAST_DEFAULT_RUNS,
+    FORECAST_DEFAULT_TICKS,
+    FORECAST_MAX_RUNS,
+    FORECAST_MAX_TICKS,
+    forecast,
+    forecast_lines,
+)
+from game.simulations.world_state.core.state import GameState
+
+
+def cmd_forecast(
+    state: GameState,
+    ticks: int = FORECAST_DEFAULT_TICKS,
+    runs: int = FORECAST_DEFAULT_RUNS,
+) -> list[str]:
+    """Project forked futures forward and summarize outcome spread."""
+
+    if ticks > FORECAST_MAX_TICKS or runs > FORECAST_MAX_RUNS:
+        return [f"FORECAST LIMIT: {FORECAST_MAX_TICKS} TICKS, {FORECAST_MAX_RUNS} FUTURES."]
+    outcomes = forecast(state, ticks=ticks, runs=runs)
+    return forecast_lines(outcomes, ticks)
@@ -9,7 +9,8 @@ TOPIC_LINES = {
         "- STATUS <FAB|POSTURE|ASSAULT|POLICY|SYSTEMS|RELAY|KNOWLEDGE>  View grouped subsystem detail",
         "- WAIT  Advance one command wait cycle",
         "- WAIT NX  Advance N wait cycles",
-        "- WAIT UNTIL <ASSAULT|APPROACH|REPAIR_DONE>  Advance until condition",
+        "- WAIT UNTIL <CONDITION>  Advance until ASSAULT, APPROACH, REPAIR_DONE or <FIELD><OP><N>",
+        "- FORECAST [TICKS] [FUTURES]  Project forked futures without advancing time",
         "- HELP  Show command tree or topic details",
     ],
     "MOVEMENT": [
@@ -84,7 +85,7 @@ def _help_index(dev_mode: bool) -> list[str]:
         "USE: HELP <TOPIC>",
         "TOPICS: CORE | MOVEMENT | SYSTEMS | GRID | POLICY | FABRICATION | ASSAULT | STATUS",
         "",
-        "[CORE] STATUS | WAIT | HELP",
+        "[CORE] STATUS | WAIT | FORECAST | HELP",
         "[MOVEMENT] DEPLOY | MOVE | RETURN",
         "[SYSTEMS] FOCUS | HARDEN | REPAIR | SCAVENGE",
         "[GRID] BUILD <TYPE> <X> <Y>",
@@ -2,6 +2,7 @@
 
 import math
 
+from game.simulations.world_state.core.assault_estimate import estimate_assault_outcome
 from game.simulations.world_state.core.config import (
     ARCHIVE_LOSS_LIMIT,
     COMMAND_CENTER_BREACH_DAMAGE,
@@ -26,6 +27,7 @@ from game.simulations.world_state.core.relays import (
 from game.simulations.world_state.core.state import GameState
 from game.simulations.world_state.core.structures import StructureState
 from game.simulations.world_state.core.tasks import task_target, task_ticks, task_total, task_type
+from game.simulations.world_state.terminal.status_view import status_view
 
 
 MARKERS = {
@@ -121,7 +123,7 @@ def _render_compact_field_view(state: GameState, sector_status_by_name: dict[str
     if location in state.sectors:
         local_label = sector_status_by_name.get(location, state.sectors[location].status_label())
         lines.append(f"LOCAL STATUS: {local_label}")
-        local_structures = [s for s in state.structures.values() if s.sector == location]
+        local_structures = state.structures.in_sector(location)
         degraded_structures = [s for s in local_structures if s.state != StructureState.OPERATIONAL]
         if degraded_structures:
             lines.append("LOCAL DAMAGE:")
@@ -480,71 +482,101 @@ def _root_causes_and_actions(state: GameState) -> tuple[list[str], list[str]]:
     return causes[:2], actions[:2]
 
 
-def cmd_status(state: GameState, full: bool = False) -> list[str]:
-    """Build compact command status and field tactical status outputs."""
-
+def _build_status_base(state: GameState) -> tuple[str, dict, dict[str, str]]:
     fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
     snapshot = state.snapshot()
-    state.fidelity = fidelity
     sector_status_by_name = {item["name"]: item["status"] for item in snapshot["sectors"]}
+    return fidelity, snapshot, sector_status_by_name
+
+
+def _status_base(state: GameState) -> tuple[str, dict, dict[str, str]]:
+    """Return ``(fidelity, snapshot, sector_status_by_name)`` shared by every group."""
+
+    fidelity, snapshot, sector_status_by_name = status_view(state).section(
+        "base", lambda: _build_status_base(state)
+    )
+    state.fidelity = fidelity
+    return fidelity, snapshot, sector_status_by_name
+
+
+def cmd_status(state: GameState, full: bool = False) -> list[str]:
+    """Build compact command status and field tactical status outputs.
+
+    Everything except the FULL sector list is memoized per state revision;
+    that list marks changes since the previous FULL call, so it is rendered
+    every time.
+    """
+
+    fidelity, snapshot, sector_status_by_name = _status_base(state)
+    view = status_view(state)
 
     if state.player_mode == "FIELD":
-        return _render_compact_field_view(state, sector_status_by_name)
+        return list(
+            view.section("field", lambda: tuple(_render_compact_field_view(state, sector_status_by_name)))
+        )
+    if not full:
+        return list(view.section("brief", lambda: _render_brief(state, fidelity, snapshot, sector_status_by_name)))
+    lines = list(view.section("full", lambda: _render_full_header(state, fidelity, snapshot, sector_status_by_name)))
+    lines.extend(_render_full_sectors(state, fidelity, sector_status_by_name))
+    return lines
 
-    if fidelity == "LOST":
-        if not full:
-            lines = [
-                "TIME: ?? | THREAT: UNKNOWN | ASSAULT: NO SIGNAL",
-                "SITUATION: INFORMATION UNSTABLE | POSTURE: UNKNOWN",
-                "CAUSES: COMMS FIDELITY DEGRADED",
-                "ACTIONS: RESTORE COMMS POWER OR REPAIR CM_CORE",
-                "REPAIRS: NO SIGNAL",
-                "RESOURCES: MATERIALS UNKNOWN",
-            ]
-            lines.extend(_render_sector_attention_lines(state, sector_status_by_name))
-            _append_debug_trace_status(lines, state)
-            return lines
 
+def _render_brief(
+    state: GameState,
+    fidelity: str,
+    snapshot: dict,
+    sector_status_by_name: dict[str, str],
+) -> tuple[str, ...]:
+    if fidelity == "LOST":
         lines = [
             "TIME: ?? | THREAT: UNKNOWN | ASSAULT: NO SIGNAL",
-            "POSTURE: - | ARCHIVE: NO SIGNAL",
-            "DEFENSE DOCTRINE: NO SIGNAL",
-            "READINESS: NO SIGNAL",
-            _compute_situation_header(state, sector_status_by_name),
+            "SITUATION: INFORMATION UNSTABLE | POSTURE: UNKNOWN",
+            "CAUSES: COMMS FIDELITY DEGRADED",
+            "ACTIONS: RESTORE COMMS POWER OR REPAIR CM_CORE",
+            "REPAIRS: NO SIGNAL",
+            "RESOURCES: MATERIALS UNKNOWN",
         ]
+        lines.extend(_render_sector_attention_lines(state, sector_status_by_name))
         _append_debug_trace_status(lines, state)
-        lines.extend(["", "SECTORS:"])
-        sorted_sectors = sorted(state.sectors.values(), key=_sector_priority)
-        stable_header_added = False
-        for sector in sorted_sectors:
-            marker = MARKERS.get("NO DATA", "?")
-            if marker == "." and not stable_header_added:
-                lines.append("---")
-                stable_header_added = True
-            lines.append(f"{sector.name:<12} {marker}")
-            state._last_sector_status[sector.name] = "NO DATA"
-        return lines
+        return tuple(lines)
 
     posture = _system_posture(state, fidelity)
+    causes, actions = _root_causes_and_actions(state)
+    situation = _compute_situation_header(state, sector_status_by_name).replace("SITUATION: ", "")
+    lines = [
+        f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
+        f"SITUATION: {situation} | POSTURE: {posture} | FIDELITY: {fidelity}",
+        "CAUSES: " + " | ".join(causes),
+        "ACTIONS: " + " | ".join(actions),
+        f"RESOURCES: MATERIALS {snapshot.get('resources', {}).get('materials', 0)}",
+        _brief_repair_line(snapshot, state, fidelity),
+    ]
+    assault_line = _brief_assault_line(state, fidelity)
+    if assault_line:
+        lines.append(assault_line)
+    lines.extend(_render_sector_attention_lines(state, sector_status_by_name))
+    _append_debug_trace_status(lines, state)
+    return tuple(lines)
 
-    if not full:
-        causes, actions = _root_causes_and_actions(state)
-        situation = _compute_situation_header(state, sector_status_by_name).replace("SITUATION: ", "")
+
+def _render_full_header(
+    state: GameState,
+    fidelity: str,
+    snapshot: dict,
+    sector_status_by_name: dict[str, str],
+) -> tuple[str, ...]:
+    if fidelity == "LOST":
         lines = [
-            f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
-            f"SITUATION: {situation} | POSTURE: {posture} | FIDELITY: {fidelity}",
-            "CAUSES: " + " | ".join(causes),
-            "ACTIONS: " + " | ".join(actions),
-            f"RESOURCES: MATERIALS {snapshot.get('resources', {}).get('materials', 0)}",
-            _brief_repair_line(snapshot, state, fidelity),
+            "TIME: ?? | THREAT: UNKNOWN | ASSAULT: NO SIGNAL",
+            "POSTURE: - | ARCHIVE: NO SIGNAL",
+            "DEFENSE DOCTRINE: NO SIGNAL",
+            "READINESS: NO SIGNAL",
+            _compute_situation_header(state, sector_status_by_name),
         ]
-        assault_line = _brief_assault_line(state, fidelity)
-        if assault_line:
-            lines.append(assault_line)
-        lines.extend(_render_sector_attention_lines(state, sector_status_by_name))
         _append_debug_trace_status(lines, state)
-        return lines
+        return tuple(lines)
 
+    posture = _system_posture(state, fidelity)
     archive_text = (
         f"{state.archive_losses}/{ARCHIVE_LOSS_LIMIT}"
         if fidelity == "FULL"
@@ -601,10 +633,27 @@ def cmd_status(state: GameState, full: bool = False) -> list[str]:
     _append_recovery_windows(lines, state, fidelity)
     _append_policy_state(lines, state, fidelity)
     _append_debug_trace_status(lines, state)
+    return tuple(lines)
+
 
-    lines.extend(["", "SECTORS:"])
+def _render_full_sectors(
+    state: GameState,
+    fidelity: str,
+    sector_status_by_name: dict[str, str],
+) -> list[str]:
+    lines = ["", "SECTORS:"]
     sorted_sectors = sorted(state.sectors.values(), key=_sector_priority)
     stable_header_added = False
+    if fidelity == "LOST":
+        for sector in sorted_sectors:
+            marker = MARKERS.get("NO DATA", "?")
+            if marker == "." and not stable_header_added:
+                lines.append("---")
+                stable_header_added = True
+            lines.append(f"{sector.name:<12} {marker}")
+            state._last_sector_status[sector.name] = "NO DATA"
+        return lines
+
     for sector in sorted_sectors:
         current = sector_status_by_name.get(sector.name, sector.status_label())
         marker = MARKERS.get(current, ".")
@@ -622,7 +671,7 @@ def cmd_status(state: GameState, full: bool = False) -> list[str]:
         lines.append(f"{sector.name:<12} {marker}{delta}")
         state._last_sector_status[sector.name] = current
         if fidelity == "FULL":
-            sector_structures = [s for s in state.structures.values() if s.sector == sector.name]
+            sector_structures = state.structures.in_sector(sector.name)
             for structure in sector_structures:
                 lines.append(f"  - {structure.id} {structure.state.value}")
 
@@ -631,7 +680,7 @@ def cmd_status(state: GameState, full: bool = False) -> list[str]:
 
 def _status_fabrication(state: GameState) -> list[str]:
     lines = ["STATUS GROUP: FABRICATION"]
-    snapshot = state.snapshot()
+    snapshot = status_view(state).section("base", lambda: _build_status_base(state))[1]
     resources = snapshot.get("resources", {})
     ambient = ambient_fabrication_projection(state)
     lines.extend(
@@ -674,9 +723,7 @@ def _status_fabrication(state: GameState) -> list[str]:
 
 
 def _status_posture(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
+    fidelity, snapshot, _ = _status_base(state)
     posture = _system_posture(state, fidelity)
     archive_text = (
         f"{state.archive_losses}/{ARCHIVE_LOSS_LIMIT}"
@@ -698,9 +745,7 @@ def _status_posture(state: GameState) -> list[str]:
 
 
 def _status_assault(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
+    fidelity, snapshot, _ = _status_base(state)
     lines = [
         "STATUS GROUP: ASSAULT",
         f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
@@ -712,6 +757,10 @@ def _status_assault(state: GameState) -> list[str]:
         lines.append(f"NEXT ASSAULT ETA: {state.assault_timer} TICKS")
     lines.append(f"APPROACH TRACKS: {len(state.assaults)}")
     _append_assault_eta(lines, state, fidelity)
+    if fidelity == "FULL":
+        estimate = estimate_assault_outcome(state)
+        if estimate is not None:
+            lines.append(estimate.status_line())
     if state.last_assault_lines:
         lines.append("LAST TACTICAL SUMMARY:")
         lines.extend(f"- {line}" for line in state.last_assault_lines[:6])
@@ -719,9 +768,7 @@ def _status_assault(state: GameState) -> list[str]:
 
 
 def _status_policy(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
+    fidelity, snapshot, _ = _status_base(state)
     lines = [
         "STATUS GROUP: POLICY",
         f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
@@ -738,10 +785,7 @@ def _status_policy(state: GameState) -> list[str]:
 
 
 def _status_systems(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
-    sector_status_by_name = {item["name"]: item["status"] for item in snapshot["sectors"]}
+    fidelity, snapshot, sector_status_by_name = _status_base(state)
     lines = [
         "STATUS GROUP: SYSTEMS",
         f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
@@ -758,7 +802,7 @@ def _status_systems(state: GameState) -> list[str]:
             stable_header_added = True
         lines.append(f"{sector.name:<12} {marker}")
         if fidelity == "FULL":
-            sector_structures = [s for s in state.structures.values() if s.sector == sector.name]
+            sector_structures = state.structures.in_sector(sector.name)
             for structure in sector_structures:
                 lines.append(f"  - {structure.id} {structure.state.value}")
     _append_repairs(lines, snapshot, state, fidelity)
@@ -767,9 +811,7 @@ def _status_systems(state: GameState) -> list[str]:
 
 
 def _status_relay(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
+    fidelity, snapshot, _ = _status_base(state)
     lines = [
         "STATUS GROUP: RELAY",
         f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
@@ -780,9 +822,7 @@ def _status_relay(state: GameState) -> list[str]:
 
 
 def _status_knowledge(state: GameState) -> list[str]:
-    snapshot = state.snapshot()
-    fidelity = relay_effective_fidelity_floor(state, comms_fidelity(state))
-    state.fidelity = fidelity
+    fidelity, snapshot, _ = _status_base(state)
     lines = [
         "STATUS GROUP: KNOWLEDGE",
         f"TIME: {snapshot['time']} | THREAT: {snapshot['threat']} | ASSAULT: {snapshot['assault']}",
@@ -792,6 +832,17 @@ def _status_knowledge(state: GameState) -> list[str]:
     return lines
 
 
+STATUS_GROUP_RENDERERS = {
+    "FAB": _status_fabrication,
+    "POSTURE": _status_posture,
+    "ASSAULT": _status_assault,
+    "POLICY": _status_policy,
+    "SYSTEMS": _status_systems,
+    "RELAY": _status_relay,
+    "KNOWLEDGE": _status_knowledge,
+}
+
+
 def cmd_status_group(state: GameState, group: str) -> list[str] | None:
     normalized = STATUS_GROUP_ALIASES.get(group.strip().upper())
     if normalized is None:
@@ -800,18 +851,8 @@ def cmd_status_group(state: GameState, group: str) -> list[str] | None:
         return cmd_status(state, full=True)
     if normalized == "BRIEF":
         return cmd_status(state, full=False)
-    if normalized == "FAB":
-        return _status_fabrication(state)
-    if normalized == "POSTURE":
-        return _status_posture(state)
-    if normalized == "ASSAULT":
-        return _status_assault(state)
-    if normalized == "POLICY":
-        return _status_policy(state)
-    if normalized == "SYSTEMS":
-        return _status_systems(state)
-    if normalized == "RELAY":
-        return _status_relay(state)
-    if normalized == "KNOWLEDGE":
-        return _status_knowledge(state)
-    return None
+    render = STATUS_GROUP_RENDERERS[normalized]
+    if normalized != "FAB":
+        # Refreshes state.fidelity even when the group is served from cache.
+        _status_base(state)
+    return list(status_view(state).section(f"group:{normalized}", lambda: tuple(render(state))))
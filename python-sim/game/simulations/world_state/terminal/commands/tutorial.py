@@ -17,7 +17,7 @@ TOPIC_LINES = {
         "[SYSTEM] ...DETAIL LINES (EVENTS, WARNINGS, REPAIRS, ASSAULTS)",
         "-----",
         "TIME-BEARING COMMANDS:",
-        "- WAIT / WAIT NX / WAIT UNTIL <ASSAULT|APPROACH|REPAIR_DONE>",
+        "- WAIT / WAIT NX / WAIT UNTIL <CONDITION> (ASSAULT, APPROACH, REPAIR_DONE OR <FIELD><OP><N>)",
         "- SCAVENGE / SCAVENGE NX",
         "RESOURCE TRIAD: MATERIALS, INVENTORY INPUTS, AND STOCK (AMMO/DRONES).",
         "POWER AND COMMS SET FIDELITY: LOWER FIDELITY = LESS DETAIL + SHORTER WARNING WINDOW.",
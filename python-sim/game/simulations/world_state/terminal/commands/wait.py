@@ -1,9 +1,6 @@
 """WAIT command handler."""
 
-from contextlib import redirect_stdout
 from dataclasses import dataclass
-import io
-import time
 
 from game.simulations.world_state.core.config import (
     FIELD_ACTION_IDLE,
@@ -16,6 +13,7 @@ from game.simulations.world_state.core.power import comms_fidelity
 from game.simulations.world_state.core.relays import threat_forecast_bonus_ticks
 from game.simulations.world_state.core.simulation import step_world
 from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.wait_conditions import WAIT_UNTIL_HELP, compile_wait_condition
 from game.simulations.world_state.terminal.procgen_text import (
     render_wait_assault_line,
     render_wait_event_line,
@@ -114,12 +112,11 @@ def _format_status_shift(state: GameState, *, fidelity: str) -> str | None:
 def _advance_tick(state: GameState) -> WaitTickInfo:
     before_time = state.time
     before_threat = state.ambient_threat
-    before_damage = sum(sector.damage for sector in state.sectors.values())
+    before_damage = state.sector_totals.damage
     was_assault_active = state.in_major_assault or state.current_assault is not None
     previous_timer = state.assault_timer
 
-    captured = io.StringIO()
-    with redirect_stdout(captured):
+    with state.clock.capture(state) as capture:
         became_failed = step_world(state)
         tick_presence(state)
         repair_lines = state.last_repair_lines
@@ -129,12 +126,16 @@ def _advance_tick(state: GameState) -> WaitTickInfo:
         fidelity_lines = state.last_fidelity_lines
         if not state.active_repairs and state.field_action == FIELD_ACTION_REPAIRING:
             state.field_action = FIELD_ACTION_IDLE
+        trace_records = capture.drain("trace")
     debug_lines: list[str] = []
     if state.dev_mode and state.dev_trace:
-        for line in captured.getvalue().splitlines():
-            cleaned = line.strip()
+        for record in trace_records:
+            cleaned = record.text.strip()
             if cleaned.startswith("{") and "'tick':" in cleaned:
                 debug_lines.append(f"[DEBUG] {cleaned}")
+        combat_log = getattr(state, "combat_log", None)
+        if combat_log is not None:
+            debug_lines.extend(f"[COMBAT] {event.text()}" for event in combat_log.drain())
 
     fidelity = _fidelity_from_comms(state)
     structure_loss_lines = _consume_structure_loss_lines(state, fidelity)
@@ -179,7 +180,7 @@ def _advance_tick(state: GameState) -> WaitTickInfo:
             assault_warning = True
 
     after_threat = state.ambient_threat
-    after_damage = sum(sector.damage for sector in state.sectors.values())
+    after_damage = state.sector_totals.damage
     stability_declining = (
         after_threat > before_threat + 0.02
         or after_damage > before_damage + 0.05
@@ -297,7 +298,7 @@ def cmd_wait_ticks(state: GameState, ticks: int) -> list[str]:
 
         if suppress_tick_lines:
             if index < total_ticks - 1:
-                time.sleep(WAIT_TICK_DELAY_SECONDS)
+                state.clock.pause(WAIT_TICK_DELAY_SECONDS)
             continue
 
         for line in tick_lines:
@@ -310,7 +311,7 @@ def cmd_wait_ticks(state: GameState, ticks: int) -> list[str]:
             break
 
         if index < total_ticks - 1:
-            time.sleep(WAIT_TICK_DELAY_SECONDS)
+            state.clock.pause(WAIT_TICK_DELAY_SECONDS)
 
     if detail_lines:
         lines.extend(detail_lines)
@@ -319,52 +320,48 @@ def cmd_wait_ticks(state: GameState, ticks: int) -> list[str]:
 
 
 def cmd_wait_until(state: GameState, condition: str) -> list[str]:
-    """Advance until a named condition is met or a safety cap is reached."""
+    """Advance until a condition holds or a safety cap is reached.
+
+    The condition is compiled once and tested after every tick. Ticks before
+    the exit tick are only tallied, never narrated; the report is a summary
+    plus the exit tick's own detail lines.
+    """
 
     if state.is_failed:
         return _failure_lines(state)
 
-    token = condition.strip().upper()
-    if token not in {"ASSAULT", "APPROACH", "REPAIR_DONE"}:
-        return ["WAIT UNTIL REQUIRES: ASSAULT, APPROACH, OR REPAIR_DONE."]
+    compiled = compile_wait_condition(condition)
+    if compiled is None:
+        return list(WAIT_UNTIL_HELP)
 
-    lines = [f"TIME ADVANCED UNTIL {token}."]
-    detail_lines: list[str] = []
-    last_detail_line = lines[0]
-    last_signal_key: str | None = None
+    start_time = state.time
+    events = 0
+    repairs = 0
+    structure_loss_lines: list[str] = []
     condition_met = False
+    info = None
 
     for _ in range(WAIT_UNTIL_MAX_TICKS):
         info = _advance_tick(state)
-        tick_lines = _detail_lines_for_tick(info, state)
-        signal_key = _primary_signal_key(info)
-        suppress_tick_lines = (
-            signal_key is not None
-            and signal_key == last_signal_key
-            and not info.became_failed
-        )
-        if not suppress_tick_lines and signal_key is not None:
-            last_signal_key = signal_key
-
-        if not suppress_tick_lines:
-            for line in tick_lines:
-                if line == last_detail_line:
-                    continue
-                detail_lines.append(line)
-                last_detail_line = line
-
-        if token == "ASSAULT":
-            condition_met = info.assault_active or info.assault_started
-        elif token == "APPROACH":
-            condition_met = bool(state.assaults)
-        else:
-            condition_met = bool(info.repair_names)
-
+        if info.fidelity != "LOST":
+            events += 1 if info.event_name else 0
+            repairs += len(info.repair_names)
+        structure_loss_lines.extend(info.structure_loss_lines)
+        condition_met = compiled.test(state)
         if info.became_failed or condition_met:
             break
 
-    if detail_lines:
-        lines.extend(detail_lines)
+    lines = [f"TIME ADVANCED UNTIL {compiled.label}."]
+    if info.fidelity == "LOST":
+        lines.append(f"ELAPSED: {state.time - start_time} TICKS | SIGNAL: LOST")
+    else:
+        lines.append(f"ELAPSED: {state.time - start_time} TICKS | EVENTS: {events} | REPAIRS COMPLETE: {repairs}")
+    lines.extend(structure_loss_lines)
+    last_line = lines[-1]
+    for line in _detail_lines_for_tick(info, state):
+        if line != last_line and line not in structure_loss_lines:
+            lines.append(line)
+            last_line = line
     if not condition_met and not state.is_failed:
         lines.append("CONDITION NOT MET BEFORE SAFETY LIMIT.")
     return lines
@@ -1,8 +1,15 @@
 """Parsing utilities for terminal input."""
 
 from dataclasses import dataclass
+from functools import lru_cache
+import re
 import shlex
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+
+# Quotes, escapes, or whitespace outside shlex's " \t\r\n" set; lines without
+# any of these split identically with ``str.split``.
+_NEEDS_SHLEX = re.compile(r"[\"'\\]|[^\S \t\r\n]")
 
 
 @dataclass(frozen=True)
@@ -20,6 +27,25 @@ class ParsedCommand:
     args: List[str]
 
 
+@lru_cache(maxsize=512)
+def tokenize(raw: str) -> Tuple[str, ...]:
+    """Split a command line into tokens with shell-style quoting.
+
+    Plain lines skip ``shlex`` entirely; results are cached because scripted
+    runs repeat the same few lines.
+
+    Args:
+        raw: Trimmed command line.
+
+    Returns:
+        Token tuple; empty when the line has no tokens.
+    """
+
+    if _NEEDS_SHLEX.search(raw) is None:
+        return tuple(raw.split())
+    return tuple(shlex.split(raw))
+
+
 def parse_input(text: str) -> Optional[ParsedCommand]:
     """Parse raw input into verb and argument tokens.
 
@@ -34,7 +60,7 @@ def parse_input(text: str) -> Optional[ParsedCommand]:
     if not raw:
         return None
 
-    tokens = shlex.split(raw)
+    tokens = tokenize(raw)
     if not tokens:
         return None
 
@@ -44,5 +70,5 @@ def parse_input(text: str) -> Optional[ParsedCommand]:
     if not verb_token:
         return None
     verb = verb_token.upper()
-    args = tokens[1:]
+    args = list(tokens[1:])
     return ParsedCommand(raw=raw, verb=verb, args=args)
@@ -1,13 +1,14 @@
 """Command processor for the world-state terminal."""
 
 from collections.abc import Callable
+from functools import lru_cache
 
 from game.simulations.world_state.core.assaults import start_assault
 from game.simulations.world_state.core.config import SECTOR_DEFS
 from game.simulations.world_state.core.presence import tick_presence
 from game.simulations.world_state.core.state import GameState
 from game.simulations.world_state.core.structures import StructureState
-from game.simulations.world_state.core.invariants import validate_state_invariants
+from game.simulations.world_state.core.invariants import check_invariants
 from game.simulations.world_state.core.simulation import step_world
 from game.simulations.world_state.terminal.authority import requires_command_authority
 from game.simulations.world_state.terminal.commands import (
@@ -23,6 +24,7 @@ from game.simulations.world_state.terminal.commands import (
     cmd_fab_cancel,
     cmd_fab_priority,
     cmd_fab_queue,
+    cmd_forecast,
     cmd_boost_defense,
     cmd_deploy_drone,
     cmd_lockdown,
@@ -44,27 +46,21 @@ from game.simulations.world_state.terminal.commands import (
     cmd_status_group,
     cmd_stabilize_relay,
     cmd_sync,
-    cmd_wait,
     cmd_wait_until,
     cmd_wait_ticks,
     cmd_build,
 )
 from game.simulations.world_state.terminal.tutorial_flow import apply_tutorial, start_quickstart
-from game.simulations.world_state.terminal.parser import parse_input
+from game.simulations.world_state.terminal.parser import ParsedCommand, parse_input
+from game.simulations.world_state.terminal.registry import CommandRegistry, CommandSpec, HandlerResult
 from game.simulations.world_state.terminal.result import CommandResult
+from game.simulations.world_state.terminal.status_view import carry_status_view
 from game.simulations.world_state.terminal.messages import MESSAGES
 
-Handler = Callable[[GameState], list[str]]
 SECTOR_ID_TO_NAME = {sector["id"]: sector["name"] for sector in SECTOR_DEFS}
 SECTOR_NAME_TO_NAME = {sector["name"]: sector["name"] for sector in SECTOR_DEFS}
 
 
-COMMAND_HANDLERS: dict[str, Handler] = {
-    "STATUS": cmd_status,
-    "WAIT": cmd_wait,
-}
-
-
 def _unknown_command() -> CommandResult:
     return CommandResult(
         ok=False,
@@ -74,7 +70,7 @@ def _unknown_command() -> CommandResult:
 
 
 def _finalize_result(state: GameState, result: CommandResult, verb: str | None = None) -> CommandResult:
-    validate_state_invariants(state)
+    check_invariants(state)
     if verb and result.text:
         state.operator_log.append(f"T{state.time:04d} {verb}: {result.text}")
         if len(state.operator_log) > 300:
@@ -112,6 +108,7 @@ def _parse_multiplier(token: str) -> int | None:
     return count
 
 
+@lru_cache(maxsize=256)
 def _resolve_sector_name(token: str) -> str | None:
     normalized = token.strip().upper()
     if not normalized:
@@ -290,6 +287,22 @@ def process_command(state: GameState, raw: str) -> CommandResult:
     """
 
     parsed = parse_input(raw)
+    spec = COMMAND_REGISTRY.resolve(parsed.verb) if parsed is not None else None
+    recorder = state.replay_recorder
+    if recorder is not None:
+        recorder.begin_command(state, raw)
+    revision = state.revision
+    try:
+        return _dispatch_command(state, parsed, spec)
+    finally:
+        state.revision += 1
+        if spec is not None and spec.read_only:
+            carry_status_view(state, revision)
+        if recorder is not None:
+            recorder.end_command(state)
+
+
+def _dispatch_command(state: GameState, parsed: ParsedCommand | None, spec: CommandSpec | None) -> CommandResult:
     if parsed is None:
         return _finalize_result(state, _unknown_command())
     state.tutorial_last_command = {
@@ -298,17 +311,7 @@ def process_command(state: GameState, raw: str) -> CommandResult:
         "raw": parsed.raw,
     }
 
-    if parsed.verb in {"RESET", "REBOOT"}:
-        lines = cmd_reset(state)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-
-    if state.is_failed:
+    if state.is_failed and (spec is None or not spec.allowed_when_failed):
         return _finalize_result(
             state,
             CommandResult(
@@ -324,416 +327,264 @@ def process_command(state: GameState, raw: str) -> CommandResult:
             CommandResult(ok=False, text=MESSAGES["AUTHORITY_REQUIRED"]),
         )
 
-    if parsed.verb == "DEBUG":
-        if not state.dev_mode:
-            return _finalize_result(state, CommandResult(ok=False, text="DEV MODE DISABLED."))
-        return _finalize_result(
-            state,
-            _handle_debug_command(state, parsed.args),
-            "DEBUG",
-        )
-
-    if parsed.verb == "CONFIG":
-        if len(parsed.args) != 2:
-            return _finalize_result(state, CommandResult(ok=False, text="CONFIG DOCTRINE <NAME>"))
-        if parsed.args[0].strip().upper() != "DOCTRINE":
+    if spec is None:
+        return _finalize_result(state, _unknown_command())
+    if spec.dev_only and not state.dev_mode:
+        return _finalize_result(state, CommandResult(ok=False, text="DEV MODE DISABLED."))
+    if not spec.accepts(len(parsed.args)):
+        if spec.usage is None:
             return _finalize_result(state, _unknown_command())
-        lines = cmd_config_doctrine(state, parsed.args[1])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+        return _finalize_result(state, CommandResult(ok=False, text=spec.usage))
 
-    if parsed.verb == "STATUS":
-        if len(parsed.args) == 0:
-            lines = cmd_status(state, full=False)
-        elif len(parsed.args) == 1:
-            lines = cmd_status_group(state, parsed.args[0])
-            if lines is None:
-                return _finalize_result(
-                    state,
-                    CommandResult(
-                        ok=False,
-                        text=(
-                            "STATUS <BRIEF|FULL|FAB|POSTURE|ASSAULT|POLICY|SYSTEMS|RELAY|KNOWLEDGE>"
-                        ),
-                    ),
-                )
-        else:
-            return _finalize_result(
-                state,
-                CommandResult(
-                    ok=False,
-                    text="STATUS <BRIEF|FULL|FAB|POSTURE|ASSAULT|POLICY|SYSTEMS|RELAY|KNOWLEDGE>",
-                ),
-            )
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+    outcome = spec.handler(state, parsed.args)
+    if isinstance(outcome, CommandResult):
+        return _finalize_result(state, outcome, parsed.verb if spec.log_failures else None)
+    return _finalize_result(state, _lines_result(outcome), parsed.verb)
 
-    if parsed.verb == "HELP":
-        if len(parsed.args) > 1:
-            return _finalize_result(state, CommandResult(ok=False, text="HELP <TOPIC>"))
-        topic = parsed.args[0] if parsed.args else None
-        lines = cmd_help(dev_mode=state.dev_mode, topic=topic)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "TUTORIAL":
-        if len(parsed.args) > 1:
-            return _finalize_result(state, CommandResult(ok=False, text="TUTORIAL <TOPIC>"))
-        topic = parsed.args[0] if parsed.args else None
-        if topic and topic.strip().upper() == "QUICKSTART":
-            lines = start_quickstart(state)
-        else:
-            lines = cmd_tutorial(topic=topic)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+def _lines_result(lines: list[str]) -> CommandResult:
+    primary_line = lines[0] if lines else "COMMAND EXECUTED."
+    detail_lines = lines[1:] if len(lines) > 1 else None
+    return CommandResult(ok=True, text=primary_line, lines=detail_lines)
 
-    if parsed.verb == "SET":
-        if len(parsed.args) == 2:
-            lines = cmd_set_policy(state, parsed.args[0], parsed.args[1])
-        elif len(parsed.args) == 3 and parsed.args[0].strip().upper() == "FAB":
-            lines = cmd_set_fabrication(state, parsed.args[1], parsed.args[2])
-        else:
-            return _finalize_result(
-                state,
-                CommandResult(ok=False, text="SET <REPAIR|DEFENSE|SURVEILLANCE> <0-4> | SET FAB <CAT> <0-4>"),
-            )
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "POLICY":
-        if len(parsed.args) == 1 and parsed.args[0].strip().upper() == "SHOW":
-            lines = cmd_policy_show(state)
-        elif len(parsed.args) == 2 and parsed.args[0].strip().upper() == "PRESET":
-            lines = cmd_policy_preset(state, parsed.args[1])
-        elif len(parsed.args) == 2 and parsed.args[0].strip().upper() in {"DRONE_REPAIR", "DRONES"}:
-            lines = cmd_policy_drone_repair(state, parsed.args[1])
-        else:
-            return _finalize_result(
-                state,
-                CommandResult(
-                    ok=False,
-                    text="POLICY SHOW | POLICY PRESET <NAME> | POLICY DRONE_REPAIR <AUTO|OFF>",
-                ),
-            )
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+def _is_unknown(lines: list[str]) -> bool:
+    return lines[:2] == ["UNKNOWN COMMAND.", "TYPE HELP FOR AVAILABLE COMMANDS."]
 
-    if parsed.verb == "FORTIFY":
-        if len(parsed.args) != 2:
-            return _finalize_result(
-                state,
-                CommandResult(ok=False, text="FORTIFY <SECTOR|T_NORTH|T_SOUTH> <0-4>"),
-            )
-        lines = cmd_fortify(state, parsed.args[0], parsed.args[1])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "ALLOCATE":
-        if len(parsed.args) != 3:
-            return _finalize_result(state, CommandResult(ok=False, text="ALLOCATE DEFENSE <SECTOR> <PERCENT>"))
-        if parsed.args[0].strip().upper() != "DEFENSE":
-            return _finalize_result(state, _unknown_command())
-        lines = cmd_allocate_defense(state, parsed.args[1], parsed.args[2])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+STATUS_USAGE = "STATUS <BRIEF|FULL|FAB|POSTURE|ASSAULT|POLICY|SYSTEMS|RELAY|KNOWLEDGE>"
+SET_USAGE = "SET <REPAIR|DEFENSE|SURVEILLANCE> <0-4> | SET FAB <CAT> <0-4>"
+POLICY_USAGE = "POLICY SHOW | POLICY PRESET <NAME> | POLICY DRONE_REPAIR <AUTO|OFF>"
+FAB_USAGE = "FAB ADD <ITEM> | FAB QUEUE | FAB CANCEL <ID> | FAB PRIORITY <CATEGORY>"
+WAIT_UNTIL_USAGE = "WAIT UNTIL <CONDITION>"
+FORECAST_USAGE = "FORECAST [TICKS] [FUTURES]"
+REPAIR_USAGE = "REPAIR <STRUCTURE> [FULL]"
+MULTI_WORD_TARGET = "USE QUOTES FOR MULTI-WORD TARGET."
 
-    if parsed.verb == "FAB":
-        if not parsed.args:
-            return _finalize_result(state, CommandResult(ok=False, text="FAB <ADD|QUEUE|CANCEL|PRIORITY> ..."))
-        sub = parsed.args[0].strip().upper()
-        if sub == "ADD" and len(parsed.args) == 2:
-            lines = cmd_fab_add(state, parsed.args[1])
-        elif sub == "QUEUE" and len(parsed.args) == 1:
-            lines = cmd_fab_queue(state)
-        elif sub == "CANCEL" and len(parsed.args) == 2:
-            lines = cmd_fab_cancel(state, parsed.args[1])
-        elif sub == "PRIORITY" and len(parsed.args) == 2:
-            lines = cmd_fab_priority(state, parsed.args[1])
-        else:
-            return _finalize_result(state, CommandResult(ok=False, text="FAB ADD <ITEM> | FAB QUEUE | FAB CANCEL <ID> | FAB PRIORITY <CATEGORY>"))
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "REROUTE":
-        if len(parsed.args) == 2 and parsed.args[0].strip().upper() == "POWER":
-            lines = cmd_reroute_power(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(state, CommandResult(ok=True, text=primary_line, lines=detail_lines), parsed.verb)
-        return _finalize_result(state, CommandResult(ok=False, text="REROUTE POWER <SECTOR>"))
-
-    if parsed.verb == "BOOST":
-        if len(parsed.args) == 2 and parsed.args[0].strip().upper() == "DEFENSE":
-            lines = cmd_boost_defense(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(state, CommandResult(ok=True, text=primary_line, lines=detail_lines), parsed.verb)
-        return _finalize_result(state, CommandResult(ok=False, text="BOOST DEFENSE <SECTOR>"))
-
-    if parsed.verb == "DRONE":
-        if len(parsed.args) == 2 and parsed.args[0].strip().upper() == "DEPLOY":
-            lines = cmd_deploy_drone(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(state, CommandResult(ok=True, text=primary_line, lines=detail_lines), parsed.verb)
-        return _finalize_result(state, CommandResult(ok=False, text="DRONE DEPLOY <SECTOR>"))
-
-    if parsed.verb == "LOCKDOWN":
-        if len(parsed.args) == 1:
-            lines = cmd_lockdown(state, parsed.args[0])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(state, CommandResult(ok=True, text=primary_line, lines=detail_lines), parsed.verb)
-        return _finalize_result(state, CommandResult(ok=False, text="LOCKDOWN <SECTOR>"))
-
-    if parsed.verb == "PRIORITIZE":
-        if len(parsed.args) == 2 and parsed.args[0].strip().upper() == "REPAIR":
-            lines = cmd_prioritize_repair(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(state, CommandResult(ok=True, text=primary_line, lines=detail_lines), parsed.verb)
-        return _finalize_result(state, CommandResult(ok=False, text="PRIORITIZE REPAIR <SECTOR>"))
-
-    if parsed.verb == "WAIT":
-        if parsed.args and parsed.args[0].strip().upper() == "UNTIL":
-            if len(parsed.args) != 2:
-                return _finalize_result(
-                    state,
-                    CommandResult(ok=False, text="WAIT UNTIL <ASSAULT|APPROACH|REPAIR_DONE>"),
-                )
-            lines = cmd_wait_until(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(
-                state,
-                CommandResult(ok=True, text=primary_line, lines=detail_lines),
-                parsed.verb,
-            )
-        ticks = _parse_wait_ticks(parsed.args)
-        if ticks is None:
-            return _finalize_result(state, _unknown_command())
-        lines = cmd_wait_ticks(state, ticks)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+def _subcommand(args: list[str], index: int = 0) -> str:
+    return args[index].strip().upper()
 
-    if parsed.verb == "SCAN":
-        if len(parsed.args) == 1 and parsed.args[0].strip().upper() == "RELAYS":
-            lines = cmd_scan_relays(state)
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(
-                state,
-                CommandResult(ok=True, text=primary_line, lines=detail_lines),
-                parsed.verb,
-            )
-        return _finalize_result(state, CommandResult(ok=False, text="SCAN RELAYS"))
-
-    if parsed.verb == "STABILIZE":
-        if len(parsed.args) == 2 and parsed.args[0].strip().upper() == "RELAY":
-            lines = cmd_stabilize_relay(state, parsed.args[1])
-            primary_line = lines[0] if lines else "COMMAND EXECUTED."
-            detail_lines = lines[1:] if len(lines) > 1 else None
-            return _finalize_result(
-                state,
-                CommandResult(ok=True, text=primary_line, lines=detail_lines),
-                parsed.verb,
-            )
-        return _finalize_result(state, CommandResult(ok=False, text="STABILIZE RELAY <ID>"))
-
-    if parsed.verb == "SYNC":
-        if parsed.args:
-            return _finalize_result(state, _unknown_command())
-        lines = cmd_sync(state)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "DEPLOY" and len(parsed.args) == 2 and parsed.args[0].strip().upper() == "DRONE":
-        lines = cmd_deploy_drone(state, parsed.args[1])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+def _handle_reset(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_reset(state)
 
-    if parsed.verb == "DEPLOY":
-        if len(parsed.args) > 1:
-            return _finalize_result(state, CommandResult(ok=False, text="USE QUOTES FOR MULTI-WORD TARGET."))
-        destination = parsed.args[0] if parsed.args else ""
-        lines = cmd_deploy(state, destination)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "MOVE":
-        if len(parsed.args) == 0:
-            return _finalize_result(state, CommandResult(ok=False, text="MOVE REQUIRES TARGET."))
-        if len(parsed.args) > 1:
-            return _finalize_result(state, CommandResult(ok=False, text="USE QUOTES FOR MULTI-WORD TARGET."))
-        lines = cmd_move(state, parsed.args[0])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "RETURN":
-        if parsed.args:
-            return _finalize_result(state, _unknown_command())
-        lines = cmd_return(state)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
 
-    if parsed.verb == "FOCUS":
-        if len(parsed.args) == 0:
-            return _finalize_result(state, CommandResult(ok=False, text="FOCUS REQUIRES SECTOR ID."))
-        if len(parsed.args) > 1:
-            return _finalize_result(state, CommandResult(ok=False, text="USE QUOTES FOR MULTI-WORD SECTOR."))
-        lines = cmd_focus(state, parsed.args[0])
-        if lines[:2] == ["UNKNOWN COMMAND.", "TYPE HELP FOR AVAILABLE COMMANDS."]:
-            return _finalize_result(state, _unknown_command())
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "HARDEN":
-        if parsed.args:
-            return _finalize_result(state, _unknown_command())
-        lines = cmd_harden(state)
-        if lines[:2] == ["UNKNOWN COMMAND.", "TYPE HELP FOR AVAILABLE COMMANDS."]:
-            return _finalize_result(state, _unknown_command())
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "REPAIR":
-        if len(parsed.args) == 0:
-            return _finalize_result(state, CommandResult(ok=False, text="REPAIR REQUIRES STRUCTURE ID."))
-        if len(parsed.args) > 2:
-            return _finalize_result(state, CommandResult(ok=False, text="REPAIR <STRUCTURE> [FULL]"))
-        full = False
-        if len(parsed.args) == 2:
-            if parsed.args[1].strip().upper() != "FULL":
-                return _finalize_result(state, CommandResult(ok=False, text="REPAIR <STRUCTURE> [FULL]"))
-            full = True
-        lines = cmd_repair(state, parsed.args[0], full=full)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "BUILD":
-        if len(parsed.args) != 3:
-            return _finalize_result(state, CommandResult(ok=False, text="BUILD <TYPE> <X> <Y>"))
-        lines = cmd_build(state, parsed.args[0], parsed.args[1], parsed.args[2])
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
-    if parsed.verb == "SCAVENGE":
-        if len(parsed.args) > 1:
-            return _finalize_result(state, _unknown_command())
-        if not parsed.args:
-            lines = cmd_scavenge(state)
-        else:
-            runs = _parse_multiplier(parsed.args[0])
-            if runs is None:
-                return _finalize_result(state, _unknown_command())
-            lines = cmd_scavenge_runs(state, runs)
-        primary_line = lines[0] if lines else "COMMAND EXECUTED."
-        detail_lines = lines[1:] if len(lines) > 1 else None
-        return _finalize_result(
-            state,
-            CommandResult(ok=True, text=primary_line, lines=detail_lines),
-            parsed.verb,
-        )
+def _handle_debug(state: GameState, args: list[str]) -> HandlerResult:
+    return _handle_debug_command(state, args)
 
-    handler = COMMAND_HANDLERS.get(parsed.verb)
-    if handler is None:
-        return _finalize_result(state, _unknown_command())
 
-    # Phase 1 authority model: all commands are allowed.
-    lines = handler(state)
-    primary_line = lines[0] if lines else "COMMAND EXECUTED."
-    detail_lines = lines[1:] if len(lines) > 1 else None
-    return _finalize_result(
-        state,
-        CommandResult(ok=True, text=primary_line, lines=detail_lines),
-        parsed.verb,
-    )
+def _handle_config(state: GameState, args: list[str]) -> HandlerResult:
+    if _subcommand(args) != "DOCTRINE":
+        return _unknown_command()
+    return cmd_config_doctrine(state, args[1])
+
+
+def _handle_status(state: GameState, args: list[str]) -> HandlerResult:
+    if not args:
+        return cmd_status(state, full=False)
+    lines = cmd_status_group(state, args[0])
+    if lines is None:
+        return CommandResult(ok=False, text=STATUS_USAGE)
+    return lines
+
+
+def _handle_help(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_help(dev_mode=state.dev_mode, topic=args[0] if args else None)
+
+
+def _handle_tutorial(state: GameState, args: list[str]) -> HandlerResult:
+    topic = args[0] if args else None
+    if topic and topic.strip().upper() == "QUICKSTART":
+        return start_quickstart(state)
+    return cmd_tutorial(topic=topic)
+
+
+def _handle_set(state: GameState, args: list[str]) -> HandlerResult:
+    if len(args) == 2:
+        return cmd_set_policy(state, args[0], args[1])
+    if len(args) == 3 and _subcommand(args) == "FAB":
+        return cmd_set_fabrication(state, args[1], args[2])
+    return CommandResult(ok=False, text=SET_USAGE)
+
+
+def _handle_policy(state: GameState, args: list[str]) -> HandlerResult:
+    sub = _subcommand(args) if args else ""
+    if len(args) == 1 and sub == "SHOW":
+        return cmd_policy_show(state)
+    if len(args) == 2 and sub == "PRESET":
+        return cmd_policy_preset(state, args[1])
+    if len(args) == 2 and sub in {"DRONE_REPAIR", "DRONES"}:
+        return cmd_policy_drone_repair(state, args[1])
+    return CommandResult(ok=False, text=POLICY_USAGE)
+
+
+def _handle_fortify(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_fortify(state, args[0], args[1])
+
+
+def _handle_allocate(state: GameState, args: list[str]) -> HandlerResult:
+    if _subcommand(args) != "DEFENSE":
+        return _unknown_command()
+    return cmd_allocate_defense(state, args[1], args[2])
+
+
+def _handle_fab(state: GameState, args: list[str]) -> HandlerResult:
+    sub = _subcommand(args)
+    if sub == "ADD" and len(args) == 2:
+        return cmd_fab_add(state, args[1])
+    if sub == "QUEUE" and len(args) == 1:
+        return cmd_fab_queue(state)
+    if sub == "CANCEL" and len(args) == 2:
+        return cmd_fab_cancel(state, args[1])
+    if sub == "PRIORITY" and len(args) == 2:
+        return cmd_fab_priority(state, args[1])
+    return CommandResult(ok=False, text=FAB_USAGE)
+
+
+def _sector_action(subcommand: str | None, action: Callable[[GameState, str], list[str]], usage: str):
+    """Build a handler for ``<VERB> [SUBCOMMAND] <SECTOR>`` style commands."""
+
+    def handler(state: GameState, args: list[str]) -> HandlerResult:
+        if subcommand is None and len(args) == 1:
+            return action(state, args[0])
+        if subcommand is not None and len(args) == 2 and _subcommand(args) == subcommand:
+            return action(state, args[1])
+        return CommandResult(ok=False, text=usage)
+
+    return handler
+
+
+def _handle_wait(state: GameState, args: list[str]) -> HandlerResult:
+    if args and _subcommand(args) == "UNTIL":
+        if len(args) < 2:
+            return CommandResult(ok=False, text=WAIT_UNTIL_USAGE)
+        return cmd_wait_until(state, " ".join(args[1:]))
+    ticks = _parse_wait_ticks(args)
+    if ticks is None:
+        return _unknown_command()
+    return cmd_wait_ticks(state, ticks)
+
+
+def _handle_forecast(state: GameState, args: list[str]) -> HandlerResult:
+    if not all(arg.isdigit() and int(arg) > 0 for arg in args):
+        return CommandResult(ok=False, text=FORECAST_USAGE)
+    return cmd_forecast(state, *(int(arg) for arg in args))
+
+
+def _handle_scan(state: GameState, args: list[str]) -> HandlerResult:
+    if len(args) == 1 and _subcommand(args) == "RELAYS":
+        return cmd_scan_relays(state)
+    return CommandResult(ok=False, text="SCAN RELAYS")
+
+
+def _handle_sync(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_sync(state)
+
+
+def _handle_deploy(state: GameState, args: list[str]) -> HandlerResult:
+    if len(args) == 2 and _subcommand(args) == "DRONE":
+        return cmd_deploy_drone(state, args[1])
+    if len(args) > 1:
+        return CommandResult(ok=False, text=MULTI_WORD_TARGET)
+    return cmd_deploy(state, args[0] if args else "")
+
+
+def _handle_move(state: GameState, args: list[str]) -> HandlerResult:
+    if not args:
+        return CommandResult(ok=False, text="MOVE REQUIRES TARGET.")
+    if len(args) > 1:
+        return CommandResult(ok=False, text=MULTI_WORD_TARGET)
+    return cmd_move(state, args[0])
+
+
+def _handle_return(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_return(state)
+
+
+def _handle_focus(state: GameState, args: list[str]) -> HandlerResult:
+    if not args:
+        return CommandResult(ok=False, text="FOCUS REQUIRES SECTOR ID.")
+    if len(args) > 1:
+        return CommandResult(ok=False, text="USE QUOTES FOR MULTI-WORD SECTOR.")
+    lines = cmd_focus(state, args[0])
+    return _unknown_command() if _is_unknown(lines) else lines
+
+
+def _handle_harden(state: GameState, args: list[str]) -> HandlerResult:
+    lines = cmd_harden(state)
+    return _unknown_command() if _is_unknown(lines) else lines
+
+
+def _handle_repair(state: GameState, args: list[str]) -> HandlerResult:
+    if not args:
+        return CommandResult(ok=False, text="REPAIR REQUIRES STRUCTURE ID.")
+    full = False
+    if len(args) == 2:
+        if _subcommand(args, 1) != "FULL":
+            return CommandResult(ok=False, text=REPAIR_USAGE)
+        full = True
+    return cmd_repair(state, args[0], full=full)
+
+
+def _handle_build(state: GameState, args: list[str]) -> HandlerResult:
+    return cmd_build(state, args[0], args[1], args[2])
+
+
+def _handle_scavenge(state: GameState, args: list[str]) -> HandlerResult:
+    if not args:
+        return cmd_scavenge(state)
+    runs = _parse_multiplier(args[0])
+    if runs is None:
+        return _unknown_command()
+    return cmd_scavenge_runs(state, runs)
+
+
+COMMAND_REGISTRY = CommandRegistry(
+    [
+        CommandSpec("RESET", _handle_reset, aliases=("REBOOT",), allowed_when_failed=True),
+        CommandSpec("DEBUG", _handle_debug, log_failures=True, dev_only=True),
+        CommandSpec("CONFIG", _handle_config, min_args=2, max_args=2, usage="CONFIG DOCTRINE <NAME>"),
+        CommandSpec("STATUS", _handle_status, max_args=1, usage=STATUS_USAGE, read_only=True),
+        CommandSpec("HELP", _handle_help, max_args=1, usage="HELP <TOPIC>", read_only=True),
+        CommandSpec("TUTORIAL", _handle_tutorial, max_args=1, usage="TUTORIAL <TOPIC>"),
+        CommandSpec("SET", _handle_set),
+        CommandSpec("POLICY", _handle_policy),
+        CommandSpec(
+            "FORTIFY",
+            _handle_fortify,
+            min_args=2,
+            max_args=2,
+            usage="FORTIFY <SECTOR|T_NORTH|T_SOUTH> <0-4>",
+        ),
+        CommandSpec(
+            "ALLOCATE",
+            _handle_allocate,
+            min_args=3,
+            max_args=3,
+            usage="ALLOCATE DEFENSE <SECTOR> <PERCENT>",
+        ),
+        CommandSpec("FAB", _handle_fab, min_args=1, usage="FAB <ADD|QUEUE|CANCEL|PRIORITY> ..."),
+        CommandSpec("REROUTE", _sector_action("POWER", cmd_reroute_power, "REROUTE POWER <SECTOR>")),
+        CommandSpec("BOOST", _sector_action("DEFENSE", cmd_boost_defense, "BOOST DEFENSE <SECTOR>")),
+        CommandSpec("DRONE", _sector_action("DEPLOY", cmd_deploy_drone, "DRONE DEPLOY <SECTOR>")),
+        CommandSpec("LOCKDOWN", _sector_action(None, cmd_lockdown, "LOCKDOWN <SECTOR>")),
+        CommandSpec(
+            "PRIORITIZE",
+            _sector_action("REPAIR", cmd_prioritize_repair, "PRIORITIZE REPAIR <SECTOR>"),
+        ),
+        CommandSpec("WAIT", _handle_wait),
+        CommandSpec("FORECAST", _handle_forecast, max_args=2, usage=FORECAST_USAGE),
+        CommandSpec("SCAN", _handle_scan),
+        CommandSpec("STABILIZE", _sector_action("RELAY", cmd_stabilize_relay, "STABILIZE RELAY <ID>")),
+        CommandSpec("SYNC", _handle_sync, max_args=0),
+        CommandSpec("DEPLOY", _handle_deploy),
+        CommandSpec("MOVE", _handle_move),
+        CommandSpec("RETURN", _handle_return, max_args=0),
+        CommandSpec("FOCUS", _handle_focus),
+        CommandSpec("HARDEN", _handle_harden, max_args=0),
+        CommandSpec("REPAIR", _handle_repair, max_args=2, usage=REPAIR_USAGE),
+        CommandSpec("BUILD", _handle_build, min_args=3, max_args=3, usage="BUILD <TYPE> <X> <Y>"),
+        CommandSpec("SCAVENGE", _handle_scavenge, max_args=1),
+    ]
+)
@@ -0,0 +1,75 @@
+"""Declarative command registry compiled into a dict-based dispatcher."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.result import CommandResult
+
+
+HandlerResult = Union[List[str], CommandResult]
+CommandHandler = Callable[[GameState, List[str]], HandlerResult]
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """One terminal verb and how to dispatch it.
+
+    Attributes:
+        verb: Canonical uppercased verb, used for the operator log.
+        handler: Callable taking ``(state, args)``. Returning a list of lines
+            means success; returning a ``CommandResult`` is passed through.
+        aliases: Additional uppercased verbs routed to the same handler.
+        min_args: Fewest positional arguments accepted.
+        max_args: Most positional arguments accepted, or None for no limit.
+        usage: Error text for an argument count outside the schema. When
+            None the command is reported as unknown instead.
+        allowed_when_failed: Whether the verb runs after session failure.
+        log_failures: Whether passed-through ``CommandResult`` values are
+            written to the operator log as well as successes.
+        read_only: Whether the verb leaves everything STATUS renders
+            untouched, so cached STATUS sections stay valid across it.
+        dev_only: Whether the verb is refused (and not logged) outside dev
+            mode, before its argument schema or handler is consulted.
+    """
+
+    verb: str
+    handler: CommandHandler
+    aliases: tuple[str, ...] = ()
+    min_args: int = 0
+    max_args: Optional[int] = None
+    usage: Optional[str] = None
+    allowed_when_failed: bool = False
+    log_failures: bool = False
+    read_only: bool = False
+    dev_only: bool = False
+
+    def accepts(self, arg_count: int) -> bool:
+        if arg_count < self.min_args:
+            return False
+        return self.max_args is None or arg_count <= self.max_args
+
+
+class CommandRegistry:
+    """Maps every verb and alias to its ``CommandSpec`` in a single dict."""
+
+    def __init__(self, specs: Iterable[CommandSpec] = ()):
+        self._specs: dict[str, CommandSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: CommandSpec) -> CommandSpec:
+        for verb in (spec.verb, *spec.aliases):
+            if verb in self._specs:
+                raise ValueError(f"Verb {verb!r} already registered.")
+            self._specs[verb] = spec
+        return spec
+
+    def resolve(self, verb: str) -> Optional[CommandSpec]:
+        return self._specs.get(verb)
+
+    def verbs(self) -> list[str]:
+        return sorted(self._specs)
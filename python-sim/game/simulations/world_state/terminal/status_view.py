@@ -0,0 +1,54 @@
+"""Per-revision memo of rendered STATUS sections."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from game.simulations.world_state.core.state import GameState
+
+
+class StatusView:
+    """Lazily built STATUS sections for one ``(revision, player_mode)`` pair.
+
+    Sections are computed on first use and reused until the state revision
+    or operator mode changes. Read-only commands carry a current view forward
+    to the revision they bump to (see ``carry_status_view``), so repeated
+    STATUS calls between ticks only re-render what depends on the previous
+    call. Fidelity is derived from the state, so it is stored as a section.
+    """
+
+    def __init__(self, revision: int, mode: str):
+        self.revision = revision
+        self.mode = mode
+        self.builds = 0
+        self._sections: dict[str, Any] = {}
+
+    def section(self, name: str, build: Callable[[], Any]) -> Any:
+        try:
+            return self._sections[name]
+        except KeyError:
+            value = self._sections[name] = build()
+            self.builds += 1
+            return value
+
+
+def status_view(state: GameState) -> StatusView:
+    """Return the view for the state's current revision, replacing stale ones."""
+
+    view = state.status_view
+    if view is None or view.revision != state.revision or view.mode != state.player_mode:
+        view = state.status_view = StatusView(state.revision, state.player_mode)
+    return view
+
+
+def carry_status_view(state: GameState, revision: int) -> None:
+    """Keep a view built at ``revision`` valid after a read-only command.
+
+    Called after ``state.revision`` advanced for a command that did not touch
+    anything STATUS renders.
+    """
+
+    view = state.status_view
+    if view is not None and view.revision == revision:
+        view.revision = state.revision
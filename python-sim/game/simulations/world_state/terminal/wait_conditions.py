@@ -0,0 +1,119 @@
+"""Compiled WAIT UNTIL conditions over world-state fields."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+import operator
+import re
+
+from game.simulations.world_state.core.config import SECTOR_DEFS
+from game.simulations.world_state.core.state import GameState
+
+
+Getter = Callable[[GameState], float]
+
+_COMPARISON_RE = re.compile(r"^(?P<field>[A-Z_ ]+?)\s*(?P<op>>=|<=|==|!=|>|<|=)\s*(?P<value>-?\d+(?:\.\d+)?)$")
+_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_SECTOR_NAMES = {sector["id"]: sector["name"] for sector in SECTOR_DEFS}
+_SECTOR_NAMES.update({sector["name"]: sector["name"] for sector in SECTOR_DEFS})
+
+STATE_FIELDS: dict[str, Getter] = {
+    "TIME": lambda state: state.time,
+    "THREAT": lambda state: state.ambient_threat,
+    "MATERIALS": lambda state: state.materials,
+    "SCRAP": lambda state: state.inventory.get("SCRAP", 0),
+    "COMPONENTS": lambda state: state.inventory.get("COMPONENTS", 0),
+    "ASSEMBLIES": lambda state: state.inventory.get("ASSEMBLIES", 0),
+    "MODULES": lambda state: state.inventory.get("MODULES", 0),
+    "REPAIR_DRONES": lambda state: state.repair_drone_stock,
+    "TURRET_AMMO": lambda state: state.turret_ammo_stock,
+    "ARCHIVE_LOSSES": lambda state: state.archive_losses,
+    "APPROACHES": lambda state: len(state.assaults),
+    "REPAIRS": lambda state: len(state.active_repairs),
+    "FAB_QUEUE": lambda state: len(state.fabrication_queue),
+}
+SECTOR_FIELDS = {
+    "DAMAGE": "damage",
+    "POWER": "power",
+    "ALERTNESS": "alertness",
+}
+FLAG_CONDITIONS: dict[str, Callable[[GameState], bool]] = {
+    "ASSAULT": lambda state: state.in_major_assault or state.current_assault is not None,
+    "APPROACH": lambda state: bool(state.assaults),
+    "REPAIR_DONE": lambda state: bool(state.last_repair_lines),
+    "FAB QUEUE EMPTY": lambda state: not state.fabrication_queue,
+    "REPAIRS EMPTY": lambda state: not state.active_repairs,
+}
+WAIT_UNTIL_HELP = [
+    "WAIT UNTIL REQUIRES: ASSAULT, APPROACH, REPAIR_DONE, FAB QUEUE EMPTY, REPAIRS EMPTY,",
+    "<FIELD><OP><N> (FIELDS: " + ", ".join(STATE_FIELDS) + "),",
+    "OR SECTOR <ID> <DAMAGE|POWER|ALERTNESS><OP><N>.",
+]
+
+
+@dataclass(frozen=True)
+class WaitCondition:
+    """A parsed WAIT UNTIL condition.
+
+    ``label`` is the canonical spelling echoed back to the operator and
+    ``test`` is evaluated against the state after every waited tick.
+    """
+
+    label: str
+    test: Callable[[GameState], bool]
+
+
+def _sector_getter(sector_name: str, attribute: str) -> Getter:
+    return lambda state: getattr(state.sectors[sector_name], attribute)
+
+
+def _compile_comparison(field_text: str, op_text: str, value_text: str) -> WaitCondition | None:
+    tokens = field_text.split()
+    if len(tokens) == 1 and tokens[0] in STATE_FIELDS:
+        getter = STATE_FIELDS[tokens[0]]
+        label_field = tokens[0]
+    elif len(tokens) == 3 and tokens[0] == "SECTOR":
+        sector_name = _SECTOR_NAMES.get(tokens[1])
+        attribute = SECTOR_FIELDS.get(tokens[2])
+        if sector_name is None or attribute is None:
+            return None
+        getter = _sector_getter(sector_name, attribute)
+        label_field = f"SECTOR {sector_name} {tokens[2]}"
+    else:
+        return None
+
+    compare = _OPERATORS[op_text]
+    value = float(value_text)
+    return WaitCondition(
+        label=f"{label_field}{op_text}{value_text}",
+        test=lambda state: compare(getter(state), value),
+    )
+
+
+@lru_cache(maxsize=128)
+def compile_wait_condition(text: str) -> WaitCondition | None:
+    """Compile ``text`` into a ``WaitCondition``, or None when it is not valid.
+
+    Accepted forms are the named flags in ``FLAG_CONDITIONS``, comparisons on
+    ``STATE_FIELDS`` such as ``MATERIALS>=20``, and per-sector comparisons
+    such as ``SECTOR ARCHIVE DAMAGE>1``. Whitespace around the operator is
+    optional.
+    """
+
+    normalized = " ".join(text.strip().upper().split())
+    if normalized in FLAG_CONDITIONS:
+        return WaitCondition(label=normalized, test=FLAG_CONDITIONS[normalized])
+    match = _COMPARISON_RE.match(normalized)
+    if match is None:
+        return None
+    return _compile_comparison(match["field"].strip(), match["op"], match["value"])
@@ -1,11 +1,25 @@
 """Tests for ambient event diversity pacing and category selection."""
 
+import copy
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.config import (
+    EVENT_CHANCE_BASE,
+    EVENT_CHANCE_MAX,
+    EVENT_CHANCE_PER_THREAT,
+    HANGAR_EVENT_CHANCE_BONUS,
+)
 from game.simulations.world_state.core.events import (
     build_event_catalog,
     compute_category_weights,
     filter_recent_events,
     select_ambient_event,
 )
+from game.simulations.world_state.core.power_load import (
+    blackout_event_chance_bonus,
+    blackout_event_weight_multiplier,
+)
+from game.simulations.world_state.core.simulation import step_world
 from game.simulations.world_state.core.state import GameState
 
 
@@ -80,3 +94,56 @@ def test_select_ambient_event_updates_memory_and_avoids_recent_repeat() -> None:
     assert event.name != quiet_perimeter.name
     assert state.last_event_category == "QUIET"
     assert state.recent_events[-1] == event.name
+
+
+def _legacy_select_ambient_event(state):
+    events = build_event_catalog(state)
+    category_weights = compute_category_weights(state)
+    if not category_weights:
+        return None
+    chance = EVENT_CHANCE_BASE + state.ambient_threat * EVENT_CHANCE_PER_THREAT
+    hangar = state.sectors.get("HANGAR")
+    if hangar and hangar.damage >= 1.0:
+        chance += HANGAR_EVENT_CHANCE_BONUS
+    chance = min(chance + blackout_event_chance_bonus(state), EVENT_CHANCE_MAX)
+    if state.rng.random() > chance:
+        return None
+    categories = list(category_weights)
+    selected_category = state.rng.choices(
+        categories, weights=[category_weights[c] for c in categories], k=1
+    )[0]
+    candidates = [
+        (event, sector)
+        for sector in state.sectors.values()
+        for event in events
+        if event.category == selected_category and event.can_trigger(state, sector)
+    ]
+    candidates = filter_recent_events(candidates, state.recent_events)
+    if not candidates:
+        return None
+    weighted = []
+    for event, sector in candidates:
+        weight = int(event.weight)
+        if event.key == "power_blackout":
+            weight *= blackout_event_weight_multiplier(state)
+        weighted.extend([(event, sector)] * max(1, weight))
+    return state.rng.choice(weighted)
+
+
+def test_precompiled_selection_matches_legacy_expanded_list() -> None:
+    state = GameState(seed=19)
+    clock = SimulationClock(headless=True)
+    matched = 0
+    for _ in range(120):
+        state.ambient_threat = max(state.ambient_threat, 2.5)
+        probe = copy.deepcopy(state)
+        expected = _legacy_select_ambient_event(probe)
+        actual = select_ambient_event(state)
+        if expected is None:
+            assert actual is None
+        else:
+            assert (actual[0].key, actual[1].name) == (expected[0].key, expected[1].name)
+            matched += 1
+        assert state.rng.getstate() == probe.rng.getstate()
+        step_world(state, clock=clock)
+    assert matched > 10
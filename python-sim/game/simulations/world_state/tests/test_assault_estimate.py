@@ -0,0 +1,89 @@
+"""Tests for the analytic assault outcome estimator."""
+
+import random
+
+from game.simulations.assault.core.defenses import Turret
+from game.simulations.world_state.core.assault_estimate import estimate_assault_outcome
+from game.simulations.world_state.core.assaults import start_assault
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.commands.status import cmd_status_group
+
+
+def _headless_state(seed: int) -> GameState:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+def _counts(estimate) -> tuple:
+    return (estimate.spawned, estimate.killed, estimate.retreated, estimate.remaining)
+
+
+def test_estimate_matches_full_resolver_for_running_assault() -> None:
+    totals = {"killed": 0, "retreated": 0}
+    for seed in range(24):
+        rng = random.Random(seed)
+        state = _headless_state(seed)
+        state.turret_ammo_stock = rng.randint(0, 4)
+        start_assault(state)
+        assault = state.current_assault
+        # A larger budget and stronger turrets than the opening game so the
+        # projection has kills and retreats to account for.
+        assault.threat_budget = rng.choice([60, 90, 120])
+        assault.enemy_groups = assault._build_enemy_groups()
+        assault.entry_phases = assault._build_entry_phases()
+        for sector in assault._tactical_sectors:
+            sector.defenses[:] = [
+                Turret(damage=rng.choice([3, 5, 9]), effective_output=rng.uniform(0.15, 1.0))
+                for _ in range(rng.randint(1, 3))
+            ]
+
+        upfront = estimate_assault_outcome(state)
+        for _ in range(rng.randint(1, 3)):
+            step_world(state)
+        midway = estimate_assault_outcome(state, assault)
+        while not assault.resolved:
+            step_world(state)
+
+        summary = assault._summary
+        actual = (summary["spawned"], summary["killed"], summary["retreated"], summary["remaining"])
+        assert _counts(upfront) == actual
+        assert _counts(midway) == actual
+        assert upfront.duration == assault.duration_ticks
+        totals["killed"] += summary["killed"]
+        totals["retreated"] += summary["retreated"]
+
+    assert totals["killed"] > 0 and totals["retreated"] > 0
+
+
+def test_approach_preview_samples_forks_without_touching_state() -> None:
+    state = _headless_state(2)
+    while not state.assaults:
+        step_world(state)
+    before = state.snapshot()
+    rng_before = state.rng.getstate()
+
+    estimate = estimate_assault_outcome(state, samples=4)
+
+    assert estimate.targets == (state.assaults[0].target,)
+    assert estimate.duration == 8.5
+    assert estimate.samples == 4
+    assert estimate.error is not None and estimate.error <= 2.0
+    assert 0.0 <= estimate.breach_chance <= 1.0
+    assert estimate.killed + estimate.retreated + estimate.remaining == estimate.spawned
+    assert state.snapshot() == before
+    assert state.rng.getstate() == rng_before
+    assert estimate_assault_outcome(state, samples=4) == estimate
+
+
+def test_status_assault_group_shows_projection() -> None:
+    state = _headless_state(3)
+    assert estimate_assault_outcome(state) is None
+    start_assault(state)
+
+    lines = cmd_status_group(state, "ASSAULT")
+
+    assert lines[-1] == estimate_assault_outcome(state).status_line()
+    assert lines[-1].startswith("PROJECTED: ")
@@ -0,0 +1,84 @@
+"""Tests for the columnar assault ledger ring."""
+
+import io
+import json
+import pickle
+
+from game.simulations.world_state.core.assault_ledger import AssaultLedger, AssaultTickRecord, append_record
+from game.simulations.world_state.core.state import GameState
+
+
+def _record(tick: int, **overrides) -> AssaultTickRecord:
+    fields = {
+        "tick": tick,
+        "targeted_sector": ("CM", "PW", "AR")[tick % 3],
+        "target_weight": tick * 0.5,
+        "assault_strength": 2.0,
+        "defense_mitigation": (tick % 5) / 4,
+    }
+    fields.update(overrides)
+    return AssaultTickRecord(**fields)
+
+
+def test_ring_keeps_latest_rows_and_windows_by_sequence() -> None:
+    ledger = AssaultLedger(capacity=4)
+    for tick in range(3):
+        ledger.append(_record(tick))
+    start = ledger.sequence
+    for tick in range(3, 10):
+        ledger.append(_record(tick, building_destroyed="PW_CORE" if tick == 8 else None))
+
+    assert len(ledger) == 4
+    assert ledger.sequence == 10
+    assert [record.tick for record in ledger.ticks] == [6, 7, 8, 9]
+    assert ledger.ticks[-1] == _record(9)
+    assert [record.tick for record in ledger.ticks[-2:]] == [8, 9]
+    # Rows 3..5 were overwritten, so the window starts at the oldest kept row.
+    assert [record.tick for record in ledger.window(start)] == [6, 7, 8, 9]
+    assert [record.tick for record in ledger.window(7, 9)] == [7, 8]
+    assert ledger.window(start).destroyed() == ["PW_CORE"]
+    assert not ledger.window(ledger.sequence)
+
+
+def test_aggregates_and_columns() -> None:
+    ledger = AssaultLedger()
+    for tick in range(6):
+        ledger.append(_record(tick))
+    view = ledger.ticks
+
+    assert view.column("targeted_sector") == ["CM", "PW", "AR", "CM", "PW", "AR"]
+    assert view.column("defense_mitigation") == [0.0, 0.25, 0.5, 0.75, 1.0, 0.0]
+    assert view.damage_by_sector() == {"CM": 2.0 + 0.5, "PW": 1.5 + 0.0, "AR": 1.0 + 2.0}
+    assert view.mitigation_distribution(bins=4) == [2, 1, 1, 2]
+
+
+def test_exports_round_trip(tmp_path) -> None:
+    ledger = AssaultLedger(capacity=3)
+    for tick in range(5):
+        ledger.append(_record(tick, note=f"N{tick}", failure_triggered=tick == 4))
+
+    stream = io.StringIO()
+    assert ledger.write_ndjson(stream) == 3
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert rows[0]["tick"] == 2 and rows[-1]["failure_triggered"] is True
+
+    path = tmp_path / "ledger.cols"
+    assert ledger.write_columns(path) == 3
+    loaded = AssaultLedger.read_columns(path)
+    assert list(loaded.ticks) == list(ledger.ticks)
+
+
+def test_state_fork_and_pickle_keep_ledger_independent() -> None:
+    state = GameState(seed=3)
+    append_record(state, _record(1))
+    fork = state.fork()
+    append_record(fork, _record(2))
+
+    assert len(state.assault_ledger) == 1 and len(fork.assault_ledger) == 2
+    restored = pickle.loads(pickle.dumps(state.assault_ledger))
+    assert list(restored.ticks) == list(state.assault_ledger.ticks)
+    assert restored.active is True
+
+    legacy = AssaultLedger.__new__(AssaultLedger)
+    legacy.__setstate__({"active": True, "ticks": [_record(5)]})
+    assert list(legacy.ticks) == [_record(5)]
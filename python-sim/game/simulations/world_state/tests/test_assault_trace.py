@@ -18,7 +18,7 @@ def test_dev_trace_uses_existing_tick_field(monkeypatch, capsys) -> None:
     state.in_major_assault = True
 
     monkeypatch.setattr(assault, "duration_ticks", 1)
-    monkeypatch.setattr("game.simulations.world_state.core.assaults.time.sleep", lambda *_: None)
+    monkeypatch.setattr("game.simulations.world_state.core.clock.time.sleep", lambda *_: None)
 
     resolve_assault(state, tick_delay=0.0)
     output = capsys.readouterr().out
@@ -0,0 +1,94 @@
+"""Tests for the array-backed sector grid and bitboard perimeter queries."""
+
+from collections import deque
+
+from game.simulations.world_state.core.bitgrid import largest_component, positions_mask
+from game.simulations.world_state.core.drone_repairs import perimeter_repair_backlog
+from game.simulations.world_state.core.grid_assault import perimeter_profile
+from game.simulations.world_state.core.grid_fortification import apply_sector_fortification_layout
+from game.simulations.world_state.core.state import GameState, SectorGrid, StructureInstance
+from game.simulations.world_state.core.structures import generate_perimeter_positions
+
+
+def _bfs_largest(cells: set[tuple[int, int]]) -> int:
+    seen: set[tuple[int, int]] = set()
+    largest = 0
+    for start in cells:
+        if start in seen:
+            continue
+        seen.add(start)
+        queue = deque([start])
+        size = 0
+        while queue:
+            x, y = queue.popleft()
+            size += 1
+            for nxt in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if nxt in cells and nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        largest = max(largest, size)
+    return largest
+
+
+def test_largest_component_matches_bfs_without_row_wraparound() -> None:
+    width = 7
+    cells = {(6, 0), (0, 1), (1, 1), (3, 3), (3, 4), (4, 4), (5, 4), (6, 6)}
+    stride = width + 1
+    assert largest_component(positions_mask(cells, stride), stride) == _bfs_largest(cells) == 4
+
+
+def test_cells_shim_writes_through_to_arrays() -> None:
+    grid = SectorGrid(5, 4)
+    assert len(grid.cells) == 20
+    assert list(grid.cells)[:3] == [(0, 0), (0, 1), (0, 2)]
+
+    grid.cells[(2, 3)].structure_id = "S9"
+    grid.cells[(2, 3)].blocked = True
+    assert grid.structure_id_at(2, 3) == "S9"
+    assert grid.occupied() == [((2, 3), "S9")]
+    assert grid.cells[(2, 3)].blocked is True
+
+    grid.cells[(2, 3)].structure_id = None
+    assert grid.occupied() == []
+    assert grid.occupied_bits == 0
+
+
+def test_cells_shim_writes_resolve_structure_type() -> None:
+    state = GameState(seed=3)
+    wall = StructureInstance("S90", "WALL", "POWER", (4, 4), 10)
+    state.structure_instances[wall.id] = wall
+    grid = state.sector_grids["POWER"]
+    grid.cells[(4, 4)].structure_id = wall.id
+    assert grid.type_bits_for("WALL") == 1 << (4 * grid.stride + 4)
+    state.verify_aggregates()
+
+    fork = state.fork()
+    fork.structure_instances["S91"] = StructureInstance("S91", "WALL", "POWER", (5, 4), 10)
+    fork.sector_grids["POWER"].cells[(5, 4)].structure_id = "S91"
+    fork.verify_aggregates()
+    assert "S91" not in state.structure_instances
+
+
+def test_large_grid_perimeter_queries_match_grid_scan() -> None:
+    state = GameState(seed=2)
+    state.sector_grids["POWER"] = SectorGrid(48, 40)
+    state.sector_fort_levels["POWER"] = 2
+    apply_sector_fortification_layout(state, "POWER", 2)
+    grid = state.sector_grids["POWER"]
+    expected = generate_perimeter_positions(2, grid.width, grid.height)
+
+    assert perimeter_profile(state, "POWER").coverage == 1.0
+    for sid, instance in sorted(state.structure_instances.items()):
+        if instance.sector == "POWER" and instance.position[1] == 0 and instance.position[0] % 3 == 0:
+            state.remove_structure_instance(sid)
+
+    walls = {
+        pos for pos in expected
+        if grid.structure_id_at(*pos) is not None
+        and state.structure_instances[grid.structure_id_at(*pos)].type == "WALL"
+    }
+    profile = perimeter_profile(state, "POWER")
+    assert profile.present == len(walls)
+    assert profile.continuity == _bfs_largest(walls) / float(len(expected))
+    assert perimeter_repair_backlog(state)["POWER"] == len(expected) - len(walls)
+    state.verify_aggregates()
@@ -0,0 +1,85 @@
+"""Tests for batched command execution shared by the command servers."""
+
+import pytest
+
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.server_contracts import (
+    BATCH_VALIDATE_EACH,
+    CommandReplayCache,
+    parse_batch_payload,
+    run_command_batch,
+)
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def test_batch_matches_sequential_commands() -> None:
+    script = ["STATUS", "WAIT", "FORTIFY GATEWAY 2", "WAIT 3X", "STATUS"]
+    sequential = GameState(seed=21)
+    expected = [process_command(sequential, raw).ok for raw in script]
+
+    batched = GameState(seed=21)
+    level_before = batched.invariants.level
+    batch, validate = parse_batch_payload({"commands": script})
+    results = run_command_batch(batched, batch, CommandReplayCache(), validate=validate)
+
+    assert [result["ok"] for result in results] == expected
+    assert batched.snapshot() == sequential.snapshot()
+    assert batched.invariants.level == level_before
+    # End-of-batch validation ran every check exactly once.
+    assert set(batched.invariants.runs.values()) == {1}
+
+
+def test_batch_reuses_replay_cache_per_id() -> None:
+    single = GameState(seed=5)
+    process_command(single, "WAIT")
+    state = GameState(seed=5)
+    cache = CommandReplayCache()
+    batch, _ = parse_batch_payload(
+        {"commands": [{"command": "WAIT", "command_id": "w1"}, {"command": "WAIT", "command_id": "w1"}]}
+    )
+
+    results = run_command_batch(state, batch, cache, session_id="alpha", validate=BATCH_VALIDATE_EACH)
+
+    assert state.time == single.time
+    assert results[0] == results[1]
+    assert results[0]["command_id"] == "w1"
+    assert cache.get("alpha", "w1") is not None
+    assert cache.get("beta", "w1") is None
+
+
+def test_batch_rolls_back_when_a_command_raises(monkeypatch) -> None:
+    from game.simulations.world_state import server_contracts
+
+    def _process(state, raw):
+        if raw == "BOOM":
+            raise RuntimeError("handler crashed")
+        return process_command(state, raw)
+
+    monkeypatch.setattr(server_contracts, "process_command", _process)
+    state = GameState(seed=8)
+    process_command(state, "WAIT")
+    before = state.snapshot()
+    revision = state.revision
+    cache = CommandReplayCache()
+    batch, validate = parse_batch_payload(
+        {"commands": [{"command": "WAIT 3X", "command_id": "w"}, "FORTIFY PW 1", {"command": "BOOM", "command_id": "b"}]}
+    )
+
+    results = run_command_batch(state, batch, cache, validate=validate)
+
+    assert [result["ok"] for result in results] == [True, True, False]
+    assert results[-1]["rolled_back"] is True and results[-1]["command_id"] == "b"
+    assert state.snapshot() == before
+    assert state.revision > revision
+    assert cache.get("default", "w") is None
+    process_command(state, "WAIT")
+    state.verify_aggregates()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"commands": []}, {"commands": [3]}, {"commands": ["WAIT"], "validate": "never"}],
+)
+def test_batch_payload_rejects_invalid_shapes(payload) -> None:
+    with pytest.raises(ValueError):
+        parse_batch_payload(payload)
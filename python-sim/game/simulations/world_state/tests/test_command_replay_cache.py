@@ -0,0 +1,69 @@
+"""Tests for the command idempotency cache."""
+
+from game.simulations.world_state.server_contracts import CommandReplayCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expires_in_insert_order_and_counts() -> None:
+    clock = _Clock()
+    cache = CommandReplayCache(ttl_seconds=10.0, max_entries=3, clock=clock)
+
+    cache.put("s", "a", {"ok": True})
+    clock.now += 5
+    cache.put("s", "b", {"ok": True})
+    assert cache.get("s", "a") == {"ok": True}
+    assert cache.get("s", "zzz") is None
+    assert cache.get("other", "a") is None
+
+    clock.now += 6
+    assert cache.get("s", "a") is None
+    assert cache.get("s", "b") == {"ok": True}
+
+    for key in ("c", "d", "e"):
+        cache.put("s", key, {"ok": False})
+    metrics = cache.metrics()
+    assert len(cache) == 3
+    assert (metrics["hits"], metrics["misses"]) == (2, 3)
+    assert (metrics["expirations"], metrics["evictions"]) == (1, 1)
+
+
+def test_cache_persists_across_restart(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "commands.jsonl"
+    cache = CommandReplayCache(ttl_seconds=10.0, max_entries=2, path=path, clock=clock)
+    for index in range(9):
+        cache.put("s", f"cmd-{index}", {"ok": True, "text": str(index)})
+        clock.now += 1
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "torn"')
+
+    restarted = CommandReplayCache(ttl_seconds=10.0, max_entries=2, path=path, clock=clock)
+
+    assert restarted.get("s", "cmd-8") == {"ok": True, "text": "8"}
+    assert restarted.get("s", "cmd-7") == {"ok": True, "text": "7"}
+    assert restarted.get("s", "cmd-6") is None
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_journal_keeps_sessions_apart_across_restart(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "commands.jsonl"
+    cache = CommandReplayCache(path=path, clock=clock)
+    cache.put("alpha", "c1", {"ok": True, "text": "TIME ADVANCED."})
+    cache.put("beta", "c1", {"ok": True, "text": "TIME: 0"})
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"id":"c1","ts":1000.0,"payload":{"ok":false}}\n')
+
+    restarted = CommandReplayCache(path=path, clock=clock)
+
+    assert restarted.get("alpha", "c1") == {"ok": True, "text": "TIME ADVANCED."}
+    assert restarted.get("beta", "c1") == {"ok": True, "text": "TIME: 0"}
+    assert restarted.get("gamma", "c1") is None
+    assert len(restarted) == 2
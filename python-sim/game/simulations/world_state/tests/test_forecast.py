@@ -0,0 +1,80 @@
+"""Tests for GameState.fork and FORECAST lookahead."""
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.forecast import forecast
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _advance(state: GameState, ticks: int) -> None:
+    clock = SimulationClock(headless=True)
+    for _ in range(ticks):
+        if state.is_failed:
+            break
+        step_world(state, clock=clock)
+
+
+def test_fork_replays_identically_and_stays_independent() -> None:
+    state = GameState(seed=9)
+    process_command(state, "FORTIFY PW 2")
+    _advance(state, 120)
+
+    fork = state.fork()
+    assert fork.snapshot() == state.snapshot()
+    _advance(state, 60)
+    _advance(fork, 60)
+    assert fork.snapshot() == state.snapshot()
+
+    fork.sectors["POWER"].damage += 1.0
+    fork.remove_structure_instance(next(iter(fork.structure_instances)))
+    fork.rng.random()
+    assert fork.sectors["POWER"].damage != state.sectors["POWER"].damage
+    assert len(fork.structure_instances) == len(state.structure_instances) - 1
+    assert fork.rng.getstate() != state.rng.getstate()
+    fork.verify_aggregates()
+    state.verify_aggregates()
+
+
+def test_fork_narrates_into_its_own_clock() -> None:
+    state = GameState(seed=6)
+    state.clock = SimulationClock(headless=True)
+    _advance(state, 20)
+    live_records = list(state.clock.records)
+
+    fork = state.fork()
+    assert fork.clock is not state.clock and fork.clock.headless
+    for _ in range(40):
+        step_world(fork)
+
+    assert list(state.clock.records) == live_records
+    assert fork.clock.records
+
+
+def test_forecast_leaves_live_state_untouched() -> None:
+    state = GameState(seed=4)
+    _advance(state, 80)
+    before = state.snapshot()
+    rng_before = state.rng.getstate()
+
+    outcomes = forecast(state, ticks=30, runs=4)
+
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2, 3]
+    assert all(outcome.ticks <= 30 for outcome in outcomes)
+    assert state.snapshot() == before
+    assert state.rng.getstate() == rng_before
+    assert forecast(state, ticks=30, runs=4) == outcomes
+
+
+def test_forecast_command_reports_distribution() -> None:
+    state = GameState(seed=5)
+    time_before = state.time
+
+    result = process_command(state, "FORECAST 15 3")
+
+    assert result.ok is True
+    assert result.text == "FORECAST: 3 FUTURES x 15 TICKS"
+    assert result.lines[-1] == "PROJECTION ONLY. LIVE STATE UNCHANGED."
+    assert any(line.startswith("- FAILURE: ") for line in result.lines)
+    assert state.time == time_before
+    assert process_command(state, "FORECAST SOON").text == "FORECAST [TICKS] [FUTURES]"
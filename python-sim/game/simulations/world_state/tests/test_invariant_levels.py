@@ -0,0 +1,68 @@
+"""Tests for tiered invariant checking."""
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.invariants import (
+    DEFAULT_INVARIANT_LEVEL,
+    INVARIANT_LEVEL_ENV,
+    InvariantPolicy,
+    check_invariants,
+    validate_state_invariants,
+)
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+
+
+def _run(state: GameState, ticks: int) -> None:
+    clock = SimulationClock(headless=True)
+    for _ in range(ticks):
+        step_world(state, clock=clock)
+
+
+def test_levels_control_which_checks_run() -> None:
+    audit = GameState(seed=5)
+    audit.invariants = InvariantPolicy(level="audit")
+    full = GameState(seed=5)
+    full.invariants = InvariantPolicy(level="full")
+    sampled = GameState(seed=5)
+    sampled.invariants = InvariantPolicy(level="sampled", sample_interval=10)
+    off = GameState(seed=5)
+    off.invariants = InvariantPolicy(level="off")
+
+    for state in (audit, full, sampled, off):
+        _run(state, 30)
+
+    assert audit.invariants.runs["structures"] == audit.invariants.runs["aggregates"] == 30
+    assert full.invariants.runs["tasks"] == full.invariants.runs["structures"] == 30
+    assert full.invariants.runs["aggregates"] == 0
+    assert sampled.invariants.runs["tasks"] == 30
+    assert sampled.invariants.runs["structures"] == 3
+    assert not off.invariants.runs
+    assert audit.snapshot() == full.snapshot() == sampled.snapshot() == off.snapshot()
+
+
+def test_failures_are_counted_and_validate_always_runs_everything() -> None:
+    state = GameState(seed=2)
+    state.invariants = InvariantPolicy(level="off")
+    state.inventory["SCRAP"] = -1
+
+    check_invariants(state)
+    with pytest.raises(AssertionError):
+        validate_state_invariants(state)
+
+    report = state.invariants.report()
+    assert report["inventory"] == {"runs": 1, "failures": 1}
+    assert report["aggregates"] == {"runs": 0, "failures": 0}
+
+
+def test_level_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv(INVARIANT_LEVEL_ENV, "SAMPLED")
+    assert GameState(seed=1).invariants.level == "sampled"
+
+    monkeypatch.setenv(INVARIANT_LEVEL_ENV, "bogus")
+    with pytest.warns(RuntimeWarning):
+        state = GameState(seed=1)
+    assert state.invariants.level == DEFAULT_INVARIANT_LEVEL
+    with pytest.raises(ValueError):
+        InvariantPolicy(level="bogus")
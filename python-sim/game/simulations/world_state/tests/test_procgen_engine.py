@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
-from game.procgen.engine import GrammarEngine, VariantMemory, load_grammar_bank
+from game.procgen.engine import (
+    GrammarEngine,
+    TemplateToken,
+    VariantMemory,
+    compile_template,
+    load_grammar_bank,
+)
 from game.simulations.world_state.core.state import GameState
 from game.simulations.world_state.terminal.procgen_text import render_wait_event_line
 
@@ -34,6 +41,43 @@ def test_variant_memory_avoids_immediate_repeat(tmp_path: Path) -> None:
     assert first != second
 
 
+def test_templates_compile_to_literal_and_symbol_segments() -> None:
+    assert compile_template("[EVENT] #event_name.upper# DETECTED # #") == (
+        "[EVENT] ",
+        TemplateToken(symbol="event_name", modifiers=("upper",)),
+        " DETECTED ",
+    )
+    assert compile_template("plain") == ("plain",)
+
+
+def test_compiled_engine_output_matches_pinned_terminal_grammar_digest() -> None:
+    # Digest recorded from the regex-based engine before templates were
+    # compiled; any change in selection or expansion order changes it.
+    path = Path(__file__).resolve().parents[1] / "content" / "terminal_grammar.json"
+    bank = load_grammar_bank(path)
+    engine = GrammarEngine(bank)
+    memory = VariantMemory(max_recent=3)
+    context = {"event_name": "Comms Burst", "repair_name": "Relay Array"}
+    lines = [
+        engine.render(symbol, context=context, seed=seed, salt=f"t{tick}", memory=memory)
+        for seed in (1, 7, 2**40 + 3)
+        for tick in range(40)
+        for symbol in sorted(bank.symbols)
+    ]
+    digest = hashlib.sha256("\n".join(lines).encode()).hexdigest()
+    assert digest == "171cfbe5aa3ab337ab620acc876dbc1fbe86bcec03b26b0a83d3d0db4450ef53"
+
+
+def test_substituted_tokens_are_expanded_again(tmp_path: Path) -> None:
+    path = tmp_path / "grammar.json"
+    path.write_text(
+        '{"version":1,"symbols":{"origin":["<#slot#>"],"w":["alpha"]}}',
+        encoding="utf-8",
+    )
+    engine = GrammarEngine(load_grammar_bank(path))
+    assert engine.render("origin", context={"slot": "#w.upper#"}) == "<ALPHA>"
+
+
 def test_wait_event_line_includes_event_name_at_full_fidelity() -> None:
     state = GameState(seed=2)
     line = render_wait_event_line(
@@ -0,0 +1,91 @@
+"""Tests for the replay recorder and seekable timeline."""
+
+import json
+import pickle
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.replay import ReplayRecorder, load_replay, seek
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _fingerprint(state: GameState) -> tuple:
+    return state.time, state.snapshot(), state.sim_rng.getstate(), state.text_rng.getstate()
+
+
+def _recorded_run(seed: int = 9) -> tuple[GameState, ReplayRecorder, dict[int, tuple]]:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    recorder = ReplayRecorder(keyframe_interval=20)
+    recorder.attach(state)
+    reference = {state.time: _fingerprint(state)}
+    for command in ("FORTIFY PW 2", "WAIT", "STATUS", "WAIT 10X", "HARDEN CM", "WAIT 5X"):
+        process_command(state, command)
+        reference[state.time] = _fingerprint(state)
+        for _ in range(3):
+            step_world(state)
+            reference[state.time] = _fingerprint(state)
+    return state, recorder, reference
+
+
+def test_seek_reproduces_recorded_states() -> None:
+    state, recorder, reference = _recorded_run()
+
+    assert len(recorder.log.keyframes) > 1
+    assert recorder.log.last_tick == state.time
+    for tick, expected in reference.items():
+        assert _fingerprint(recorder.seek(tick)) == expected
+    assert state.replay_recorder is recorder
+
+
+def test_seek_inside_command_stops_at_command_start() -> None:
+    _state, recorder, _reference = _recorded_run()
+    wait = next(command for command in recorder.log.commands if command.raw == "WAIT 10X")
+
+    assert recorder.seek(wait.tick + 4).time == wait.tick
+    with pytest.raises(ValueError):
+        recorder.seek(recorder.log.last_tick + 1)
+
+
+def test_replay_log_save_load_and_reset(tmp_path) -> None:
+    state, recorder, reference = _recorded_run()
+    path = tmp_path / "run.replay"
+    recorder.save(path)
+    tick = max(reference)
+    assert _fingerprint(seek(load_replay(path), tick)) == reference[tick]
+
+    process_command(state, "RESET")
+    assert state.replay_recorder is recorder
+    assert recorder.log.seed == state.seed
+    assert recorder.log.commands == []
+
+
+class _Exploit:
+    def __reduce__(self):
+        return (exec, ("raise SystemExit('executed')",))
+
+
+def test_replay_files_are_json_and_never_unpickled(tmp_path) -> None:
+    _state, recorder, _reference = _recorded_run()
+    path = tmp_path / "run.replay"
+    recorder.save(path)
+    document = json.loads(path.read_text(encoding="utf-8"))
+    assert document["seed"] == 9
+    assert [raw for _tick, _end, raw in document["commands"]][0] == "FORTIFY PW 2"
+
+    path.write_bytes(pickle.dumps(_Exploit()))
+    with pytest.raises(ValueError):
+        load_replay(path)
+
+
+def test_mid_run_recording_cannot_be_exported(tmp_path) -> None:
+    state = GameState(seed=4)
+    state.clock = SimulationClock(headless=True)
+    step_world(state)
+    recorder = ReplayRecorder()
+    recorder.attach(state)
+    with pytest.raises(ValueError):
+        recorder.save(tmp_path / "late.replay")
@@ -1,5 +1,8 @@
 """Tests for the world-state command API endpoint."""
 
+import threading
+import time
+
 import pytest
 
 pytest.importorskip("flask")
@@ -68,7 +71,8 @@ def test_command_endpoint_requires_command_string() -> None:
 
 def test_procgen_report_requires_dev_mode() -> None:
     client = server.app.test_client()
-    server.command_state.dev_mode = False
+    with server.sessions.session() as state:
+        state.dev_mode = False
 
     response = client.get("/procgen_report")
 
@@ -78,7 +82,8 @@ def test_procgen_report_requires_dev_mode() -> None:
 
 def test_procgen_report_returns_fingerprint_in_dev_mode() -> None:
     client = server.app.test_client()
-    server.command_state.dev_mode = True
+    with server.sessions.session() as state:
+        state.dev_mode = True
 
     response = client.get("/procgen_report")
 
@@ -89,3 +94,152 @@ def test_procgen_report_returns_fingerprint_in_dev_mode() -> None:
     assert "fingerprint_hash" in report
     assert len(report["fingerprint_hash"]) == 16
     assert any(item["name"] == "doctrine_profile_id" for item in report["components"])
+
+
+def test_profile_endpoint_toggles_profiler() -> None:
+    """POST /profile enables timings that GET /profile then reports."""
+
+    client = server.app.test_client()
+    with server.sessions.session("profile-lab") as state:
+        state.dev_mode = False
+    assert client.get("/profile?session=profile-lab").status_code == 403
+    with server.sessions.session("profile-lab") as state:
+        state.dev_mode = True
+    probe = {"session_id": "profile-lab"}
+    assert client.post("/profile", json={**probe, "enabled": False}).status_code == 409
+    assert client.post("/profile", json={**probe, "capacity": "lots"}).status_code == 400
+    assert client.post("/profile", json={**probe, "capacity": 0}).status_code == 400
+
+    response = client.post("/profile", json={**probe, "enabled": True})
+    assert response.status_code == 200
+    client.post("/command", json={**probe, "command": "wait"})
+
+    payload = client.get("/profile?session=profile-lab").get_json()
+    assert payload["ok"] is True
+    assert payload["profile"]["window"] >= 1
+    client.post("/profile", json={**probe, "enabled": False})
+
+
+def test_command_endpoint_isolates_sessions() -> None:
+    """Commands for one session id must not advance another session's world."""
+
+    client = server.app.test_client()
+    client.post("/command", json={"command": "wait", "session_id": "lab-a", "seed": 4})
+
+    lab_a = client.get("/snapshot?session=lab-a").get_json()
+    lab_b = client.get("/snapshot?session=lab-b").get_json()
+    assert lab_a["time"] > 0
+    assert lab_b["time"] == 0
+
+    response = client.post("/command", json={"command": "status", "session_id": "../etc"})
+    assert response.status_code == 400
+
+
+def test_command_ids_are_scoped_to_sessions() -> None:
+    """A command id reused by another session must not replay the first session's result."""
+
+    client = server.app.test_client()
+    first = client.post("/command", json={"command": "wait", "command_id": "dup-1", "session_id": "dup-alpha"})
+    second = client.post("/command", json={"command": "status", "command_id": "dup-1", "session_id": "dup-beta"})
+
+    assert second.get_json()["text"].startswith("TIME: ")
+    assert second.get_json() != first.get_json()
+    batch = client.post(
+        "/commands",
+        json={"session_id": "dup-gamma", "commands": [{"command": "status", "command_id": "dup-1"}]},
+    )
+    assert batch.get_json()["results"][0]["text"].startswith("TIME: ")
+
+
+def test_concurrent_retries_run_a_command_once(monkeypatch) -> None:
+    """Two in-flight retries of one command id must not both miss the cache."""
+
+    calls = []
+    real_process = server.process_command
+
+    def slow_process(state, raw):
+        calls.append(raw)
+        time.sleep(0.05)
+        return real_process(state, raw)
+
+    monkeypatch.setattr(server, "process_command", slow_process)
+    payload = {"command": "status", "command_id": "retry-1", "session_id": "retry-lab"}
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(server.app.test_client().post("/command", json=payload)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["status"]
+    assert responses[0].get_json() == responses[1].get_json()
+
+
+def test_resolved_session_is_pinned_in_cookie() -> None:
+    client = server.app.test_client()
+    client.post("/command", json={"command": "wait", "session_id": "cookie-lab"})
+    assert client.get_cookie("custodian_session").value == "cookie-lab"
+
+    lab = client.get("/snapshot").get_json()
+    assert lab["time"] > 0
+
+
+def test_snapshot_conditional_get_and_delta() -> None:
+    """GET /snapshot honours If-None-Match and /snapshot/delta returns ops."""
+
+    client = server.app.test_client()
+    first = client.get("/snapshot?session=etag-lab")
+    etag = first.headers["ETag"]
+    revision = int(first.headers["X-State-Revision"])
+
+    assert client.get("/snapshot?session=etag-lab", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/command", json={"command": "wait", "session_id": "etag-lab"})
+    delta = client.get(f"/snapshot/delta?session=etag-lab&since={revision}").get_json()
+    assert delta["full"] is False
+    assert delta["revision"] > revision
+    assert client.get("/snapshot/delta?session=etag-lab").status_code == 400
+
+
+def test_commands_endpoint_runs_batch_in_order() -> None:
+    """POST /commands runs every command and returns one result per entry."""
+
+    client = server.app.test_client()
+    response = client.post(
+        "/commands",
+        json={
+            "session_id": "batch-lab",
+            "commands": ["wait", {"command": "status", "command_id": "batch-status"}],
+        },
+    )
+
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["ok"] is True
+    assert [result["command_id"] for result in payload["results"]] == [None, "batch-status"]
+    assert payload["results"][1]["text"].startswith("TIME: ")
+    assert client.post("/commands", json={"commands": []}).status_code == 400
+
+
+def test_metrics_endpoint_reports_replay_cache_counters() -> None:
+    client = server.app.test_client()
+    client.post("/command", json={"command": "status", "command_id": "metrics-probe"})
+    client.post("/command", json={"command": "status", "command_id": "metrics-probe"})
+
+    payload = client.get("/metrics").get_json()
+    assert payload["command_cache"]["hits"] >= 1
+    assert payload["sessions"]["live"] >= 1
+
+
+def test_stream_registry_forgets_broadcasters_without_viewers() -> None:
+    broadcaster, first = server._join("prune-lab")
+    same, second = server._join("prune-lab")
+    assert same is broadcaster
+
+    server._leave(broadcaster, first)
+    assert server._broadcaster("prune-lab") is broadcaster
+    server._leave(broadcaster, second)
+    assert server._broadcaster("prune-lab") is None
@@ -0,0 +1,93 @@
+"""Tests for the session-keyed world-state pool."""
+
+import threading
+
+import pytest
+
+from game.simulations.world_state.core.invariants import INVARIANT_LEVEL_ENV, INVARIANTS_FULL, INVARIANTS_SAMPLED
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.sessions import (
+    InvalidSessionId,
+    SessionPool,
+    resolve_session_id,
+)
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def test_evicted_session_rehydrates_exactly(tmp_path) -> None:
+    pool = SessionPool(capacity=1, store_dir=tmp_path)
+    with pool.session("alpha", seed=12) as state:
+        process_command(state, "FORTIFY PW 1")
+        process_command(state, "WAIT 5X")
+        before = state.snapshot()
+        rng_before = state.sim_rng.getstate()
+    with pool.session("beta", seed=3) as state:
+        process_command(state, "WAIT")
+
+    assert pool.live_sessions() == ["beta"]
+    assert pool.evictions == 1
+    assert (tmp_path / "alpha.state").exists()
+
+    with pool.session("alpha") as state:
+        assert state.snapshot() == before
+        assert state.sim_rng.getstate() == rng_before
+        process_command(state, "WAIT")
+    assert pool.rehydrations == 1
+    assert pool.live_sessions() == ["alpha"]
+
+
+def test_evicted_sessions_release_their_locks(tmp_path) -> None:
+    pool = SessionPool(capacity=2, store_dir=tmp_path)
+    for index in range(20):
+        with pool.session(f"s{index}"):
+            pass
+    assert sorted(pool._locks) == sorted(pool.live_sessions()) == ["s18", "s19"]
+
+    with pool.session("s3") as state:
+        assert state.time == 0
+    assert pool.rehydrations == 1
+    assert len(pool._locks) == 2
+
+
+def test_seed_only_applies_before_first_tick(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    with pool.session("s", seed=5) as state:
+        assert state.seed == 5
+        process_command(state, "WAIT")
+    with pool.session("s", seed=9) as state:
+        assert state.seed == 5
+
+
+def test_server_sessions_sample_invariants(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv(INVARIANT_LEVEL_ENV, raising=False)
+    pool = SessionPool(store_dir=tmp_path)
+    with pool.session("alpha") as state:
+        assert state.invariants.level == INVARIANTS_SAMPLED
+    assert GameState(seed=1).invariants.level == INVARIANTS_FULL
+
+
+def test_sessions_lock_independently(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _hold() -> None:
+        with pool.session("slow"):
+            entered.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=_hold)
+    worker.start()
+    entered.wait(5)
+    with pool.session("fast") as state:
+        assert state.time == 0
+    release.set()
+    worker.join(5)
+
+
+def test_session_id_resolution() -> None:
+    assert resolve_session_id({}, {}, {}) == "default"
+    assert resolve_session_id({"session_id": "a"}, {"session": "b"}, {}) == "a"
+    assert resolve_session_id({}, {}, {"custodian_session": "c"}) == "c"
+    with pytest.raises(InvalidSessionId):
+        resolve_session_id({"session_id": "../x"}, {}, {})
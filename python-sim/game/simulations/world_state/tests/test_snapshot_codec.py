@@ -0,0 +1,77 @@
+"""Tests for the binary snapshot codec and delta checkpoints."""
+
+import io
+import json
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.snapshot_codec import (
+    SnapshotCheckpointer,
+    decode_chain,
+    decode_snapshot,
+    encode_delta,
+    encode_snapshot,
+    iter_frames,
+    write_frame,
+)
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _json_round_trip(snapshot: dict) -> dict:
+    return json.loads(json.dumps(snapshot))
+
+
+def test_full_snapshot_round_trip_matches_json() -> None:
+    state = GameState(seed=11)
+    process_command(state, "FORTIFY PW 2")
+    snapshot = state.snapshot()
+
+    for compress in (False, True):
+        blob = encode_snapshot(snapshot, compress=compress)
+        assert len(blob) < len(json.dumps(snapshot))
+        decoded = decode_snapshot(blob)
+        assert decoded == _json_round_trip(snapshot)
+        assert GameState.from_snapshot(decoded).snapshot() == GameState.from_snapshot(snapshot).snapshot()
+
+
+def test_checkpointer_chain_reconstructs_latest_snapshot() -> None:
+    state = GameState(seed=4)
+    clock = SimulationClock(headless=True)
+    checkpointer = SnapshotCheckpointer(keyframe_interval=10)
+    handle = io.BytesIO()
+    blobs = []
+    for _ in range(25):
+        step_world(state, clock=clock)
+        blob = checkpointer.checkpoint(state)
+        blobs.append(blob)
+        write_frame(handle, blob)
+
+    assert all(len(blob) < len(blobs[0]) for blob in blobs[1:10])
+    assert decode_chain(blobs) == _json_round_trip(state.snapshot())
+
+    handle.seek(0)
+    assert list(iter_frames(handle)) == blobs
+
+
+def test_delta_records_removed_keys() -> None:
+    previous = {"time": 1, "sectors": {"A": {"damage": 0.0}, "B": {"damage": 1.0}}}
+    current = {"time": 2, "sectors": {"A": {"damage": 0.5}}}
+    base = decode_snapshot(encode_snapshot(previous))
+
+    restored = decode_snapshot(encode_delta(previous, current), base)
+
+    assert restored["sectors"] == {"A": {"damage": 0.5}}
+    assert base["sectors"]["B"] == {"damage": 1.0}
+
+
+def test_decode_rejects_bad_blobs() -> None:
+    blob = encode_snapshot({"time": 0})
+    with pytest.raises(ValueError):
+        decode_snapshot(b"JUNK" + blob[4:])
+    with pytest.raises(ValueError):
+        decode_snapshot(blob[:4] + b"\x63" + blob[5:])
+    with pytest.raises(ValueError):
+        decode_snapshot(encode_delta({"time": 0}, {"time": 1}))
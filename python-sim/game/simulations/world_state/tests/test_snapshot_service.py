@@ -0,0 +1,62 @@
+"""Tests for revision-keyed snapshot caching and deltas."""
+
+import json
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.snapshot_codec import apply_delta_ops
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.snapshot_service import etag_matches, snapshot_service
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def test_revision_bumps_and_cache_reuses_body() -> None:
+    state = GameState(seed=8)
+    state.clock = SimulationClock(headless=True)
+    service = snapshot_service(state)
+
+    first = service.current(state)
+    assert service.current(state) is first
+    assert service.builds == 1
+
+    process_command(state, "STATUS")
+    step_world(state)
+    second = service.current(state)
+    assert second.revision == first.revision + 2
+    assert second.etag != first.etag
+    assert json.loads(second.body) == second.snapshot
+    assert state.fork().snapshot_service is None
+
+
+def test_delta_reconstructs_current_snapshot() -> None:
+    state = GameState(seed=8)
+    state.clock = SimulationClock(headless=True)
+    service = snapshot_service(state)
+    process_command(state, "FORTIFY PW 1")
+    step_world(state)
+    base = service.current(state)
+
+    for _ in range(3):
+        step_world(state)
+    delta = service.delta(state, base.revision)
+    current = service.current(state)
+
+    assert delta["full"] is False
+    assert apply_delta_ops(base.snapshot, delta["ops"]) == current.snapshot
+    assert len(json.dumps(delta)) * 10 < len(current.body)
+
+    stale = service.delta(state, base.revision - 1)
+    assert stale["full"] is True
+    assert stale["snapshot"] == current.snapshot
+
+
+def test_etag_matching_and_reset_changes_tag() -> None:
+    state = GameState(seed=8)
+    cached = snapshot_service(state).current(state)
+    assert etag_matches(cached.etag, cached.etag)
+    assert etag_matches(f'"other", W/{cached.etag}', cached.etag)
+    assert not etag_matches(None, cached.etag)
+
+    revision = state.revision
+    process_command(state, "RESET")
+    assert state.revision > revision
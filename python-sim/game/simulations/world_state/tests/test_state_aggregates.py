@@ -0,0 +1,78 @@
+"""Tests for incrementally maintained GameState aggregates."""
+
+import pickle
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.grid_assault import perimeter_profile
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.core.structures import Structure, generate_perimeter_positions
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _brute_force_coverage(state: GameState, sector_name: str) -> float:
+    grid = state.sector_grids[sector_name]
+    expected = generate_perimeter_positions(state.sector_fort_levels[sector_name], grid.width, grid.height)
+    present = 0
+    for pos in expected:
+        sid = grid.cells[pos].structure_id
+        if sid is not None and state.structure_instances[sid].type == "WALL":
+            present += 1
+    return present / float(len(expected))
+
+
+def test_aggregates_track_mutations_across_ticks() -> None:
+    state = GameState(seed=7)
+    clock = SimulationClock(headless=True)
+    process_command(state, "FORTIFY PW 2")
+    state.structures["PW_EXTRA"] = Structure("PW_EXTRA", "POWER RELAY", "POWER")
+    state.place_structure_instance("TURRET", "COMMAND", 4, 4)
+
+    for _ in range(60):
+        step_world(state, clock=clock)
+        state.verify_aggregates()
+
+    state.sectors["COMMAND"].damage += 0.5
+    state.sectors["POWER"].power = 0.25
+    del state.structures["PW_EXTRA"]
+    state.verify_aggregates()
+    assert state.sector_totals.power == sum(s.power for s in state.sectors.values())
+
+
+def test_perimeter_profile_matches_grid_scan_after_wall_loss() -> None:
+    state = GameState(seed=22)
+    process_command(state, "FORTIFY PW 2")
+    intact = perimeter_profile(state, "POWER")
+    assert intact.coverage == _brute_force_coverage(state, "POWER") == 1.0
+
+    wall_ids = [
+        sid for sid, inst in state.structure_instances.items()
+        if inst.sector == "POWER" and inst.type == "WALL" and inst.position[0] == 0
+    ]
+    for sid in wall_ids:
+        state.remove_structure_instance(sid)
+
+    damaged = perimeter_profile(state, "POWER")
+    assert damaged is not intact
+    assert damaged.coverage == _brute_force_coverage(state, "POWER")
+    assert perimeter_profile(state, "POWER") is damaged
+    state.verify_aggregates()
+
+
+def test_aggregates_survive_snapshot_and_pickle_round_trip() -> None:
+    state = GameState(seed=3)
+    process_command(state, "FORTIFY CM 1")
+    for restored in (GameState.from_snapshot(state.snapshot()), pickle.loads(pickle.dumps(state))):
+        restored.verify_aggregates()
+        assert restored.structure_instances.wall_count("COMMAND") == state.structure_instances.wall_count(
+            "COMMAND"
+        )
+
+
+def test_verify_aggregates_detects_stale_index() -> None:
+    state = GameState(seed=1)
+    dict.__setitem__(state.structures, "ROGUE", Structure("ROGUE", "ROGUE", "POWER"))
+    with pytest.raises(AssertionError):
+        state.verify_aggregates()
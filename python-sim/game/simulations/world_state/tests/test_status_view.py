@@ -0,0 +1,44 @@
+"""Tests for revision-memoized STATUS rendering."""
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _state() -> GameState:
+    state = GameState(seed=9)
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+def test_repeated_status_reuses_sections_until_world_changes() -> None:
+    state = _state()
+    first = process_command(state, "STATUS")
+    view = state.status_view
+    builds = view.builds
+
+    again = process_command(state, "STATUS")
+    process_command(state, "HELP")
+    process_command(state, "STATUS")
+
+    assert again.text == first.text and again.lines == first.lines
+    assert state.status_view is view
+    assert view.builds == builds
+    assert view.revision == state.revision
+
+    process_command(state, "WAIT")
+    process_command(state, "STATUS")
+    assert state.status_view is not view
+
+
+def test_cached_full_status_still_tracks_sector_deltas() -> None:
+    state = _state()
+    process_command(state, "STATUS FULL")
+    state.sectors["POWER"].damage = 1.5
+    process_command(state, "SET REPAIR 2")
+
+    changed = process_command(state, "STATUS FULL").lines
+    repeated = process_command(state, "STATUS FULL").lines
+
+    assert any(line.startswith("POWER ") and line.endswith(")") for line in changed)
+    assert not any(line.startswith("POWER ") and line.endswith(")") for line in repeated)
@@ -21,7 +21,7 @@ def test_help_output_matches_contract() -> None:
         "USE: HELP <TOPIC>",
         "TOPICS: CORE | MOVEMENT | SYSTEMS | GRID | POLICY | FABRICATION | ASSAULT | STATUS",
         "",
-        "[CORE] STATUS | WAIT | HELP",
+        "[CORE] STATUS | WAIT | FORECAST | HELP",
         "[MOVEMENT] DEPLOY | MOVE | RETURN",
         "[SYSTEMS] FOCUS | HARDEN | REPAIR | SCAVENGE",
         "[GRID] BUILD <TYPE> <X> <Y>",
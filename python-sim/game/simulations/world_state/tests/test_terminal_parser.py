@@ -1,6 +1,9 @@
 """Tests for terminal command parsing."""
 
-from game.simulations.world_state.terminal.parser import parse_input
+import shlex
+
+from game.simulations.world_state.terminal.parser import parse_input, tokenize
+from game.simulations.world_state.terminal.processor import COMMAND_REGISTRY
 
 
 def test_parse_input_uppercases_verb_and_preserves_args() -> None:
@@ -27,3 +30,20 @@ def test_parse_input_allows_slash_prefixed_commands() -> None:
     assert parsed is not None
     assert parsed.verb == "TUTORIAL"
     assert parsed.args == ["core"]
+
+
+def test_tokenize_fast_path_matches_shlex() -> None:
+    """Plain-split fast path must tokenize exactly like shlex."""
+
+    for line in ["fortify  gateway 2", "a\tb", 'deploy "north gate"', "x\x0by", "a\\ b", "repair 'x y' full"]:
+        assert list(tokenize(line)) == shlex.split(line)
+
+
+def test_command_registry_resolves_aliases() -> None:
+    """RESET and REBOOT share one spec that still runs after failure."""
+
+    reset = COMMAND_REGISTRY.resolve("REBOOT")
+
+    assert reset is COMMAND_REGISTRY.resolve("RESET")
+    assert reset.allowed_when_failed is True
+    assert COMMAND_REGISTRY.resolve("NONESUCH") is None
@@ -15,7 +15,7 @@ from game.simulations.world_state.terminal.processor import process_command
 
 
 def _disable_wait_tick_pause(monkeypatch) -> None:
-    monkeypatch.setattr("game.simulations.world_state.terminal.commands.wait.time.sleep", lambda *_: None)
+    monkeypatch.setattr("game.simulations.world_state.core.clock.time.sleep", lambda *_: None)
 
 
 def test_wait_advances_five_ticks(monkeypatch) -> None:
@@ -422,10 +422,13 @@ def test_deploy_fragmented_keeps_terse_invalid_target() -> None:
 def test_debug_blocked_when_dev_mode_disabled() -> None:
     state = GameState()
 
+    log_before = list(state.operator_log)
+
     result = process_command(state, "DEBUG ASSAULT")
 
     assert result.ok is False
     assert result.text == "DEV MODE DISABLED."
+    assert list(state.operator_log) == log_before
 
 
 def test_debug_assault_forces_assault_in_dev_mode(monkeypatch) -> None:
@@ -885,7 +888,11 @@ def test_wait_surfaces_debug_trace_lines(monkeypatch) -> None:
 
     def _trace_step(local_state: GameState) -> bool:
         local_state.time += 1
-        print("{'tick': 1, 'active_sectors': [], 'ambient_threat': 0.0, 'alertness': {}}")
+        local_state.clock.narrate(
+            local_state.time,
+            "trace",
+            "{'tick': 1, 'active_sectors': [], 'ambient_threat': 0.0, 'alertness': {}}",
+        )
         return False
 
     monkeypatch.setattr(
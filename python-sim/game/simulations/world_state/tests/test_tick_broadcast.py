@@ -0,0 +1,135 @@
+"""Tests for the in-process tick broadcaster."""
+
+import json
+
+from game.simulations.world_state.broadcast import BROADCAST_SNAPSHOT_INTERVAL, TickBroadcaster
+from game.simulations.world_state.sessions import SessionPool
+from game.simulations.world_state.terminal.processor import process_command
+
+
+def _parse_sse(payload: str) -> tuple[list[str], dict]:
+    lines: list[str] = []
+    delta: dict = {}
+    for block in payload.split("\n\n"):
+        if block.startswith("event: tick\ndata: "):
+            delta = json.loads(block.split("data: ", 1)[1])
+        elif block.startswith("data: "):
+            lines.append(block[len("data: "):])
+    return lines, delta
+
+
+def test_one_simulation_fans_out_to_every_viewer(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=60.0)
+    broadcaster.pause()
+    viewers = [broadcaster.subscribe() for _ in range(3)]
+
+    for _ in range(BROADCAST_SNAPSHOT_INTERVAL):
+        broadcaster.step()
+
+    with pool.session("lab") as state:
+        assert state.time == BROADCAST_SNAPSHOT_INTERVAL
+        process_command(state, "STATUS")
+    for viewer in viewers:
+        assert viewer.get(timeout=1).tick == 0
+        received = [viewer.get(timeout=1) for _ in range(BROADCAST_SNAPSHOT_INTERVAL)]
+        assert [message.tick for message in received] == list(range(1, BROADCAST_SNAPSHOT_INTERVAL + 1))
+        lines, delta = _parse_sse(received[-1].sse)
+        assert delta["tick"] == BROADCAST_SNAPSHOT_INTERVAL
+        assert "[Snapshot]" in lines
+    assert received[0].delta["sectors"]
+    assert "[Snapshot]" in broadcaster.history
+
+    for viewer in viewers:
+        broadcaster.unsubscribe(viewer)
+
+
+def test_late_viewer_starts_from_every_sector(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=60.0)
+    broadcaster.pause()
+    early = broadcaster.subscribe()
+    for _ in range(3):
+        broadcaster.step()
+
+    late = broadcaster.subscribe()
+    broadcaster.step()
+
+    baseline = late.get(timeout=1)
+    with pool.session("lab") as state:
+        assert set(baseline.delta["sectors"]) == set(state.sectors)
+        assert baseline.tick == state.time - 1
+    assert late.get(timeout=1).tick == baseline.tick + 1
+    for viewer in (early, late):
+        broadcaster.unsubscribe(viewer)
+
+
+def test_slow_viewer_is_dropped_without_stalling_others(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=60.0, queue_size=2)
+    broadcaster.pause()
+    slow = broadcaster.subscribe()
+    fast = broadcaster.subscribe()
+
+    for _ in range(4):
+        broadcaster.step()
+        assert fast.get(timeout=1) is not None
+
+    assert slow.dropped
+    assert not fast.dropped
+    assert broadcaster.dropped == 1
+    assert broadcaster.subscriber_count() == 1
+    broadcaster.unsubscribe(fast)
+
+
+def test_run_thread_ticks_until_last_viewer_leaves(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=0.01)
+    viewer = broadcaster.subscribe()
+
+    assert viewer.get(timeout=5) is not None
+    assert broadcaster.running
+
+    broadcaster.unsubscribe(viewer)
+    for _ in range(500):
+        if not broadcaster.running:
+            break
+        viewer.get(timeout=0.01)
+    assert not broadcaster.running
+
+
+def test_failed_step_ends_streams_and_next_viewer_restarts(tmp_path, monkeypatch) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=0.01)
+    real_step = broadcaster.step
+
+    def _broken_step():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(broadcaster, "step", _broken_step)
+    monkeypatch.setattr("threading.excepthook", lambda args: None)
+    viewer = broadcaster.subscribe()
+    for _ in range(500):
+        if viewer.dropped:
+            break
+        viewer.get(timeout=0.01)
+    assert viewer.dropped and viewer.reason == "simulation stopped"
+    assert broadcaster.subscriber_count() == 0
+
+    monkeypatch.setattr(broadcaster, "step", real_step)
+    again = broadcaster.subscribe()
+    assert again.get(timeout=5) is not None
+    broadcaster.unsubscribe(again)
+
+
+def test_step_leaves_session_clock_records_alone(tmp_path) -> None:
+    pool = SessionPool(store_dir=tmp_path)
+    broadcaster = TickBroadcaster(pool, "lab", tick_delay=60.0)
+    with pool.session("lab") as state:
+        state.clock.narrate(state.time, "command", "OPERATOR LINE")
+
+    broadcaster.step()
+
+    with pool.session("lab") as state:
+        assert [record.text for record in state.clock.records] == ["OPERATOR LINE"]
+        assert state.clock.record_tactical is False
@@ -0,0 +1,37 @@
+"""Tests for the step_world phase profiler."""
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.profiler import TickProfiler
+from game.simulations.world_state.core.simulation import sandbox_world, step_world
+from game.simulations.world_state.core.state import GameState
+
+
+def test_profiler_records_phases_without_changing_outcome() -> None:
+    plain = GameState(seed=6)
+    profiled = GameState(seed=6)
+    profiled.profiler = TickProfiler(capacity=16)
+    clock = SimulationClock(headless=True)
+    for _ in range(40):
+        step_world(plain, clock=clock)
+        step_world(profiled, clock=clock)
+
+    profiler = profiled.profiler
+    assert profiled.snapshot() == plain.snapshot()
+    assert len(profiler.ticks) == 16
+    assert profiler.ticks[-1].tick == profiled.time
+    assert profiler.calls["advance_time"] == profiled.time
+    assert profiler.calls.get("resolve_assault", 0) + profiler.calls["advance_assaults"] == profiled.time
+
+    summary = profiler.summary()
+    assert summary["window"] == 16
+    assert set(summary["phases"]) <= set(profiler.calls)
+    assert profiled.fork().profiler is None
+
+
+def test_sandbox_world_profile_renders_table() -> None:
+    state = sandbox_world(ticks=10, seed=2, headless=True, profile=True)
+    lines = state.profiler.summary_lines()
+
+    assert lines[0].startswith("TICKS: ")
+    assert lines[1].split()[0] == "PHASE"
+    assert any(line.startswith("check_invariants") for line in lines)
@@ -74,7 +74,7 @@ def test_transit_fortification_is_deterministic_over_100_ticks() -> None:
 
 
 def test_wait_surfaces_intercept_line_with_transit_fortification(monkeypatch) -> None:
-    monkeypatch.setattr("game.simulations.world_state.terminal.commands.wait.time.sleep", lambda *_: None)
+    monkeypatch.setattr("game.simulations.world_state.core.clock.time.sleep", lambda *_: None)
     monkeypatch.setattr(assaults, "maybe_warn", lambda *_: None)
     state = GameState(seed=12)
     state.turret_ammo_stock = 1
@@ -0,0 +1,77 @@
+"""Tests for compiled WAIT UNTIL conditions."""
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+from game.simulations.world_state.terminal.wait_conditions import WaitCondition, compile_wait_condition
+
+
+def _state(seed: int = 3) -> GameState:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+@pytest.mark.parametrize(
+    ("text", "label"),
+    [
+        ("assault", "ASSAULT"),
+        ("fab  queue empty", "FAB QUEUE EMPTY"),
+        ("MATERIALS >= 20", "MATERIALS>=20"),
+        ("sector AR damage>1", "SECTOR ARCHIVE DAMAGE>1"),
+        ("sector nowhere damage>1", None),
+        ("morale>3", None),
+    ],
+)
+def test_compile_wait_condition_labels(text: str, label: str | None) -> None:
+    compiled = compile_wait_condition(text)
+
+    assert (compiled.label if compiled else None) == label
+
+
+def test_wait_until_stops_on_first_tick_condition_holds(monkeypatch) -> None:
+    state = _state()
+    target = state.materials + 5
+    compiled = compile_wait_condition(f"MATERIALS>={target}")
+    checks: list[tuple[int, bool]] = []
+
+    def _recording(local_state: GameState) -> bool:
+        held = compiled.test(local_state)
+        checks.append((local_state.time, held))
+        return held
+
+    monkeypatch.setattr(
+        "game.simulations.world_state.terminal.commands.wait.compile_wait_condition",
+        lambda _text: WaitCondition(label=compiled.label, test=_recording),
+    )
+
+    result = process_command(state, f"WAIT UNTIL MATERIALS>={target}")
+
+    assert result.text == f"TIME ADVANCED UNTIL MATERIALS>={target}."
+    assert result.lines[0].startswith("ELAPSED: ")
+    assert "CONDITION NOT MET BEFORE SAFETY LIMIT." not in result.lines
+    assert len(checks) >= 2
+    assert [held for _time, held in checks[:-1]] == [False] * (len(checks) - 1)
+    assert checks[-2][0] == state.time - 1
+    assert checks[-1] == (state.time, True)
+    assert state.materials >= target
+
+
+def test_wait_until_assault_keeps_legacy_semantics() -> None:
+    state = _state()
+
+    result = process_command(state, "WAIT UNTIL ASSAULT")
+
+    assert result.ok is True
+    assert state.in_major_assault or state.current_assault is not None or state.is_failed
+
+
+def test_wait_until_unknown_condition_lists_forms() -> None:
+    state = _state()
+
+    result = process_command(state, "WAIT UNTIL MORALE>3")
+
+    assert result.text.startswith("WAIT UNTIL REQUIRES:")
+    assert state.time == 0
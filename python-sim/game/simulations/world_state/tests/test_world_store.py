@@ -0,0 +1,197 @@
+"""Tests for the SQLite-backed world store."""
+
+import sqlite3
+import threading
+from uuid import uuid4
+
+import pytest
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.hub import CampaignRecord, HubState
+from game.simulations.world_state.core.replay import ReplayRecorder, seek
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.sessions import SessionPool
+from game.simulations.world_state.terminal.processor import process_command
+from game.simulations.world_state.world_store import WorldStore
+
+
+def _headless_state(seed: int) -> GameState:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    return state
+
+
+def _played_state(seed: int) -> GameState:
+    state = _headless_state(seed)
+    process_command(state, "FORTIFY PW 1")
+    process_command(state, "WAIT 5X")
+    return state
+
+
+def test_state_round_trips_before_and_after_commit(tmp_path) -> None:
+    with WorldStore(tmp_path / "world.db", flush_seconds=1.0) as store:
+        state = _played_state(4)
+        store.save_state("alpha", state)
+        # Served from the pending write without waiting for the writer.
+        assert store.load_state("alpha").snapshot() == state.snapshot()
+
+        store.flush()
+        restored = store.load_state("alpha")
+        assert restored.snapshot() == state.snapshot()
+        assert restored.sim_rng.getstate() == state.sim_rng.getstate()
+        assert store.sessions() == [("alpha", 4, state.time)]
+        assert store.load_state("missing") is None
+
+        store.delete_state("alpha")
+        store.flush()
+        assert store.load_state("alpha") is None
+
+
+def test_writes_are_batched_and_the_database_uses_wal(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    state = _played_state(2)
+    with WorldStore(path, batch_size=16, flush_seconds=0.5) as store:
+        for index in range(32):
+            store.save_keyframe("alpha", state)
+        store.flush()
+        assert store.writes == 32
+        assert store.batches < 32
+
+    connection = sqlite3.connect(str(path))
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("SELECT COUNT(*) FROM keyframes").fetchone()[0] == 32
+    finally:
+        connection.close()
+
+
+def test_keyframes_are_looked_up_by_session_seed_and_tick(tmp_path) -> None:
+    with WorldStore(tmp_path / "world.db") as store:
+        state = _headless_state(7)
+        ticks = []
+        for _ in range(3):
+            store.save_keyframe("alpha", state)
+            ticks.append(state.time)
+            process_command(state, "WAIT")
+        store.save_keyframe("beta", GameState(seed=8))
+
+        assert [tick for _, _, tick in store.keyframe_ticks(session_id="alpha")] == ticks
+        assert store.keyframe_ticks(seed=8) == [("beta", 8, 0)]
+        assert store.load_keyframe("alpha", ticks[1] + 1).time == ticks[1]
+        assert store.load_keyframe("alpha").time == ticks[-1]
+        assert store.load_keyframe("alpha", -1) is None
+
+
+def test_hub_and_campaign_history_round_trip(tmp_path) -> None:
+    hub = HubState(seed=3, capability_flags={"recon_depth": 1}, unlocked_scenario_archetypes={"SIEGE"})
+    for timestamp, outcome in ((10, "COMPLETE"), (20, "FAILED")):
+        hub.campaign_history.append(
+            CampaignRecord(
+                scenario_id=uuid4(),
+                region_id="RX-101A",
+                outcome=outcome,
+                difficulty_descriptor="UNSTABLE CONDITIONS",
+                timestamp=timestamp,
+                notes={"archive_loss": timestamp},
+            )
+        )
+
+    with WorldStore(tmp_path / "world.db") as store:
+        store.save_hub("hub-1", hub)
+        restored = store.load_hub("hub-1")
+        assert restored.snapshot() == hub.snapshot()
+        assert store.campaign_history(seed=3) == hub.campaign_history
+        assert store.campaign_history(seed=99) == []
+        assert store.load_hub("missing") is None
+
+        hub.campaign_history.pop()
+        store.save_hub("hub-1", hub)
+        assert [record.outcome for record in store.campaign_history(hub_id="hub-1")] == ["COMPLETE"]
+
+
+def test_replay_log_round_trips_and_seeks(tmp_path) -> None:
+    state = _headless_state(5)
+    recorder = ReplayRecorder(keyframe_interval=3)
+    recorder.attach(state)
+    process_command(state, "WAIT 3X")
+    process_command(state, "FORTIFY PW 1")
+    expected = state.snapshot()
+
+    with WorldStore(tmp_path / "world.db") as store:
+        store.save_replay("alpha", recorder.log)
+        log = store.load_replay("alpha")
+        assert store.load_replay("beta") is None
+
+    assert log.commands == recorder.log.commands
+    assert seek(log, state.time).snapshot() == expected
+
+
+def test_session_pool_evicts_into_store(tmp_path) -> None:
+    with WorldStore(tmp_path / "world.db") as store:
+        pool = SessionPool(capacity=1, store=store)
+        with pool.session("alpha", seed=12) as state:
+            process_command(state, "WAIT 5X")
+            before = state.snapshot()
+        with pool.session("beta", seed=3) as state:
+            process_command(state, "WAIT")
+
+        assert pool.evictions == 1
+        assert not (pool.store_dir / "alpha.state").exists()
+        with pool.session("alpha") as state:
+            assert state.snapshot() == before
+        assert pool.rehydrations == 1
+
+        pool.flush()
+        assert {session_id for session_id, _, _ in store.sessions()} == {"alpha", "beta"}
+
+
+def _refuse_session_rows(path) -> None:
+    connection = sqlite3.connect(str(path))
+    try:
+        connection.execute(
+            "CREATE TRIGGER refuse_sessions BEFORE INSERT ON sessions "
+            "BEGIN SELECT RAISE(ABORT, 'injected failure'); END"
+        )
+    finally:
+        connection.close()
+
+
+def test_failed_state_write_stays_pending(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    with WorldStore(path) as store:
+        _refuse_session_rows(path)
+        state = _played_state(4)
+        store.save_state("alpha", state)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.flush()
+        assert store.load_state("alpha").snapshot() == state.snapshot()
+
+
+def test_write_errors_reach_only_their_own_thread(tmp_path) -> None:
+    def boom(_connection) -> None:
+        raise RuntimeError("injected failure")
+
+    with WorldStore(tmp_path / "world.db", flush_seconds=0.5) as store:
+        state = _played_state(4)
+        store.save_state("alpha", state)
+        worker = threading.Thread(target=store._submit, args=(boom,))
+        worker.start()
+        worker.join()
+
+        # The failing write shared a batch with the save; only it is dropped.
+        store.flush()
+        assert store.sessions() == [("alpha", 4, state.time)]
+        assert store.writes == 1
+
+
+def test_session_pool_close_stores_live_sessions(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    pool = SessionPool(store=WorldStore(path))
+    with pool.session("alpha", seed=12) as state:
+        process_command(state, "WAIT")
+        before = state.snapshot()
+    pool.close()
+
+    with WorldStore(path) as store:
+        assert store.load_state("alpha").snapshot() == before
@@ -0,0 +1,420 @@
+"""SQLite-backed store for world states, hub state, campaigns and replays."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import os
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+from uuid import UUID
+
+from game.simulations.world_state.core.hub import CampaignRecord, HubState
+from game.simulations.world_state.core.replay import (
+    ReplayLog,
+    decode_replay,
+    encode_replay,
+    freeze_state,
+    thaw_state,
+)
+from game.simulations.world_state.core.state import GameState
+
+
+WORLD_STORE_ENV = "WORLD_STATE_STORE"
+WORLD_STORE_BATCH_SIZE = 64
+WORLD_STORE_FLUSH_SECONDS = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    tick INTEGER NOT NULL,
+    revision INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    blob BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_seed ON sessions (seed, tick);
+CREATE TABLE IF NOT EXISTS keyframes (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    tick INTEGER NOT NULL,
+    created REAL NOT NULL,
+    blob BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS keyframes_session_tick ON keyframes (session_id, tick);
+CREATE INDEX IF NOT EXISTS keyframes_seed_tick ON keyframes (seed, tick);
+CREATE TABLE IF NOT EXISTS hubs (
+    hub_id TEXT PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS campaigns (
+    id INTEGER PRIMARY KEY,
+    hub_id TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    scenario_id TEXT NOT NULL,
+    region_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    difficulty_descriptor TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    notes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS campaigns_hub ON campaigns (hub_id, position);
+CREATE INDEX IF NOT EXISTS campaigns_seed ON campaigns (seed, timestamp);
+CREATE TABLE IF NOT EXISTS replays (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    first_tick INTEGER NOT NULL,
+    last_tick INTEGER NOT NULL,
+    created REAL NOT NULL,
+    blob BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS replays_session ON replays (session_id, id);
+CREATE INDEX IF NOT EXISTS replays_seed ON replays (seed, first_tick);
+"""
+
+_Write = Callable[[sqlite3.Connection], None]
+
+
+class _Job:
+    """One queued write, the thread that queued it, and its commit hook."""
+
+    __slots__ = ("write", "owner", "committed")
+
+    def __init__(self, write: _Write, owner: int, committed: Callable[[], None] | None = None):
+        self.write = write
+        self.owner = owner
+        self.committed = committed
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class WorldStore:
+    """Write-behind SQLite store shared by the command servers.
+
+    Callers encode payloads (pickles, JSON) on their own thread, then hand
+    the row write to a background writer that commits queued writes in
+    batches of up to ``batch_size`` per transaction. The database runs in WAL
+    mode so reads never wait on the writer. The newest state per session is
+    also kept in memory until its row is committed, so ``load_state`` sees
+    every save without flushing. The other reads flush first.
+
+    A batch that fails is rolled back and its writes retried one per
+    transaction, so one bad write does not cost its neighbours. A write that
+    still fails is reported to the thread that queued it, on that thread's
+    next ``flush`` or ``close``; a failed state save stays pending in memory.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = WORLD_STORE_BATCH_SIZE,
+        flush_seconds: float = WORLD_STORE_FLUSH_SECONDS,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self.flush_seconds = float(flush_seconds)
+        self.batches = 0
+        self.writes = 0
+        self._reader = _connect(self.path)
+        self._reader.executescript(_SCHEMA)
+        self._read_lock = threading.Lock()
+        self._queue: queue.Queue[_Job | None] = queue.Queue()
+        self._pending_states: dict[str, bytes] = {}
+        self._pending_lock = threading.Lock()
+        self._errors: dict[int, BaseException] = {}
+        self._errors_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="world-store-writer", daemon=True)
+        self._writer.start()
+
+    @classmethod
+    def from_env(cls) -> "WorldStore | None":
+        path = os.getenv(WORLD_STORE_ENV)
+        return cls(path) if path else None
+
+    def __enter__(self) -> "WorldStore":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    # -- writer ---------------------------------------------------------
+
+    def _run(self) -> None:
+        connection = _connect(self.path)
+        try:
+            while True:
+                write = self._queue.get()
+                batch = [write]
+                deadline = time.monotonic() + self.flush_seconds
+                while write is not None and len(batch) < self.batch_size:
+                    try:
+                        write = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    batch.append(write)
+                jobs = [item for item in batch if item is not None]
+                if jobs:
+                    self._commit(connection, jobs)
+                for _ in batch:
+                    self._queue.task_done()
+                if len(jobs) != len(batch):
+                    return
+        finally:
+            connection.close()
+
+    def _commit(self, connection: sqlite3.Connection, jobs: list[_Job]) -> None:
+        try:
+            connection.execute("BEGIN")
+            for job in jobs:
+                job.write(connection)
+            connection.execute("COMMIT")
+        except BaseException as error:  # surfaced to the owner on flush/close
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            if len(jobs) > 1:
+                for job in jobs:
+                    self._commit(connection, [job])
+                return
+            with self._errors_lock:
+                self._errors.setdefault(jobs[0].owner, error)
+            return
+        self.batches += 1
+        self.writes += len(jobs)
+        for job in jobs:
+            if job.committed is not None:
+                job.committed()
+
+    def _submit(self, write: _Write, committed: Callable[[], None] | None = None) -> None:
+        if self._closed:
+            raise RuntimeError("WorldStore is closed.")
+        self._queue.put(_Job(write, threading.get_ident(), committed))
+
+    def _raise_own_error(self) -> None:
+        with self._errors_lock:
+            error = self._errors.pop(threading.get_ident(), None)
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """Block until every queued write is committed.
+
+        Raises the first write error from this thread's own writes.
+        """
+
+        self._queue.join()
+        self._raise_own_error()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._queue.put(None)
+        self._closed = True
+        self._writer.join()
+        with self._read_lock:
+            self._reader.close()
+        self._raise_own_error()
+
+    def _read(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    # -- live session states -------------------------------------------
+
+    def save_state(self, session_id: str, state: GameState) -> None:
+        """Queue ``state`` as the newest save for ``session_id``."""
+
+        blob = freeze_state(state)
+        seed, tick, revision = int(state.seed), int(state.time), int(state.revision)
+        with self._pending_lock:
+            self._pending_states[session_id] = blob
+
+        def write(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                (session_id, seed, tick, revision, time.time(), blob),
+            )
+
+        def committed() -> None:
+            with self._pending_lock:
+                if self._pending_states.get(session_id) is blob:
+                    del self._pending_states[session_id]
+
+        self._submit(write, committed)
+
+    def load_state(self, session_id: str) -> GameState | None:
+        with self._pending_lock:
+            blob = self._pending_states.get(session_id)
+        if blob is None:
+            rows = self._read("SELECT blob FROM sessions WHERE session_id = ?", (session_id,))
+            if not rows:
+                return None
+            blob = rows[0][0]
+        return thaw_state(blob)
+
+    def delete_state(self, session_id: str) -> None:
+        with self._pending_lock:
+            self._pending_states.pop(session_id, None)
+        self._submit(lambda connection: connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,)))
+
+    def sessions(self) -> list[tuple[str, int, int]]:
+        """Return ``(session_id, seed, tick)`` for every stored session."""
+
+        self.flush()
+        return self._read("SELECT session_id, seed, tick FROM sessions ORDER BY session_id")
+
+    # -- keyframes ------------------------------------------------------
+
+    def save_keyframe(self, session_id: str, state: GameState) -> None:
+        blob = freeze_state(state)
+        row = (session_id, int(state.seed), int(state.time), time.time(), blob)
+        self._submit(
+            lambda connection: connection.execute(
+                "INSERT INTO keyframes (session_id, seed, tick, created, blob) VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+        )
+
+    def load_keyframe(self, session_id: str, tick: int | None = None) -> GameState | None:
+        """Return the latest keyframe at or before ``tick`` (any tick if None)."""
+
+        self.flush()
+        if tick is None:
+            rows = self._read(
+                "SELECT blob FROM keyframes WHERE session_id = ? ORDER BY tick DESC, id DESC LIMIT 1",
+                (session_id,),
+            )
+        else:
+            rows = self._read(
+                "SELECT blob FROM keyframes WHERE session_id = ? AND tick <= ? "
+                "ORDER BY tick DESC, id DESC LIMIT 1",
+                (session_id, int(tick)),
+            )
+        return thaw_state(rows[0][0]) if rows else None
+
+    def keyframe_ticks(self, *, session_id: str | None = None, seed: int | None = None) -> list[tuple[str, int, int]]:
+        """Return ``(session_id, seed, tick)`` for keyframes matching the filters."""
+
+        self.flush()
+        clauses, params = [], []
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if seed is not None:
+            clauses.append("seed = ?")
+            params.append(int(seed))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._read(f"SELECT session_id, seed, tick FROM keyframes{where} ORDER BY tick, id", tuple(params))
+
+    # -- hub and campaign history ---------------------------------------
+
+    def save_hub(self, hub_id: str, hub: HubState) -> None:
+        """Queue ``hub`` and replace its campaign history rows."""
+
+        payload = hub.snapshot()
+        seed = int(hub.seed)
+        history = payload.pop("campaign_history")
+        rows = [
+            (
+                hub_id,
+                seed,
+                position,
+                record["scenario_id"],
+                record["region_id"],
+                record["outcome"],
+                record["difficulty_descriptor"],
+                int(record["timestamp"]),
+                json.dumps(record["notes"], sort_keys=True),
+            )
+            for position, record in enumerate(history)
+        ]
+        body = json.dumps(payload, sort_keys=True)
+
+        def write(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "INSERT OR REPLACE INTO hubs VALUES (?, ?, ?, ?)",
+                (hub_id, seed, time.time(), body),
+            )
+            connection.execute("DELETE FROM campaigns WHERE hub_id = ?", (hub_id,))
+            connection.executemany(
+                "INSERT INTO campaigns (hub_id, seed, position, scenario_id, region_id, outcome, "
+                "difficulty_descriptor, timestamp, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        self._submit(write)
+
+    def load_hub(self, hub_id: str) -> HubState | None:
+        self.flush()
+        rows = self._read("SELECT payload FROM hubs WHERE hub_id = ?", (hub_id,))
+        if not rows:
+            return None
+        hub = HubState.from_snapshot(json.loads(rows[0][0]))
+        hub.campaign_history = self.campaign_history(hub_id=hub_id)
+        return hub
+
+    def campaign_history(self, *, hub_id: str | None = None, seed: int | None = None) -> list[CampaignRecord]:
+        self.flush()
+        if hub_id is not None:
+            sql, params = "WHERE hub_id = ? ORDER BY position", (hub_id,)
+        elif seed is not None:
+            sql, params = "WHERE seed = ? ORDER BY timestamp, id", (int(seed),)
+        else:
+            sql, params = "ORDER BY timestamp, id", ()
+        rows = self._read(
+            "SELECT scenario_id, region_id, outcome, difficulty_descriptor, timestamp, notes "
+            f"FROM campaigns {sql}",
+            params,
+        )
+        return [
+            CampaignRecord(
+                scenario_id=UUID(scenario_id),
+                region_id=region_id,
+                outcome=outcome,
+                difficulty_descriptor=difficulty,
+                timestamp=int(timestamp),
+                notes=json.loads(notes),
+            )
+            for scenario_id, region_id, outcome, difficulty, timestamp, notes in rows
+        ]
+
+    # -- replay logs ----------------------------------------------------
+
+    def save_replay(self, session_id: str, log: ReplayLog) -> None:
+        blob = encode_replay(log)
+        first_tick = log.keyframes[0].tick if log.keyframes else 0
+        row = (session_id, int(log.seed), int(first_tick), int(log.last_tick), time.time(), blob)
+        self._submit(
+            lambda connection: connection.execute(
+                "INSERT INTO replays (session_id, seed, first_tick, last_tick, created, blob) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row,
+            )
+        )
+
+    def load_replay(self, session_id: str) -> ReplayLog | None:
+        """Return the most recently saved replay log for ``session_id``."""
+
+        self.flush()
+        rows = self._read(
+            "SELECT blob FROM replays WHERE session_id = ? ORDER BY id DESC LIMIT 1",
+            (session_id,),
+        )
+        if not rows:
+            return None
+        return decode_replay(rows[0][0])
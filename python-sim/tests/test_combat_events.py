@@ -0,0 +1,106 @@
+import io
+import json
+
+from game.simulations.assault.core.assault import resolve_assault
+from game.simulations.assault.core.defenses import Turret
+from game.simulations.assault.core.entities import Enemy
+from game.simulations.assault.core.enums import EnemyType, SectorType
+from game.simulations.assault.core.events import COMBAT_KINDS, NULL_SINK, JsonlSink, RingSink
+from game.simulations.assault.core.narration import redirect_narration, use_sink
+from game.simulations.assault.core.sectors import Sector
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.commands import wait
+
+
+def _sectors():
+    sector = Sector("GATE", SectorType.PERIPHERAL)
+    sector.defenses.append(Turret(damage=5))
+    sector.enemies.append(Enemy("Zealot A", EnemyType.ZEALOT, 8, 30, sector))
+    sector.enemies.append(Enemy("Holy Man", EnemyType.ZEALOT, 15, 12, sector))
+    return [sector]
+
+
+def test_console_sink_prints_legacy_lines(capsys) -> None:
+    resolve_assault(_sectors(), max_ticks=8)
+    out = capsys.readouterr().out.splitlines()
+
+    assert "Turret fires at Zealot A for 5.00 damage" in out
+    assert "Zealot A takes 5.0 damage (HP=3.0, Morale=27.5)" in out
+    assert "Zealot A is killed" in out
+    assert "Holy Man flees from GATE" in out
+    assert " - Holy Man: HP=15, Morale=12 [ALIVE]" in out
+
+
+def test_sinks_receive_the_same_events_as_text(capsys) -> None:
+    lines = []
+    with redirect_narration(lines.append):
+        legacy = resolve_assault(_sectors(), max_ticks=8)
+    ring = RingSink(kinds=COMBAT_KINDS)
+    stream = io.StringIO()
+    jsonl = JsonlSink(stream)
+    with use_sink(ring):
+        assert resolve_assault(_sectors(), max_ticks=8) == legacy
+    with use_sink(jsonl):
+        resolve_assault(_sectors(), max_ticks=8)
+
+    combat_lines = [line for line in lines if not line.startswith((" - ", "Sector: ", "\n--- TICK"))]
+    assert ring.lines() == combat_lines
+    records = [json.loads(row) for row in stream.getvalue().splitlines()]
+    combat_records = [record for record in records if record["kind"] in COMBAT_KINDS]
+    assert [record["kind"] for record in combat_records] == [event.kind for event in ring.events]
+    assert combat_records[-1] == {"target": "Holy Man", "sector": "GATE", "kind": "flee"}
+    assert records[0] == {"message": "\n--- TICK 0 ---", "kind": "text"}
+    assert capsys.readouterr().out == ""
+
+
+def test_null_sink_skips_building_events(monkeypatch, capsys) -> None:
+    def _boom(*_args, **_kwargs):
+        raise AssertionError("events must not be built for a disabled sink")
+
+    monkeypatch.setattr("game.simulations.assault.core.entities.DamageEvent", _boom)
+    monkeypatch.setattr("game.simulations.assault.core.defenses.ShotEvent", _boom)
+    monkeypatch.setattr("game.simulations.assault.core.assault.RosterEvent", _boom)
+    with use_sink(NULL_SINK):
+        summary = resolve_assault(_sectors(), max_ticks=8)
+
+    assert summary["killed"] == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_wait_renders_combat_log_only_with_dev_trace(monkeypatch) -> None:
+    def _combat_step(state):
+        state.time += 1
+        log_sink = state.clock.combat_sink(state)
+        with use_sink(log_sink):
+            resolve_assault(_sectors(), max_ticks=1)
+        return False
+
+    monkeypatch.setattr(wait, "step_world", _combat_step)
+
+    quiet = GameState(seed=1)
+    quiet.clock = SimulationClock(headless=True)
+    quiet.dev_mode = True
+    assert not any(line.startswith("[COMBAT]") for line in wait._advance_tick(quiet).debug_lines)
+    assert quiet.combat_log is None
+
+    traced = GameState(seed=1)
+    traced.clock = SimulationClock(headless=True)
+    traced.dev_mode = True
+    traced.dev_trace = True
+    debug_lines = wait._advance_tick(traced).debug_lines
+    assert "[COMBAT] Turret fires at Zealot A for 5.00 damage" in debug_lines
+    assert not traced.combat_log.events
+
+
+def test_dev_trace_and_tactical_recording_both_receive_events() -> None:
+    state = GameState(seed=1)
+    state.clock = SimulationClock(headless=True, record_tactical=True)
+    state.dev_trace = True
+
+    with use_sink(state.clock.combat_sink(state)):
+        resolve_assault(_sectors(), max_ticks=1)
+
+    tactical = [record.text for record in state.clock.drain("tactical")]
+    assert "Turret fires at Zealot A for 5.00 damage" in tactical
+    assert "Turret fires at Zealot A for 5.00 damage" in state.combat_log.lines()
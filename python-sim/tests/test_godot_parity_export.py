@@ -1,9 +1,11 @@
 from __future__ import annotations
 import json, sys, tempfile, unittest
+from unittest import mock
 from pathlib import Path
 ROOT=Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
-from tools.export_godot_parity_fixtures import export
+import tools.export_godot_parity_fixtures as exporter
+from tools.export_godot_parity_fixtures import MANIFEST_NAME, export, export_matrix
 from tools.world_parity_contract import sha256
 
 class GodotParityExportTests(unittest.TestCase):
@@ -16,5 +18,18 @@ class GodotParityExportTests(unittest.TestCase):
     def test_seeds_are_explicitly_distinct(self):
         with tempfile.TemporaryDirectory() as directory:
             root=Path(directory); a=json.loads(export(1,[0],root/"a")[0].read_text()); b=json.loads(export(2,[0],root/"b")[0].read_text()); self.assertNotEqual(a["projection"]["seed"],b["projection"]["seed"])
+    def test_matrix_matches_export_and_skips_unchanged_jobs(self):
+        scripts={"default": exporter.DEFAULT_COMMANDS, "rich": [{"at_world_tick": 0, "sequence": 1, "kind": "add_materials", "payload": {"amount": 25}}]}
+        with tempfile.TemporaryDirectory() as directory:
+            root=Path(directory); legacy=root/"legacy"; matrix=root/"matrix"; export(1,[0,10],legacy); export(2,[0,10],legacy)
+            first=export_matrix([1,2],[0,10],matrix,scripts,workers=2)
+            self.assertEqual((first.jobs,first.rendered,first.written),(4,4,8))
+            self.assertEqual([(p.name,p.read_bytes()) for p in sorted(legacy.iterdir())],[(p.name,p.read_bytes()) for p in sorted(matrix.glob("*.json"))])
+            rich=json.loads((matrix/"rich"/"seed_000001_tick_010.json").read_text()); self.assertEqual(rich["commands"],scripts["rich"]); self.assertNotIn(".json",MANIFEST_NAME)
+            again=export_matrix([1,2],[0,10],matrix,scripts); self.assertEqual((again.rendered,again.skipped,again.written),(0,4,0))
+            tampered=matrix/"seed_000002_tick_010.json"; original=tampered.read_bytes(); tampered.write_text("{}"); (matrix/"seed_000009_tick_000.json").write_text("{}")
+            repaired=export_matrix([1,2],[0,10],matrix,scripts); self.assertEqual((repaired.rendered,repaired.written,repaired.unchanged,repaired.removed),(1,1,1,1)); self.assertEqual(tampered.read_bytes(),original)
+            with mock.patch.object(exporter,"sim_code_hash",return_value="changed"): rebuilt=export_matrix([1,2],[0,10],matrix,scripts)
+            self.assertEqual((rebuilt.rendered,rebuilt.written,rebuilt.unchanged),(4,0,8))
 
 if __name__ == "__main__": unittest.main()
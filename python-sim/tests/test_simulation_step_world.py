@@ -1,9 +1,12 @@
 """Tests for the world-state step helper."""
 
 from game.simulations.world_state.core import simulation
+from game.simulations.world_state.core.assaults import start_assault
+from game.simulations.world_state.core.clock import SimulationClock
 from game.simulations.world_state.core.repairs import start_repair, tick_repairs
 from game.simulations.world_state.core.state import GameState
 from game.simulations.world_state.core.structures import StructureState
+from game.simulations.world_state.terminal.processor import process_command
 
 
 def test_step_world_advances_and_spawns_assaults_when_idle(monkeypatch) -> None:
@@ -221,3 +224,62 @@ def test_drone_focus_recovery_is_faster_than_remote() -> None:
 
     assert drone_state.sectors["DEFENSE GRID"].damage < remote_state.sectors["DEFENSE GRID"].damage
     assert drone_state.sectors["DEFENSE GRID"].alertness < remote_state.sectors["DEFENSE GRID"].alertness
+
+
+def test_headless_clock_skips_sleeps_and_stdout(monkeypatch, capsys) -> None:
+    state = GameState(seed=11)
+    state.ambient_threat = 6.0
+    clock = SimulationClock(headless=True, record_tactical=True)
+
+    def _no_sleep(_seconds):
+        raise AssertionError("headless clock must not sleep")
+
+    monkeypatch.setattr("game.simulations.world_state.core.clock.time.sleep", _no_sleep)
+    simulation.step_world(state, tick_delay=0.5, clock=clock)
+    start_assault(state)
+    for _ in range(40):
+        simulation.step_world(state, tick_delay=0.5)
+
+    assert state.clock is clock
+    assert capsys.readouterr().out == ""
+    channels = {record.channel for record in clock.records}
+    assert "assault" in channels
+    assert "tactical" in channels
+
+
+def test_headless_clock_drops_tactical_text_unless_tracing() -> None:
+    state = GameState(seed=11)
+    state.ambient_threat = 6.0
+    clock = SimulationClock(headless=True)
+    simulation.step_world(state, tick_delay=0.0, clock=clock)
+    start_assault(state)
+    for _ in range(40):
+        simulation.step_world(state, tick_delay=0.0)
+
+    assert "tactical" not in {record.channel for record in clock.records}
+    assert state.combat_log is None
+
+    traced = GameState(seed=11)
+    traced.ambient_threat = 6.0
+    traced.dev_trace = True
+    simulation.step_world(traced, tick_delay=0.0, clock=SimulationClock(headless=True))
+    start_assault(traced)
+    for _ in range(40):
+        simulation.step_world(traced, tick_delay=0.0)
+
+    assert {event.kind for event in traced.combat_log.events} <= {"shot", "damage", "kill", "flee"}
+    assert traced.combat_log.events
+
+
+def test_headless_wait_does_not_pause(monkeypatch) -> None:
+    state = GameState(seed=3)
+    state.clock = SimulationClock(headless=True)
+
+    def _no_sleep(_seconds):
+        raise AssertionError("headless WAIT must not sleep")
+
+    monkeypatch.setattr("game.simulations.world_state.core.clock.time.sleep", _no_sleep)
+    result = process_command(state, "WAIT 10X")
+
+    assert result.ok is True
+    assert state.time == 50
@@ -0,0 +1,125 @@
+import random
+
+from game.simulations.assault.core.assault import resolve_assault
+from game.simulations.assault.core.columns import EnemyColumns, resolve_assault_columnar
+from game.simulations.assault.core.defenses import Turret
+from game.simulations.assault.core.entities import Enemy
+from game.simulations.assault.core.enums import EnemyType, SectorType
+from game.simulations.assault.core.narration import redirect_narration
+from game.simulations.assault.core.sectors import Sector
+
+
+class _Waves:
+    """Minimal assault instance: fixed spawns per tick plus defense settings."""
+
+    def __init__(self, seed, duration_ticks):
+        self.duration_ticks = duration_ticks
+        self.defense_doctrine = random.Random(seed).choice(["BALANCED", "AGGRESSIVE", "SENSOR_PRIORITY"])
+        self.defense_allocation = {"COMMAND": 1.3, "POWER": 0.7, "SENSORS": 1.0, "PERIMETER": 0.9}
+        self._seed = seed
+
+    def spawn_at_tick(self, tick, sector_lookup):
+        rng = random.Random(self._seed * 100 + tick)
+        spawned = 0
+        for name in sorted(sector_lookup):
+            sector = sector_lookup[name]
+            for index in range(rng.randint(0, 4)):
+                enemy_type = rng.choice(list(EnemyType))
+                enemy = Enemy(f"{name}-W{tick}-{index}", enemy_type, rng.randint(3, 20), rng.randint(4, 25), sector)
+                sector.enemies.append(enemy)
+                spawned += 1
+        return spawned
+
+
+def _sectors(seed):
+    rng = random.Random(seed)
+    sectors = []
+    for name in ("COMMAND", "POWER", "COMMS", "ARCHIVE"):
+        sector = Sector(name, SectorType.PERIPHERAL)
+        for _ in range(rng.randint(0, 3)):
+            output = rng.choice([0.0, 0.15, 0.5, 1.0])
+            sector.defenses.append(Turret(damage=rng.choice([3, 5, 8]), effective_output=output))
+        for index in range(rng.randint(0, 30)):
+            enemy_type = rng.choice(list(EnemyType))
+            enemy = Enemy(f"{name}-{index}", enemy_type, rng.randint(1, 25), rng.randint(2, 30), sector)
+            enemy.alive = rng.random() > 0.05
+            sector.enemies.append(enemy)
+        sectors.append(sector)
+    return sectors
+
+
+def _run(engine, seed, with_waves):
+    sectors = _sectors(seed)
+    lines = []
+    waves = _Waves(seed, duration_ticks=12) if with_waves else None
+    with redirect_narration(lines.append):
+        summary = engine(sectors, assault_instance=waves, max_ticks=8)
+    rosters = [[(e.name, e.type, e.hp, e.morale, e.alive) for e in sector.enemies] for sector in sectors]
+    cooldowns = [[turret.cooldown for turret in sector.defenses] for sector in sectors]
+    return summary, lines, rosters, cooldowns
+
+
+def test_columnar_engine_matches_object_engine() -> None:
+    for seed in range(60):
+        with_waves = seed % 2 == 0
+        assert _run(resolve_assault_columnar, seed, with_waves) == _run(resolve_assault, seed, with_waves)
+
+
+def test_roster_narration_can_be_skipped() -> None:
+    for engine in (resolve_assault, resolve_assault_columnar):
+        sectors = _sectors(3)
+        lines = []
+        with redirect_narration(lines.append):
+            quiet = engine(sectors, max_ticks=8, narrate_roster=False)
+        assert quiet == _run(resolve_assault, 3, False)[0]
+        assert not any(line.startswith(" - ") or line.startswith("Sector: ") for line in lines)
+
+
+def test_columnar_engine_writes_final_values_into_source_enemies() -> None:
+    finals = []
+    for engine in (resolve_assault, resolve_assault_columnar):
+        sectors = _sectors(5)
+        originals = [enemy for sector in sectors for enemy in sector.enemies]
+        with redirect_narration(lambda text: None):
+            engine(sectors, max_ticks=8)
+        assert all(enemy in originals for sector in sectors for enemy in sector.enemies)
+        finals.append([(enemy.hp, enemy.morale, enemy.alive) for enemy in originals])
+
+    # Enemies swept out mid-run keep the values they were removed with.
+    assert finals[0] == finals[1]
+
+
+def test_on_tick_writes_through_roster_iteration() -> None:
+    def rout(columnar, tick):
+        if tick == 0:
+            for sector in columnar:
+                for enemy in sector.enemies:
+                    enemy.morale = 0
+
+    results = []
+    for engine in (resolve_assault, resolve_assault_columnar):
+        sectors = _sectors(2)
+        with redirect_narration(lambda text: None):
+            summary = engine(sectors, max_ticks=3, on_tick=rout)
+        results.append((summary, [len(sector.enemies) for sector in sectors]))
+    assert results[0] == results[1]
+    assert results[1][1] == [0, 0, 0, 0]
+
+
+def test_front_removals_advance_head_without_rebuilding() -> None:
+    columns = EnemyColumns("GATE")
+    for index in range(10):
+        columns.append(Enemy(f"E{index}", EnemyType.RAIDER, 5, 30, None))
+    columns.sweep({"killed": 0, "retreated": 0})
+    names = columns.names
+    summary = {"killed": 0, "retreated": 0}
+    with redirect_narration(lambda text: None):
+        columns.take_damage(columns.first_alive(), 10)
+        columns.take_damage(columns.first_alive(), 10)
+    columns.sweep(summary)
+
+    assert summary == {"killed": 2, "retreated": 0}
+    assert columns.names is names
+    assert columns.head == 2
+    assert len(columns) == 8
+    assert columns.first_alive() == 2
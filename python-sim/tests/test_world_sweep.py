@@ -0,0 +1,41 @@
+"""Tests for the seed-sweep Monte Carlo runner."""
+
+import json
+
+from game.simulations.world_state.core.sweep import (
+    percentile,
+    percentile_table,
+    run_campaign,
+    run_sweep,
+)
+
+
+def test_run_campaign_is_deterministic_per_seed() -> None:
+    first = run_campaign(5, max_ticks=150)
+    second = run_campaign(5, max_ticks=150)
+
+    assert first == second
+    assert first.ticks <= 150
+    assert first.peak_ambient_threat > 0.0
+
+
+def test_sweep_results_do_not_depend_on_worker_count(tmp_path) -> None:
+    serial_path = tmp_path / "serial.jsonl"
+    pooled_path = tmp_path / "pooled.jsonl"
+
+    serial = run_sweep(range(4), max_ticks=120, workers=1, output=serial_path)
+    pooled = run_sweep(range(4), max_ticks=120, workers=2, output=pooled_path)
+
+    assert serial == pooled
+    assert serial_path.read_bytes() == pooled_path.read_bytes()
+    rows = [json.loads(line) for line in serial_path.read_text().splitlines()]
+    assert [row["seed"] for row in rows] == [0, 1, 2, 3]
+
+
+def test_percentile_table_reports_metrics() -> None:
+    summaries = run_sweep(range(3), max_ticks=60, workers=1)
+    lines = percentile_table(summaries)
+
+    assert lines[0].startswith("RUNS: 3")
+    assert any(line.startswith("assault_count") for line in lines)
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
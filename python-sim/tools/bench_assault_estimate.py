@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Time analytic assault previews and measure their error against the full resolver."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.simulations.world_state.core.assault_estimate import estimate_assault_outcome
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.simulation import step_world
+from game.simulations.world_state.core.state import GameState
+
+
+def _pending_state(seed: int, max_ticks: int) -> GameState | None:
+    """Step a fresh world until an assault approaches or runs."""
+
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    for _ in range(max_ticks):
+        if state.assaults or state.current_assault is not None:
+            return state
+        if state.is_failed:
+            return None
+        step_world(state)
+    return None
+
+
+def _time_us(state: GameState, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        estimate_assault_outcome(state)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seeds", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=4, help="Forked futures per seed for the error bound.")
+    parser.add_argument("--repeat", type=int, default=500, help="Analytic estimates timed per seed.")
+    parser.add_argument("--max-ticks", type=int, default=400)
+    args = parser.parse_args()
+
+    print(f"{'seed':>5} {'targets':<24} {'kill':>6} {'rout':>6} {'breach':>7} {'us':>8} {'sample ms':>10} {'error':>6}")
+    worst = 0.0
+    timings = []
+    for seed in range(args.seeds):
+        state = _pending_state(seed, args.max_ticks)
+        if state is None:
+            continue
+        micros = _time_us(state, args.repeat)
+        start = time.perf_counter()
+        estimate = estimate_assault_outcome(state, samples=args.samples)
+        sampled_ms = (time.perf_counter() - start) * 1e3
+        timings.append(micros)
+        worst = max(worst, estimate.error or 0.0)
+        print(
+            f"{seed:>5} {'/'.join(estimate.targets):<24} {estimate.killed:>6.2f} {estimate.retreated:>6.2f} "
+            f"{estimate.remaining:>7.2f} {micros:>8.1f} {sampled_ms:>10.1f} {estimate.error:>6.1f}"
+        )
+    if timings:
+        timings.sort()
+        print(f"median {timings[len(timings) // 2]:.1f} us per preview; worst error {worst:.1f} units")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
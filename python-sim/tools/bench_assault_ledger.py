@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Compare the columnar ledger ring with a trimmed record list at capacity."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.simulations.world_state.core.assault_ledger import AssaultLedger, AssaultTickRecord
+
+
+def _records(count: int) -> Iterator[AssaultTickRecord]:
+    sectors = ("CM", "PW", "AR", "FB", "CO")
+    for index in range(count):
+        yield AssaultTickRecord(
+            tick=index,
+            targeted_sector=sectors[index % len(sectors)],
+            target_weight=1.0 + index % 7,
+            assault_strength=2.5,
+            defense_mitigation=(index % 10) / 10,
+            note=f"T{index}" if index % 50 == 0 else None,
+        )
+
+
+def _trimmed_list(records: Iterator[AssaultTickRecord], capacity: int) -> list[AssaultTickRecord]:
+    """The previous ledger: append, then slice-delete back down to capacity."""
+
+    ticks: list[AssaultTickRecord] = []
+    for record in records:
+        ticks.append(record)
+        if len(ticks) > capacity:
+            del ticks[:-capacity]
+    return ticks
+
+
+def _ring(records: Iterator[AssaultTickRecord], capacity: int) -> AssaultLedger:
+    ledger = AssaultLedger(capacity=capacity)
+    for record in records:
+        ledger.append(record)
+    return ledger
+
+
+def _measure(fn, rows: int, capacity: int) -> tuple[float, float]:
+    """Best-of-three milliseconds, then KiB still held by the result."""
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn(_records(rows), capacity)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn(_records(rows), capacity)
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best * 1e3, retained / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--capacity", type=int, default=2000)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'list ms':>9} {'ring ms':>9} {'list KiB':>9} {'ring KiB':>9} {'window ms':>10}")
+    for rows in args.rows:
+        list_ms, list_kib = _measure(_trimmed_list, rows, args.capacity)
+        ring_ms, ring_kib = _measure(_ring, rows, args.capacity)
+        ledger = _ring(_records(rows), args.capacity)
+        start = time.perf_counter()
+        view = ledger.window(ledger.sequence - args.capacity // 4)
+        view.damage_by_sector()
+        view.mitigation_distribution()
+        window_ms = (time.perf_counter() - start) * 1e3
+        print(f"{rows:>8} {list_ms:>9.2f} {ring_ms:>9.2f} {list_kib:>9.1f} {ring_kib:>9.1f} {window_ms:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Microbenchmark terminal command tokenizing and dispatch overhead."""
+from __future__ import annotations
+
+import argparse
+import shlex
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.simulations.world_state.core.invariants import InvariantPolicy
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.parser import tokenize
+from game.simulations.world_state.terminal.processor import process_command
+
+# Read-only verbs, so every pass sees the same state and times dispatch rather
+# than simulation.
+SCRIPT = [
+    "HELP",
+    "STATUS",
+    "STATUS FAB",
+    "STATUS POLICY",
+    "POLICY SHOW",
+    "FAB QUEUE",
+    "SCAN RELAYS",
+    "nonesuch verb",
+    'DEPLOY "north gate" now',
+]
+
+
+def _per_call_us(fn, lines: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            fn(line)
+    return (time.perf_counter() - start) / (repeat * len(lines)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over the script for tokenizing.")
+    parser.add_argument("--commands", type=int, default=200, help="Passes over the script for dispatch.")
+    args = parser.parse_args()
+
+    shlex_us = _per_call_us(shlex.split, SCRIPT, args.repeat)
+    tokenize.cache_clear()
+    fast_us = _per_call_us(tokenize.__wrapped__, SCRIPT, args.repeat)
+    cached_us = _per_call_us(tokenize, SCRIPT, args.repeat)
+    print(f"tokenize  shlex.split {shlex_us:8.2f} us  fast path {fast_us:8.2f} us  cached {cached_us:8.2f} us")
+
+    state = GameState(seed=1)
+    state.invariants = InvariantPolicy(level="off")
+    dispatch_us = _per_call_us(lambda line: process_command(state, line), SCRIPT, args.commands)
+    print(f"dispatch  process_command {dispatch_us:8.2f} us/command over {len(SCRIPT)} verbs")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
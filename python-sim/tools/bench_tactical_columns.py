@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Head-to-head benchmark of the object and columnar tactical engines."""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.simulations.assault.core.assault import resolve_assault
+from game.simulations.assault.core.columns import resolve_assault_columnar
+from game.simulations.assault.core.defenses import Turret
+from game.simulations.assault.core.entities import Enemy
+from game.simulations.assault.core.enums import EnemyType, SectorType
+from game.simulations.assault.core.narration import redirect_narration
+from game.simulations.assault.core.sectors import Sector
+
+SECTOR_NAMES = ("COMMAND", "POWER", "COMMS", "ARCHIVE")
+
+
+def build_sectors(enemy_count: int, seed: int) -> list[Sector]:
+    """Spread ``enemy_count`` enemies over four sectors with two turrets each.
+
+    A fifth of the roster starts at or below the retreat line, so every
+    engine also pays for mass retreats.
+    """
+
+    rng = random.Random(seed)
+    sectors = []
+    for name in SECTOR_NAMES:
+        sector = Sector(name, SectorType.PERIPHERAL)
+        sector.defenses.extend(Turret(damage=5, effective_output=rng.uniform(0.6, 1.0)) for _ in range(2))
+        sectors.append(sector)
+    types = list(EnemyType)
+    for index in range(enemy_count):
+        sector = sectors[index % len(sectors)]
+        morale = rng.randint(5, 10) if rng.random() < 0.2 else rng.randint(12, 30)
+        sector.enemies.append(Enemy(f"E{index}", rng.choice(types), rng.randint(8, 24), morale, sector))
+    return sectors
+
+
+def _time(engine, enemy_count: int, repeat: int, **kwargs) -> float:
+    best = float("inf")
+    for attempt in range(repeat):
+        sectors = build_sectors(enemy_count, seed=attempt)
+        start = time.perf_counter()
+        with redirect_narration(lambda text: None):
+            engine(sectors, max_ticks=10, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size; the best is reported.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    # Both engines run the same narration in each pair of columns.
+    print(f"{'':>8} {'roster narrated':^25} {'roster skipped':^25}")
+    print(f"{'enemies':>8} {'objects ms':>12} {'columns ms':>12} {'objects ms':>12} {'columns ms':>12}")
+    for size in args.sizes:
+        timings = [
+            _time(engine, size, args.repeat, narrate_roster=narrate_roster)
+            for narrate_roster in (True, False)
+            for engine in (resolve_assault, resolve_assault_columnar)
+        ]
+        print(f"{size:>8} " + " ".join(f"{timing:>12.2f}" for timing in timings))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark WorldStore state saves and loads against a scratch database."""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.simulations.world_state.core.clock import SimulationClock
+from game.simulations.world_state.core.state import GameState
+from game.simulations.world_state.terminal.processor import process_command
+from game.simulations.world_state.world_store import WorldStore
+
+
+def _played_state(seed: int) -> GameState:
+    state = GameState(seed=seed)
+    state.clock = SimulationClock(headless=True)
+    process_command(state, "FORTIFY PW 1")
+    process_command(state, "WAIT 5X")
+    return state
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200, help="Save/load rounds to time.")
+    parser.add_argument("--seed", type=int, default=4)
+    args = parser.parse_args()
+
+    state = _played_state(args.seed)
+    saves, flushes, loads = [], [], []
+    with tempfile.TemporaryDirectory() as scratch:
+        with WorldStore(Path(scratch) / "world.db") as store:
+            store.save_state("warm", state)
+            store.flush()
+            for index in range(args.repeat):
+                session_id = f"s{index % 16}"
+                start = time.perf_counter()
+                store.save_state(session_id, state)
+                saved = time.perf_counter()
+                store.flush()
+                flushed = time.perf_counter()
+                store.load_state(session_id)
+                loaded = time.perf_counter()
+                saves.append(saved - start)
+                flushes.append(flushed - saved)
+                loads.append(loaded - flushed)
+
+    for label, samples in (("save_state", saves), ("flush", flushes), ("load_state", loads)):
+        ordered = sorted(samples)
+        p95 = ordered[int(len(ordered) * 0.95) - 1]
+        print(f"{label:<10} median {statistics.median(samples) * 1e3:7.3f} ms  p95 {p95 * 1e3:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
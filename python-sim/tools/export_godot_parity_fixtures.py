@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Generate deterministic offline Python fixtures for the Godot port."""
 from __future__ import annotations
-import argparse, json, sys
+import argparse, hashlib, json, sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path: sys.path.insert(0, str(ROOT))
+from game.simulations.world_state.core.clock import SimulationClock
 from game.simulations.world_state.core.simulation import step_world
 from game.simulations.world_state.core.state import GameState
 from tools.world_parity_contract import FIXTURE_SCHEMA, COMMANDS_SCHEMA, apply_command, projection, sha256
@@ -13,23 +16,127 @@ DEFAULT_COMMANDS = [
     {"at_world_tick": 0, "sequence": 1, "kind": "set_policy", "payload": {"repair_intensity": 3, "defense_readiness": 2, "surveillance_coverage": 2}},
     *[{"at_world_tick": 0, "sequence": index + 2, "kind": "set_fabrication_allocation", "payload": {"category": category, "level": 0}} for index, category in enumerate(("DEFENSE", "DRONES", "REPAIRS", "ARCHIVE"))],
 ]
+DEFAULT_SCRIPT = "default"
+# Incremental state lives beside the fixtures; it is not *.json, so fixture globs skip it.
+MANIFEST_NAME = ".parity-manifest"
+# Everything a fixture's bytes can depend on besides its seed, script and checkpoints.
+SIM_SOURCES = (ROOT / "game", ROOT / "tools" / "world_parity_contract.py", Path(__file__).resolve())
 
-def export(seed: int, checkpoints: list[int], output: Path, commands: list[dict] | None = None) -> list[Path]:
-    output.mkdir(parents=True, exist_ok=True); commands = commands or DEFAULT_COMMANDS; state = GameState(seed=seed); paths=[]
+def fixture_name(seed: int, tick: int, script: str = DEFAULT_SCRIPT) -> str:
+    """Path relative to the output root; named scripts get their own subdirectory."""
+    name = f"seed_{seed:06d}_tick_{tick:03d}.json"
+    return name if script == DEFAULT_SCRIPT else f"{script}/{name}"
+
+def render(seed: int, checkpoints: list[int], commands: list[dict] | None = None) -> list[tuple[int, bytes]]:
+    """Run one seed once and return the fixture bytes for every checkpoint."""
+    commands = commands or DEFAULT_COMMANDS; checkpoints = sorted(set(checkpoints)); wanted = set(checkpoints); rendered = []
+    state = GameState(seed=seed); state.clock = SimulationClock(headless=True, sink_limit=1)
     by_tick: dict[int, list[dict]] = {}
     for command in sorted(commands, key=lambda c: int(c["sequence"])): by_tick.setdefault(int(command["at_world_tick"]), []).append(command)
-    for tick in range(0, max(checkpoints) + 1):
+    for tick in range(0, checkpoints[-1] + 1):
         for command in by_tick.get(tick, []): apply_command(state, command)
-        if tick in checkpoints:
+        if tick in wanted:
             port_projection = projection(state)
-            payload = {"fixture_schema": FIXTURE_SCHEMA, "seed": seed, "checkpoint_world_tick": tick, "commands_schema": COMMANDS_SCHEMA, "commands": commands, "projection": port_projection, "projection_sha256": sha256(port_projection)}
-            path = output / f"seed_{seed:06d}_tick_{tick:03d}.json"; path.write_text(json.dumps(payload, indent=2, sort_keys=True)+"\n", encoding="utf-8"); paths.append(path)
-        if tick < max(checkpoints): step_world(state, tick_delay=0.0)
+            payload = {"fixture_schema": FIXTURE_SCHEMA, "seed": seed, "checkpoint_world_tick": tick, "commands_schema": COMMANDS_SCHEMA, "commands": commands, "projection": port_projection, "projection_sha256": sha256(port_projection, normalized=True)}
+            rendered.append((tick, (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")))
+        if tick < checkpoints[-1]: step_world(state, tick_delay=0.0)
+    return rendered
+
+def export(seed: int, checkpoints: list[int], output: Path, commands: list[dict] | None = None) -> list[Path]:
+    output.mkdir(parents=True, exist_ok=True); paths = []
+    for tick, raw in render(seed, checkpoints, commands):
+        path = output / fixture_name(seed, tick); path.write_bytes(raw); paths.append(path)
     return paths
 
+def sim_code_hash(sources: tuple[Path, ...] = SIM_SOURCES) -> str:
+    """Hash of every simulation source file; any core change invalidates all fixtures."""
+    digest = hashlib.sha256()
+    for source in sources:
+        files = [source] if source.is_file() else sorted(p for p in source.rglob("*.py") if "tests" not in p.parts)
+        for path in files:
+            digest.update(path.relative_to(ROOT).as_posix().encode("utf-8") + b"\0"); digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+def job_key(seed: int, commands: list[dict], checkpoints: list[int], code_hash: str) -> str:
+    return sha256({"fixture_schema": FIXTURE_SCHEMA, "seed": seed, "commands": commands, "checkpoints": sorted(set(checkpoints)), "code": code_hash})
+
+@dataclass(frozen=True)
+class MatrixReport:
+    jobs: int
+    rendered: int
+    skipped: int
+    written: int
+    unchanged: int
+    removed: int
+
+def _render_job(job: tuple[str, int, list[dict], list[int]]) -> tuple[str, int, list[tuple[str, bytes]]]:
+    script, seed, commands, checkpoints = job
+    return script, seed, [(fixture_name(seed, tick, script), raw) for tick, raw in render(seed, checkpoints, commands)]
+
+def _load_manifest(output: Path) -> dict:
+    try: manifest = json.loads((output / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError): return {}
+    return manifest.get("jobs", {}) if isinstance(manifest, dict) else {}
+
+def _digest(raw: bytes) -> str: return hashlib.sha256(raw).hexdigest()
+
+def _intact(output: Path, files: dict[str, str]) -> bool:
+    for name, digest in files.items():
+        try: raw = (output / name).read_bytes()
+        except OSError: return False
+        if _digest(raw) != digest: return False
+    return bool(files)
+
+def export_matrix(seeds: list[int], checkpoints: list[int], output: Path, scripts: dict[str, list[dict]] | None = None, *, workers: int = 1, incremental: bool = True, prune: bool = True) -> MatrixReport:
+    """Export seeds x command scripts x checkpoints, one process-pool job per (script, seed).
+
+    Fixtures are content-addressed: files whose bytes would not change are left
+    untouched. With ``incremental`` a job is skipped outright when its seed,
+    script, checkpoints and the simulation source hash match the manifest and
+    its files are intact.
+    """
+    scripts = scripts or {DEFAULT_SCRIPT: DEFAULT_COMMANDS}; checkpoints = sorted(set(checkpoints)); output.mkdir(parents=True, exist_ok=True)
+    code_hash = sim_code_hash(); previous = _load_manifest(output) if incremental else {}; manifest: dict[str, dict] = {}; pending = []
+    for script in sorted(scripts):
+        for seed in sorted(set(seeds)):
+            job_id = f"{script}/{seed:06d}"; key = job_key(seed, scripts[script], checkpoints, code_hash); entry = previous.get(job_id)
+            if entry and entry.get("key") == key and _intact(output, entry.get("files", {})): manifest[job_id] = entry; continue
+            manifest[job_id] = {"key": key, "files": {}}; pending.append((script, seed, scripts[script], checkpoints))
+    workers = max(1, min(int(workers), len(pending) or 1))
+    if workers == 1: results = map(_render_job, pending)
+    else: executor = ProcessPoolExecutor(max_workers=workers); results = executor.map(_render_job, pending)
+    written = unchanged = 0
+    try:
+        for script, seed, files in results:
+            entry = manifest[f"{script}/{seed:06d}"]
+            for name, raw in files:
+                path = output / name; entry["files"][name] = _digest(raw)
+                try: current = path.read_bytes()
+                except OSError: current = None
+                if current == raw: unchanged += 1; continue
+                path.parent.mkdir(parents=True, exist_ok=True); temp = path.with_suffix(".tmp"); temp.write_bytes(raw); temp.replace(path); written += 1
+    finally:
+        if workers > 1: executor.shutdown()
+    removed = 0
+    if prune:
+        expected = {name for entry in manifest.values() for name in entry["files"]}; script_dirs = [output] + [output / s for s in scripts if s != DEFAULT_SCRIPT]
+        for directory in script_dirs:
+            for stale in sorted(directory.glob("seed_*_tick_*.json")):
+                if stale.relative_to(output).as_posix() not in expected: stale.unlink(); removed += 1
+    (output / MANIFEST_NAME).write_text(json.dumps({"code": code_hash, "jobs": manifest}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return MatrixReport(jobs=len(manifest), rendered=len(pending), skipped=len(manifest) - len(pending), written=written, unchanged=unchanged, removed=removed)
+
+def _load_scripts(paths: list[Path] | None) -> dict[str, list[dict]] | None:
+    if not paths: return None
+    scripts = {DEFAULT_SCRIPT: DEFAULT_COMMANDS}
+    for path in paths: scripts[path.stem] = json.loads(path.read_text(encoding="utf-8"))
+    return scripts
+
 def main() -> int:
-    parser=argparse.ArgumentParser(); parser.add_argument("--seed", type=int, action="append"); parser.add_argument("--ticks", type=int, nargs="+", default=[0,1,10,100]); parser.add_argument("--output", type=Path, default=ROOT.parent/"custodian/tools/validation/fixtures/world_simulation"); args=parser.parse_args()
-    for stale in args.output.glob("*.json") if args.output.exists() else []: stale.unlink()
-    for seed in args.seed or [1,2]: export(seed, sorted(set(args.ticks)), args.output)
+    parser=argparse.ArgumentParser(); parser.add_argument("--seed", type=int, action="append"); parser.add_argument("--ticks", type=int, nargs="+", default=[0,1,10,100]); parser.add_argument("--output", type=Path, default=ROOT.parent/"custodian/tools/validation/fixtures/world_simulation")
+    parser.add_argument("--script", type=Path, action="append", help="JSON command list; exported alongside the default script under <output>/<stem>/."); parser.add_argument("--workers", type=int, default=1); parser.add_argument("--full", action="store_true", help="Re-render every job even when the manifest says it is current.")
+    args=parser.parse_args()
+    report = export_matrix(args.seed or [1,2], args.ticks, args.output, _load_scripts(args.script), workers=args.workers, incremental=not args.full)
+    print(f"parity fixtures: {report.jobs} jobs, {report.rendered} rendered, {report.skipped} skipped; {report.written} written, {report.unchanged} unchanged, {report.removed} removed")
     return 0
 if __name__ == "__main__": raise SystemExit(main())
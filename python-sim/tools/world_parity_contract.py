@@ -16,11 +16,12 @@ def normalize(value: Any) -> Any:
         return int(rounded) if rounded.is_integer() else rounded
     return value
 
-def encode(value: Any) -> str:
-    return json.dumps(normalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+def encode(value: Any, *, normalized: bool = False) -> str:
+    """Canonical JSON; pass ``normalized=True`` for values that already went through ``normalize``."""
+    return json.dumps(value if normalized else normalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
-def sha256(value: Any) -> str:
-    return hashlib.sha256(encode(value).encode("utf-8")).hexdigest()
+def sha256(value: Any, *, normalized: bool = False) -> str:
+    return hashlib.sha256(encode(value, normalized=normalized).encode("utf-8")).hexdigest()
 
 def projection(state) -> dict[str, Any]:
     return normalize({